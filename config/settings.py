@@ -15,6 +15,7 @@ class ModelConfig:
     temperature: float = float(os.getenv("PULSUS_TEMPERATURE", "0.2"))
     max_tokens: int = int(os.getenv("PULSUS_MAX_TOKENS", "30720")) 
     timeout: int = int(os.getenv("PULSUS_TIMEOUT", "60"))  # seconds
+    concurrency: int = int(os.getenv("PULSUS_CONCURRENCY", "4"))  # parallel requests
 
 @dataclass
 class RankerConfig:
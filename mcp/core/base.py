@@ -5,7 +5,7 @@ Provides the foundational MCPResponse and MCPBase classes for all MCP operations
 These classes establish a standardized interface for Model Context Protocol operations.
 """
 
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, asdict, replace
 from typing import Any, Dict, List, Optional, Callable
 from datetime import datetime
 from enum import Enum
@@ -64,6 +64,23 @@ class MCPResponse:
         result['status'] = self.status.value
         return result
 
+    def clone(self) -> "MCPResponse":
+        """
+        Create a copy of the response that can be mutated independently.
+
+        Context, trace and metadata containers are copied; data is shared,
+        so callers must treat it as read-only (e.g. cached results).
+
+        Returns:
+            New MCPResponse with the same content
+        """
+        return replace(
+            self,
+            context=dict(self.context),
+            trace=list(self.trace),
+            metadata=dict(self.metadata)
+        )
+
     def add_trace(self, message: str) -> None:
         """
         Add a trace message to the execution trace.
@@ -6,6 +6,7 @@ Integrates with Pulsus UI for user confirmations and logging.
 """
 
 import functools
+from collections import OrderedDict
 from typing import Callable, Optional, Any
 from .policy import SafetyLevel, ExecutionMode, get_safety_policy
 from .base import MCPResponse
@@ -371,7 +372,8 @@ def transactional(func: Callable = None, *, rollback_handler: Optional[Callable]
         return decorator
 
 
-def cached(ttl: int = 300):
+def cached(ttl: int = 300, maxsize: Optional[int] = None,
+           version: Optional[Callable[..., Any]] = None):
     """
     Mark operation as cached (results cached for TTL seconds).
 
@@ -383,18 +385,25 @@ def cached(ttl: int = 300):
 
     Args:
         ttl: Cache time-to-live in seconds (default: 300 = 5 minutes)
+        maxsize: Optional bound on cached results; the least recently
+            used entry is evicted when full (default: unbounded)
+        version: Optional callable taking the operation's arguments whose
+            result is added to the cache key (e.g. a file's mtime), so
+            results for changed inputs miss instead of going stale
+
+    The wrapper exposes ``cache_clear()`` to drop all cached results.
 
     Example:
         >>> class MyHelper(MCPBase):
         ...     @read_only
-        ...     @cached(ttl=600)  # 10 minutes
+        ...     @cached(ttl=600, maxsize=64)  # 10 minutes, 64 results
         ...     def query_catalog(self, type_filter: str) -> MCPResponse:
         ...         # Expensive operation
         ...         return MCPResponse.success_response(data=results)
     """
     def decorator(func: Callable) -> Callable:
-        # Simple in-memory cache
-        cache = {}
+        # Simple in-memory LRU cache
+        cache = OrderedDict()
         import time
 
         @functools.wraps(func)
@@ -412,6 +421,8 @@ def cached(ttl: int = 300):
 
             # Create cache key from arguments
             cache_key = _create_cache_key(operation, args, kwargs)
+            if version is not None:
+                cache_key = f"{cache_key}:{version(*args, **kwargs)}"
             current_time = time.time()
 
             # Check cache
@@ -419,10 +430,12 @@ def cached(ttl: int = 300):
                 cached_result, cached_time = cache[cache_key]
                 if current_time - cached_time < ttl:
                     # Cache hit
+                    cache.move_to_end(cache_key)
                     cached_result.context['cached'] = True
                     cached_result.context['cache_age'] = int(current_time - cached_time)
                     cached_result.add_trace(f"Returned from cache (age: {int(current_time - cached_time)}s)")
                     return cached_result
+                del cache[cache_key]
 
             # Cache miss - execute operation
             result = func(self, *args, **kwargs)
@@ -430,11 +443,15 @@ def cached(ttl: int = 300):
             # Store in cache
             if isinstance(result, MCPResponse) and result.success:
                 cache[cache_key] = (result, current_time)
+                if maxsize is not None and len(cache) > maxsize:
+                    cache.popitem(last=False)
                 result.context['cached'] = False
                 result.context['cache_ttl'] = ttl
 
             return result
 
+        wrapper.cache_clear = cache.clear
+
         # Mark with safety level metadata
         _mark_safety_level(wrapper, SafetyLevel.CACHED)
         return wrapper
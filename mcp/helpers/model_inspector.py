@@ -10,7 +10,14 @@ Provides MCP-compliant methods for:
 This is a template class that can be extended for specific platform implementations.
 """
 
-from typing import Dict, Any, List, Optional
+import functools
+import itertools
+import sys
+import time
+import types
+import weakref
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Callable, Hashable, Iterator
 
 # MCP Core Framework imports
 from agents.mcp.core import (
@@ -18,11 +25,358 @@ from agents.mcp.core import (
     MCPResponse,
     read_only,
     restricted_write,
-    cached,
     get_mcp_logger,
     get_safety_policy
 )
 
+# Optional dependencies
+try:
+    import numpy as np
+    _HAS_NUMPY = True
+except Exception:
+    _HAS_NUMPY = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    _HAS_PYARROW = True
+except Exception:
+    _HAS_PYARROW = False
+
+
+# Catalogs at least this large get a vectorized name search structure
+# (Arrow string array, or trigram bloom prefilter without pyarrow)
+_BLOOM_MIN_OBJECTS = 1000
+
+
+def _trigram_bloom(text: str) -> int:
+    """
+    Build a 64-bit bloom signature of the trigrams of a string.
+
+    A string can only contain another if every bit of the other's signature
+    is also set in its own, so signatures prune substring candidates with
+    bit operations alone. Strings shorter than 3 chars yield 0 (matches all).
+
+    Args:
+        text: Lowercase string
+
+    Returns:
+        Bloom signature as an int in [0, 2**64)
+    """
+    bloom = 0
+    for i in range(len(text) - 2):
+        bloom |= 1 << (hash(text[i:i + 3]) & 63)
+    return bloom
+
+
+# Geometry previews keep only the start of the WKT; low precision keeps
+# QGIS from formatting every coordinate at full (17 digit) precision
+_WKT_PREVIEW_CHARS = 100
+_WKT_PREVIEW_PRECISION = 2
+
+
+def _wkt_preview(geom: Any) -> str:
+    """
+    Serialize the first _WKT_PREVIEW_CHARS characters of a geometry's WKT.
+
+    Args:
+        geom: QgsGeometry object
+
+    Returns:
+        Truncated WKT string
+    """
+    try:
+        wkt = geom.asWkt(_WKT_PREVIEW_PRECISION)
+    except TypeError:
+        # Bindings without the precision argument
+        wkt = geom.asWkt()
+    return wkt[:_WKT_PREVIEW_CHARS]
+
+
+# Interned type names compared by identity in the property extractors
+_GK_SECTION = sys.intern('GKSection')
+_GK_NODE = sys.intern('GKNode')
+_QGS_VECTOR_LAYER = sys.intern('QgsVectorLayer')
+_QGS_FEATURE = sys.intern('QgsFeature')
+
+# Interned type name per class, filled on first encounter
+_TYPE_NAME_CACHE: Dict[type, str] = {}
+
+
+def _type_name(obj: Any) -> str:
+    """
+    Get the interned type name of an object.
+
+    Args:
+        obj: Any object
+
+    Returns:
+        Interned class name (identity-comparable with the module constants)
+    """
+    obj_type = type(obj)
+    name = _TYPE_NAME_CACHE.get(obj_type)
+    if name is None:
+        name = _TYPE_NAME_CACHE[obj_type] = sys.intern(obj_type.__name__)
+    return name
+
+
+# Zero-argument getter methods per class, as (property_key, function) pairs
+_GETTER_CACHE: Dict[type, tuple] = {}
+
+
+def _build_getter_list(cls: type) -> tuple:
+    """
+    Collect the zero-argument ``get*`` methods defined on a class.
+
+    Walks the class dictionaries along the MRO (excluding ``object``) so the
+    reflection runs once per class instead of a ``dir()`` scan per instance.
+    Subclass definitions shadow base ones, as with normal attribute lookup.
+
+    Args:
+        cls: Class to introspect
+
+    Returns:
+        Tuple of (property_key, function) pairs sorted by method name
+    """
+    getters = {}
+    seen = set()
+
+    for klass in cls.__mro__[:-1]:
+        for name, attr in vars(klass).items():
+            if name in seen or not name.startswith('get'):
+                continue
+            seen.add(name)
+            if isinstance(attr, types.FunctionType) and attr.__code__.co_argcount == 1:  # Only self
+                getters[name] = attr
+
+    return tuple(
+        (name.replace('get', '', 1).lower(), getters[name]) for name in sorted(getters)
+    )
+
+
+def _getters_for(obj: Any) -> tuple:
+    """
+    Get the cached getter list for an object's class, building it on first use.
+
+    Getters are not probed: whether one raises depends on the instance, so
+    callers keep their own per-call exception handling.
+
+    Args:
+        obj: Instance whose class getters are requested
+
+    Returns:
+        Tuple of (property_key, function) pairs
+    """
+    cls = type(obj)
+    getters = _GETTER_CACHE.get(cls)
+    if getters is None:
+        getters = _GETTER_CACHE[cls] = _build_getter_list(cls)
+    return getters
+
+
+# Methods exposing a catalog modification stamp (Aimsun, QGIS)
+_CATALOG_VERSION_METHODS = ('getModificationTime', 'lastModified')
+
+# Methods exposing the file a catalog was loaded from (Aimsun, QGIS)
+_CATALOG_IDENTITY_METHODS = ('getDocumentFileName', 'fileName')
+
+# Methods exposing a per-object modification stamp
+_OBJECT_VERSION_METHODS = ('getModificationStamp',)
+
+# Maximum number of get_object_properties results kept per inspector
+_PROPERTIES_CACHE_SIZE = 256
+
+# Maximum number of per-query name search structures kept per inspector
+_NAME_SEARCH_CACHE_SIZE = 128
+
+
+def _modification_stamp(obj: Any, method_names: tuple) -> Optional[str]:
+    """
+    Get a modification stamp for an object, if the platform exposes one.
+
+    Args:
+        obj: Catalog or model object
+        method_names: Candidate stamp methods, tried in order
+
+    Returns:
+        Version string, or None when the object has no modification stamp
+    """
+    for method_name in method_names:
+        method = getattr(obj, method_name, None)
+        if callable(method):
+            try:
+                return str(method())
+            except Exception:
+                return None
+    return None
+
+
+def _catalog_version(catalog: Any) -> Optional[str]:
+    """Get a catalog's modification stamp (see _modification_stamp)"""
+    return _modification_stamp(catalog, _CATALOG_VERSION_METHODS)
+
+
+def _catalog_identity(catalog: Any) -> tuple:
+    """
+    Get a stable identity for a catalog.
+
+    Catalogs backed by a file are identified by its path. Others fall back
+    to id(), which is only valid while the catalog is alive; the query cache
+    drops such entries when the catalog is garbage collected.
+
+    Args:
+        catalog: Catalog object
+
+    Returns:
+        ('path', file path) or ('id', id(catalog)) tuple
+    """
+    for method_name in _CATALOG_IDENTITY_METHODS:
+        method = getattr(catalog, method_name, None)
+        if callable(method):
+            try:
+                path = method()
+            except Exception:
+                break
+            if path:
+                return ('path', str(path))
+            break
+    return ('id', id(catalog))
+
+
+def _freeze_criteria(filter_criteria: Optional[Dict[str, Any]]) -> Hashable:
+    """Build a hashable, order-independent key from filter criteria"""
+    if not filter_criteria:
+        return None
+    try:
+        return frozenset(filter_criteria.items())
+    except TypeError:
+        # Unhashable filter values (lists, dicts)
+        return frozenset((key, repr(value)) for key, value in filter_criteria.items())
+
+
+def _catalog_query_key(platform: str, catalog: Any, object_type: Optional[str],
+                       filter_criteria: Optional[Dict[str, Any]]) -> tuple:
+    """
+    Build the cache key of a catalog query.
+
+    Args:
+        platform: Inspector platform
+        catalog: Catalog object
+        object_type: Optional type filter
+        filter_criteria: Optional filter dictionary
+
+    Returns:
+        (cache_key, version) tuple; version is None without a modification stamp
+    """
+    version = _catalog_version(catalog)
+    cache_key = (platform, _catalog_identity(catalog), version, object_type,
+                 _freeze_criteria(filter_criteria))
+    return cache_key, version
+
+
+def _catalog_cache(ttl: int = 60, maxsize: int = 128):
+    """
+    Cache catalog queries keyed on the catalog's identity and modification stamp.
+
+    Entries for catalogs exposing a modification stamp stay valid until the
+    stamp changes, at which point entries for older stamps of the same
+    catalog are dropped; catalogs without one fall back to TTL expiry. When
+    full, expired entries are swept before the least recently used entry is
+    evicted. Catalogs identified by id() are only cached while they can be
+    weakly referenced, so a recycled id never serves another catalog's
+    results. Hits return a clone so callers never mutate the stored response.
+
+    Args:
+        ttl: Time-to-live in seconds for catalogs without a modification stamp
+        maxsize: Maximum number of cached queries
+
+    Returns:
+        Decorator for query methods taking (catalog, object_type, filter_criteria)
+    """
+    def decorator(func: Callable) -> Callable:
+        cache: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        tracked = set()
+
+        def _evict(current_time: float) -> None:
+            """Drop expired entries first; evict the least recently used only if still full"""
+            expired = [
+                key for key, (_, cached_time) in cache.items()
+                if key[2] is None and current_time - cached_time >= ttl
+            ]
+            for key in expired:
+                del cache[key]
+            if len(cache) >= maxsize:
+                cache.popitem(last=False)
+
+        def _forget(identity: tuple) -> None:
+            """Drop every entry of a garbage-collected catalog"""
+            tracked.discard(identity)
+            for key in [key for key in cache if key[1] == identity]:
+                del cache[key]
+
+        def _track(catalog: Any, identity: tuple) -> bool:
+            """Register id()-identified catalogs for cleanup; False if not possible"""
+            if identity[0] != 'id' or identity in tracked:
+                return True
+            try:
+                weakref.finalize(catalog, _forget, identity)
+            except TypeError:
+                return False
+            tracked.add(identity)
+            return True
+
+        @functools.wraps(func)
+        def wrapper(self, catalog: Any, object_type: Optional[str] = None,
+                    filter_criteria: Optional[Dict[str, Any]] = None) -> MCPResponse:
+            cache_key, version = _catalog_query_key(self.platform, catalog, object_type, filter_criteria)
+            current_time = time.time()
+
+            # Check cache
+            entry = cache.get(cache_key)
+            if entry is not None:
+                cached_result, cached_time = entry
+                if version is not None or current_time - cached_time < ttl:
+                    # Cache hit
+                    cache.move_to_end(cache_key)
+                    result = cached_result.clone()
+                    result.context['cached'] = True
+                    result.context['cache_age'] = int(current_time - cached_time)
+                    self._trace(result, "Returned from cache (age: %ds)", current_time - cached_time)
+                    return result
+                del cache[cache_key]
+
+            # Cache miss - execute operation
+            result = func(self, catalog, object_type, filter_criteria)
+
+            # Store in cache
+            if isinstance(result, MCPResponse) and result.success and _track(catalog, cache_key[1]):
+                if version is not None:
+                    # Results for older stamps of this catalog can never hit again
+                    for key in [key for key in cache
+                                if key[:2] == cache_key[:2] and key[2] != version]:
+                        del cache[key]
+                if len(cache) >= maxsize:
+                    _evict(current_time)
+                result.context['cached'] = False
+                result.context['cache_ttl'] = None if version is not None else ttl
+                cache[cache_key] = (result.clone(), current_time)
+
+            return result
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
+
+
+@functools.lru_cache(maxsize=1)
+def _register_operations() -> None:
+    """Register ModelInspector operations with the global safety policy"""
+    policy = get_safety_policy()
+    policy.register_operation('get_object_properties', 'read_only')
+    policy.register_operation('query_catalog', 'read_only')
+    policy.register_operation('list_objects', 'read_only')
+
 
 class ModelInspector(MCPBase):
     """
@@ -38,7 +392,7 @@ class ModelInspector(MCPBase):
     Platform-specific type validation is enforced through decorators.
     """
 
-    def __init__(self, platform='aimsun', logger=None, context=None):
+    def __init__(self, platform='aimsun', logger=None, context=None, tracing=True):
         """
         Initialize ModelInspector.
 
@@ -46,6 +400,7 @@ class ModelInspector(MCPBase):
             platform: Platform type ('aimsun' or 'qgis')
             logger: Optional MCPLogger instance
             context: Optional context dict with caller info
+            tracing: Record execution trace messages on responses
         """
         if logger is None:
             logger = get_mcp_logger()
@@ -60,11 +415,30 @@ class ModelInspector(MCPBase):
         if self.platform not in ['aimsun', 'qgis']:
             raise ValueError(f"Unsupported platform: {platform}. Must be 'aimsun' or 'qgis'")
 
-        # Register with safety policy
-        policy = get_safety_policy()
-        policy.register_operation('get_object_properties', 'read_only')
-        policy.register_operation('query_catalog', 'read_only')
-        policy.register_operation('list_objects', 'read_only')
+        # Register with safety policy (once per process)
+        _register_operations()
+        self._policy = get_safety_policy()
+
+        # Trace messages are formatted lazily and skipped entirely when disabled
+        self._tracing_enabled = tracing
+
+        # LRU of get_object_properties results keyed by (id(obj), stamp)
+        self._props_cache: "OrderedDict[tuple, MCPResponse]" = OrderedDict()
+
+        # LRU of name search structures per catalog query (see _name_search_for)
+        self._name_search: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+    def _trace(self, response: MCPResponse, message: str, *args: Any) -> None:
+        """
+        Add a trace message to a response if tracing is enabled.
+
+        Args:
+            response: Response to annotate
+            message: Message, %-formatted with args only when recorded
+            *args: Format arguments
+        """
+        if self._tracing_enabled:
+            response.add_trace(message % args if args else message)
 
     # ===== Object Inspection =====
 
@@ -79,25 +453,37 @@ class ModelInspector(MCPBase):
         - All public properties
         - Object state
 
+        Results are cached for objects exposing a modification stamp, until
+        the stamp changes or the object is garbage collected.
+
         Args:
             obj: Model object (Aimsun GK* or QGIS Qgs*)
 
         Returns:
             MCPResponse with object properties
         """
+        cache_key = self._properties_cache_key(obj)
+        if cache_key is not None:
+            cached_result = self._props_cache.get(cache_key)
+            if cached_result is not None:
+                self._props_cache.move_to_end(cache_key)
+                result = cached_result.clone()
+                result.context['cached'] = True
+                self._trace(result, "Returned from properties cache")
+                return result
+
         response = self._create_response()
-        response.add_trace(f"Inspecting object: {type(obj).__name__}")
+        self._trace(response, "Inspecting object: %s", _type_name(obj))
 
         try:
             # Validate object type
-            policy = get_safety_policy()
-            is_safe, error = policy.check_type_safety(obj, platform=self.platform)
+            is_safe, error = self._policy.check_type_safety(obj, platform=self.platform)
 
             if not is_safe:
                 response.set_error(f"Type validation failed: {error}")
                 return response
 
-            response.add_trace("Object type validated")
+            self._trace(response, "Object type validated")
 
             # Extract properties based on platform
             if self.platform == 'aimsun':
@@ -108,7 +494,7 @@ class ModelInspector(MCPBase):
                 response.set_error(f"Unsupported platform: {self.platform}")
                 return response
 
-            response.add_trace(f"Extracted {len(properties)} properties")
+            self._trace(response, "Extracted %d properties", len(properties))
 
             response.data = {
                 'object_type': type(obj).__name__,
@@ -116,12 +502,52 @@ class ModelInspector(MCPBase):
                 'properties': properties
             }
 
+            if cache_key is not None:
+                self._store_properties(obj, cache_key, response)
+
             return response
 
         except Exception as e:
             response.set_error(f"Error inspecting object: {str(e)}")
             return response
 
+    def _properties_cache_key(self, obj: Any) -> Optional[tuple]:
+        """
+        Build the properties cache key for an object.
+
+        Args:
+            obj: Model object
+
+        Returns:
+            (id, modification stamp) tuple, or None if the object is not cacheable
+        """
+        stamp = _modification_stamp(obj, _OBJECT_VERSION_METHODS)
+        if stamp is None:
+            return None
+        return (id(obj), stamp)
+
+    def _store_properties(self, obj: Any, cache_key: tuple, response: MCPResponse) -> None:
+        """
+        Store a get_object_properties result in the LRU cache.
+
+        Entries are dropped when the object dies, so a recycled id() never
+        serves another object's properties. Objects that cannot be weakly
+        referenced are not cached for the same reason.
+
+        Args:
+            obj: Inspected object
+            cache_key: Key from _properties_cache_key
+            response: Successful response to cache
+        """
+        try:
+            weakref.finalize(obj, self._props_cache.pop, cache_key, None)
+        except TypeError:
+            return
+
+        self._props_cache[cache_key] = response.clone()
+        if len(self._props_cache) > _PROPERTIES_CACHE_SIZE:
+            self._props_cache.popitem(last=False)
+
     def _extract_aimsun_properties(self, obj: Any) -> Dict[str, Any]:
         """
         Extract properties from Aimsun object.
@@ -133,6 +559,7 @@ class ModelInspector(MCPBase):
             Dictionary of properties
         """
         properties = {}
+        obj_type_name = _type_name(obj)
 
         try:
             # Common Aimsun object properties
@@ -144,7 +571,7 @@ class ModelInspector(MCPBase):
                 properties['type_name'] = obj.getTypeName()
 
             # Section-specific properties
-            if type(obj).__name__ == 'GKSection':
+            if obj_type_name is _GK_SECTION:
                 if hasattr(obj, 'getSpeed'):
                     properties['speed'] = obj.getSpeed()
                 if hasattr(obj, 'getCapacity'):
@@ -153,21 +580,17 @@ class ModelInspector(MCPBase):
                     properties['length'] = obj.getLength()
 
             # Node-specific properties
-            elif type(obj).__name__ == 'GKNode':
+            elif obj_type_name is _GK_NODE:
                 if hasattr(obj, 'getPosition'):
                     pos = obj.getPosition()
                     properties['position'] = {'x': pos.x, 'y': pos.y} if pos else None
 
-            # Generic property extraction
-            for attr in dir(obj):
-                if attr.startswith('get') and not attr.startswith('__'):
-                    try:
-                        method = getattr(obj, attr)
-                        if callable(method) and method.__code__.co_argcount == 1:  # Only self
-                            value = method()
-                            properties[attr.replace('get', '', 1).lower()] = str(value)
-                    except:
-                        pass
+            # Generic property extraction (getters resolved once per class)
+            for key, getter in _getters_for(obj):
+                try:
+                    properties[key] = str(getter(obj))
+                except Exception:
+                    pass
 
         except Exception as e:
             properties['_error'] = str(e)
@@ -185,10 +608,11 @@ class ModelInspector(MCPBase):
             Dictionary of properties
         """
         properties = {}
+        obj_type_name = _type_name(obj)
 
         try:
             # QgsVectorLayer properties
-            if type(obj).__name__ == 'QgsVectorLayer':
+            if obj_type_name is _QGS_VECTOR_LAYER:
                 if hasattr(obj, 'name'):
                     properties['name'] = obj.name()
                 if hasattr(obj, 'featureCount'):
@@ -199,7 +623,7 @@ class ModelInspector(MCPBase):
                     properties['geometry_type'] = obj.geometryType()
 
             # QgsFeature properties
-            elif type(obj).__name__ == 'QgsFeature':
+            elif obj_type_name is _QGS_FEATURE:
                 if hasattr(obj, 'id'):
                     properties['id'] = obj.id()
                 if hasattr(obj, 'attributes'):
@@ -208,7 +632,7 @@ class ModelInspector(MCPBase):
                     geom = obj.geometry()
                     if geom:
                         properties['geometry_type'] = geom.type()
-                        properties['geometry_wkt'] = geom.asWkt()[:100]  # First 100 chars
+                        properties['geometry_wkt'] = _wkt_preview(geom)
 
             # Generic property extraction
             for attr in dir(obj):
@@ -217,7 +641,7 @@ class ModelInspector(MCPBase):
                         value = getattr(obj, attr)
                         if not callable(value):
                             properties[attr] = str(value)
-                    except:
+                    except Exception:
                         pass
 
         except Exception as e:
@@ -228,13 +652,14 @@ class ModelInspector(MCPBase):
     # ===== Catalog Queries =====
 
     @read_only
-    @cached(ttl=60)
+    @_catalog_cache(ttl=60)
     def query_catalog(self, catalog: Any, object_type: Optional[str] = None,
                      filter_criteria: Optional[Dict[str, Any]] = None) -> MCPResponse:
         """
         Query model catalog for objects.
 
-        Safe read-only operation. Results cached for 60 seconds.
+        Safe read-only operation. Results are cached until the catalog's
+        modification stamp changes, or for 60 seconds when it has none.
 
         Args:
             catalog: Model catalog object
@@ -245,17 +670,17 @@ class ModelInspector(MCPBase):
             MCPResponse with matching objects
         """
         response = self._create_response()
-        response.add_trace(f"Querying catalog: {type(catalog).__name__}")
+        self._trace(response, "Querying catalog: %s", _type_name(catalog))
 
         try:
             # Extract all objects from catalog
             objects = self._extract_catalog_objects(catalog, object_type)
-            response.add_trace(f"Found {len(objects)} objects")
+            self._trace(response, "Found %d objects", len(objects))
 
             # Apply filters if specified
             if filter_criteria:
                 objects = self._apply_filters(objects, filter_criteria)
-                response.add_trace(f"After filtering: {len(objects)} objects")
+                self._trace(response, "After filtering: %d objects", len(objects))
 
             response.data = {
                 'catalog_type': type(catalog).__name__,
@@ -275,6 +700,9 @@ class ModelInspector(MCPBase):
         """
         Extract objects from catalog.
 
+        Objects collected before an extraction error are kept, followed by
+        an '_error' entry describing the failure.
+
         Args:
             catalog: Catalog object
             object_type: Optional type filter
@@ -296,31 +724,150 @@ class ModelInspector(MCPBase):
                         obj_list = []
 
                     for obj in obj_list:
-                        obj_data = {
-                            'id': obj.getId() if hasattr(obj, 'getId') else None,
-                            'name': obj.getName() if hasattr(obj, 'getName') else None,
-                            'type': type(obj).__name__
-                        }
-                        objects.append(obj_data)
+                        get_id = getattr(obj, 'getId', None)
+                        get_name = getattr(obj, 'getName', None)
+                        objects.append({
+                            'id': get_id() if get_id is not None else None,
+                            'name': get_name() if get_name is not None else None,
+                            'type': _type_name(obj)
+                        })
 
             # QGIS project
             elif self.platform == 'qgis':
                 if hasattr(catalog, 'mapLayers'):
                     layers = catalog.mapLayers()
                     for layer_id, layer in layers.items():
-                        if not object_type or type(layer).__name__ == object_type:
-                            obj_data = {
+                        layer_type = _type_name(layer)
+                        if not object_type or layer_type == object_type:
+                            get_name = getattr(layer, 'name', None)
+                            objects.append({
                                 'id': layer_id,
-                                'name': layer.name() if hasattr(layer, 'name') else None,
-                                'type': type(layer).__name__
-                            }
-                            objects.append(obj_data)
+                                'name': get_name() if get_name is not None else None,
+                                'type': layer_type
+                            })
 
         except Exception as e:
             objects.append({'_error': str(e)})
 
         return objects
 
+    def _name_search_for(self, catalog: Any, object_type: Optional[str],
+                         objects: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Get the name search structures for a catalog query result.
+
+        Structures are kept out of the query response and built lazily, once
+        per cached query. An entry is only reused while it belongs to the
+        same objects list, so a refreshed query result rebuilds it.
+
+        Args:
+            catalog: Catalog object
+            object_type: Optional type filter
+            objects: Object list returned by query_catalog
+
+        Returns:
+            Mutable dictionary holding the structures built so far
+        """
+        cache_key, _ = _catalog_query_key(self.platform, catalog, object_type, None)
+        entry = self._name_search.get(cache_key)
+        if entry is not None and entry[0] is objects:
+            self._name_search.move_to_end(cache_key)
+            return entry[1]
+
+        structures: Dict[str, Any] = {}
+        self._name_search[cache_key] = (objects, structures)
+        self._name_search.move_to_end(cache_key)
+        if len(self._name_search) > _NAME_SEARCH_CACHE_SIZE:
+            self._name_search.popitem(last=False)
+        return structures
+
+    def _build_name_index(self, objects: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Build an inverted index of lowercase object name to objects.
+
+        Args:
+            objects: List of object dictionaries
+
+        Returns:
+            Dictionary mapping lowercase names to the objects carrying them
+        """
+        index: Dict[str, List[Dict[str, Any]]] = {}
+
+        for obj in objects:
+            name = obj.get('name')
+            if name:
+                index.setdefault(str(name).lower(), []).append(obj)
+
+        return index
+
+    def _build_name_array(self, objects: List[Dict[str, Any]]) -> Any:
+        """
+        Build an Arrow string array of lowercase object names.
+
+        Lets substring searches run in Arrow's C++ compute kernels instead of
+        a Python loop. Only built for large catalogs when pyarrow is installed.
+
+        Args:
+            objects: List of object dictionaries
+
+        Returns:
+            pyarrow StringArray aligned with objects (null where no name), or None
+        """
+        if not _HAS_PYARROW or len(objects) < _BLOOM_MIN_OBJECTS:
+            return None
+
+        return pa.array(
+            [str(obj['name']).lower() if 'name' in obj else None for obj in objects],
+            type=pa.string()
+        )
+
+    def _build_name_blooms(self, objects: List[Dict[str, Any]]) -> Any:
+        """
+        Build per-object trigram bloom signatures of lowercase names.
+
+        Only built for catalogs of at least _BLOOM_MIN_OBJECTS objects; below
+        that a plain substring scan is cheaper than the prefilter.
+
+        Args:
+            objects: List of object dictionaries
+
+        Returns:
+            numpy uint64 array (list of ints without numpy), or None
+        """
+        if len(objects) < _BLOOM_MIN_OBJECTS:
+            return None
+
+        blooms = [
+            _trigram_bloom(str(obj['name']).lower()) if 'name' in obj else 0
+            for obj in objects
+        ]
+
+        if _HAS_NUMPY:
+            return np.array(blooms, dtype=np.uint64)
+        return blooms
+
+    def _bloom_candidates(self, objects: List[Dict[str, Any]], blooms: Any,
+                          search_term_lower: str) -> List[Dict[str, Any]]:
+        """
+        Select objects whose name bloom may contain the search term.
+
+        Args:
+            objects: List of object dictionaries
+            blooms: Signatures from _build_name_blooms (aligned with objects)
+            search_term_lower: Lowercase search string
+
+        Returns:
+            Candidate objects (superset of the true substring matches)
+        """
+        term_bloom = _trigram_bloom(search_term_lower)
+
+        if _HAS_NUMPY and isinstance(blooms, np.ndarray):
+            term = np.uint64(term_bloom)
+            hits = np.flatnonzero(np.bitwise_and(blooms, term) == term)
+            return [objects[i] for i in hits]
+
+        return [obj for obj, bloom in zip(objects, blooms) if bloom & term_bloom == term_bloom]
+
     def _apply_filters(self, objects: List[Dict[str, Any]],
                       filter_criteria: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
@@ -333,18 +880,14 @@ class ModelInspector(MCPBase):
         Returns:
             Filtered list of objects
         """
-        filtered = []
-
-        for obj in objects:
-            match = True
-            for key, value in filter_criteria.items():
-                if key not in obj or obj[key] != value:
-                    match = False
-                    break
-            if match:
-                filtered.append(obj)
+        needed = frozenset(filter_criteria)
+        items = tuple(filter_criteria.items())
 
-        return filtered
+        # Subset check on the keys view fails fast on objects missing a key
+        return [
+            obj for obj in objects
+            if needed <= obj.keys() and all(obj[key] == value for key, value in items)
+        ]
 
     # ===== Object Listing =====
 
@@ -365,23 +908,24 @@ class ModelInspector(MCPBase):
             MCPResponse with object list
         """
         response = self._create_response()
-        response.add_trace(f"Listing objects in: {type(container).__name__}")
+        self._trace(response, "Listing objects in: %s", _type_name(container))
 
         try:
-            # Extract objects from container
-            objects = self._extract_container_objects(container, object_type)
-            response.add_trace(f"Found {len(objects)} objects")
+            # Stream objects from container, stopping once the limit is reached
+            object_iter = self._iter_container_objects(container, object_type)
+            objects = list(itertools.islice(object_iter, max_results))
+            truncated = next(object_iter, None) is not None
+            self._trace(response, "Found %d objects", len(objects))
 
-            # Limit results
-            if len(objects) > max_results:
-                objects = objects[:max_results]
-                response.add_trace(f"Limited to {max_results} results")
+            if truncated:
+                self._trace(response, "Limited to %d results", max_results)
 
             response.data = {
                 'container_type': type(container).__name__,
                 'object_type': object_type,
                 'total_found': len(objects),
                 'max_results': max_results,
+                'truncated': truncated,
                 'objects': objects
             }
 
@@ -391,32 +935,36 @@ class ModelInspector(MCPBase):
             response.set_error(f"Error listing objects: {str(e)}")
             return response
 
-    def _extract_container_objects(self, container: Any, object_type: Optional[str] = None) -> List[Dict[str, Any]]:
+    def _iter_container_objects(self, container: Any,
+                                object_type: Optional[str] = None) -> Iterator[Dict[str, Any]]:
         """
-        Extract objects from container.
+        Iterate over objects in a container.
+
+        Objects are produced lazily so callers can stop early without
+        materializing the whole container.
 
         Args:
             container: Container object
             object_type: Optional type filter
 
-        Returns:
-            List of object dictionaries
+        Yields:
+            Object dictionaries
         """
-        objects = []
-
         try:
             # Aimsun folder
             if self.platform == 'aimsun':
                 if hasattr(container, 'getContents'):
                     contents = container.getContents()
                     for obj in contents:
-                        if not object_type or type(obj).__name__ == object_type:
-                            obj_data = {
-                                'id': obj.getId() if hasattr(obj, 'getId') else None,
-                                'name': obj.getName() if hasattr(obj, 'getName') else None,
-                                'type': type(obj).__name__
+                        obj_type_name = _type_name(obj)
+                        if not object_type or obj_type_name == object_type:
+                            get_id = getattr(obj, 'getId', None)
+                            get_name = getattr(obj, 'getName', None)
+                            yield {
+                                'id': get_id() if get_id is not None else None,
+                                'name': get_name() if get_name is not None else None,
+                                'type': obj_type_name
                             }
-                            objects.append(obj_data)
 
             # QGIS layer group
             elif self.platform == 'qgis':
@@ -425,25 +973,28 @@ class ModelInspector(MCPBase):
                     for child in children:
                         if hasattr(child, 'layer'):
                             layer = child.layer()
-                            if layer and (not object_type or type(layer).__name__ == object_type):
-                                obj_data = {
-                                    'id': layer.id() if hasattr(layer, 'id') else None,
-                                    'name': layer.name() if hasattr(layer, 'name') else None,
-                                    'type': type(layer).__name__
+                            if not layer:
+                                continue
+                            layer_type = _type_name(layer)
+                            if not object_type or layer_type == object_type:
+                                get_id = getattr(layer, 'id', None)
+                                get_name = getattr(layer, 'name', None)
+                                yield {
+                                    'id': get_id() if get_id is not None else None,
+                                    'name': get_name() if get_name is not None else None,
+                                    'type': layer_type
                                 }
-                                objects.append(obj_data)
 
         except Exception as e:
-            objects.append({'_error': str(e)})
-
-        return objects
+            yield {'_error': str(e)}
 
     # ===== Search Operations =====
 
     @read_only
     def search_objects(self, catalog: Any, search_term: str,
                       object_type: Optional[str] = None,
-                      search_fields: Optional[List[str]] = None) -> MCPResponse:
+                      search_fields: Optional[List[str]] = None,
+                      exact_match: bool = False) -> MCPResponse:
         """
         Search for objects by name or properties.
 
@@ -454,12 +1005,14 @@ class ModelInspector(MCPBase):
             search_term: Search string
             object_type: Optional type filter
             search_fields: Optional list of fields to search (default: ['name'])
+            exact_match: Match whole names (case-insensitive) via the catalog
+                name index instead of substring scanning
 
         Returns:
             MCPResponse with matching objects
         """
         response = self._create_response()
-        response.add_trace(f"Searching for: '{search_term}'")
+        self._trace(response, "Searching for: '%s'", search_term)
 
         try:
             if search_fields is None:
@@ -477,23 +1030,54 @@ class ModelInspector(MCPBase):
 
             search_term_lower = search_term.lower()
 
-            for obj in all_objects:
-                match = False
-                for field in search_fields:
-                    if field in obj:
-                        value = str(obj[field]).lower()
-                        if search_term_lower in value:
-                            match = True
-                            break
-                if match:
-                    matched_objects.append(obj)
-
-            response.add_trace(f"Found {len(matched_objects)} matches")
+            if exact_match and search_fields == ['name']:
+                # O(1) lookup against the index built once per cached query
+                structures = self._name_search_for(catalog, object_type, all_objects)
+                name_index = structures.get('index')
+                if name_index is None:
+                    name_index = structures['index'] = self._build_name_index(all_objects)
+                matched_objects = list(name_index.get(search_term_lower, []))
+                self._trace(response, "Resolved via name index")
+            elif exact_match:
+                matched_objects = [
+                    obj for obj in all_objects
+                    if any(field in obj and str(obj[field]).lower() == search_term_lower
+                           for field in search_fields)
+                ]
+            elif search_fields == ['name'] and _HAS_PYARROW and len(all_objects) >= _BLOOM_MIN_OBJECTS:
+                # Vectorized containment scan over the Arrow name column
+                structures = self._name_search_for(catalog, object_type, all_objects)
+                name_array = structures.get('array')
+                if name_array is None:
+                    name_array = structures['array'] = self._build_name_array(all_objects)
+                mask = pc.match_substring(name_array, search_term_lower)
+                hits = pc.indices_nonzero(mask.fill_null(False))
+                matched_objects = [all_objects[i] for i in hits.to_pylist()]
+                self._trace(response, "Matched via Arrow substring kernel")
+            else:
+                name_blooms = None
+                if search_fields == ['name'] and len(all_objects) >= _BLOOM_MIN_OBJECTS:
+                    structures = self._name_search_for(catalog, object_type, all_objects)
+                    if 'blooms' not in structures:
+                        structures['blooms'] = self._build_name_blooms(all_objects)
+                    name_blooms = structures['blooms']
+                if name_blooms is not None:
+                    all_objects = self._bloom_candidates(all_objects, name_blooms, search_term_lower)
+                    self._trace(response, "Bloom prefilter kept %d candidates", len(all_objects))
+
+                matched_objects = [
+                    obj for obj in all_objects
+                    if any(field in obj and search_term_lower in str(obj[field]).lower()
+                           for field in search_fields)
+                ]
+
+            self._trace(response, "Found %d matches", len(matched_objects))
 
             response.data = {
                 'search_term': search_term,
                 'search_fields': search_fields,
                 'object_type': object_type,
+                'exact_match': exact_match,
                 'match_count': len(matched_objects),
                 'matches': matched_objects
             }
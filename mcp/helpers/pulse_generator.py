@@ -5,29 +5,261 @@ Generates .pulse/ folder contents including:
 - imports_graph.json: Dependency graph with circular dependency detection
 - functions_index.json: Function signature index with cross-references
 - cards/*.md: Script cards with comprehensive summaries
+
+The module is fully type-annotated and checks cleanly under the project's
+mypy settings (run ``mypy --follow-imports=silent pulse_generator.py`` from
+mcp/helpers).
 """
 
 from __future__ import annotations
 
 import json
 import hashlib
+import heapq
+import os
+import pickle
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import chain, groupby
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Set, Any, Tuple, Optional
-from collections import defaultdict, Counter
+from typing import Callable, Dict, Iterable, List, NamedTuple, Set, Any, Tuple, Optional
+from collections import defaultdict
+from dataclasses import dataclass, field
 from datetime import datetime
 
+# Optional dependencies
+try:
+    import numpy as np
+    _HAS_NUMPY = True
+except Exception:
+    _HAS_NUMPY = False
+
+try:
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.csgraph import connected_components
+    _HAS_SCIPY = True
+except Exception:
+    _HAS_SCIPY = False
+
+try:
+    import orjson
+    _HAS_ORJSON = True
+except Exception:
+    _HAS_ORJSON = False
+
+try:
+    import xxhash
+    _HAS_XXHASH = True
+except Exception:
+    _HAS_XXHASH = False
+
+
+def _write_json(output_path: Path, data: Dict[str, Any]) -> None:
+    """
+    Write data as indented JSON.
+
+    Uses orjson when available (serializes straight to bytes, no
+    pure-Python pretty printer), falling back to the stdlib json module.
+
+    Args:
+        output_path: Destination file
+        data: JSON-serializable data (sets are written as lists)
+    """
+    if _HAS_ORJSON:
+        output_path.write_bytes(orjson.dumps(
+            data,
+            default=_json_default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        ))
+    else:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, default=_json_default)
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize types the JSON encoders do not handle natively."""
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _normalize_path(path: str) -> str:
+    """
+    Normalize a repository-relative path to a graph vertex name.
+
+    Separators are unified to '/' so Windows and POSIX spellings of a file
+    map to one vertex, and the result is interned so the many copies of a
+    path (as importer, import target and key) share one string object.
+    """
+    return sys.intern(path.replace('\\', '/'))
+
+
+def _card_hash(card_data: Tuple[Any, ...]) -> Optional[str]:
+    """
+    Hash the inputs of a script card for incremental regeneration.
+
+    Uses xxh3 when xxhash is installed, falling back to blake2b.
+
+    Args:
+        card_data: Everything the card content depends on
+
+    Returns:
+        Hex digest, or None if the data cannot be serialized deterministically
+    """
+    try:
+        if _HAS_ORJSON:
+            encoded = orjson.dumps(
+                card_data,
+                default=_json_default,
+                option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            )
+        else:
+            encoded = json.dumps(card_data, sort_keys=True, default=_json_default).encode('utf-8')
+    except (TypeError, ValueError):
+        return None
+
+    if _HAS_XXHASH:
+        digest: str = xxhash.xxh3_64_hexdigest(encoded)
+        return digest
+    return hashlib.blake2b(encoded, digest_size=8).hexdigest()
+
+
+def _load_card_manifest(manifest_path: Path) -> Dict[str, str]:
+    """Load the card hash manifest of a previous run (empty if missing or invalid)."""
+    try:
+        manifest = json.loads(manifest_path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+# Card batches smaller than this are written in-process (pool startup dominates)
+_PARALLEL_CARDS_MIN_FILES = 32
+
+# Rendered cards handed to the writer threads at a time (pool fallback)
+_CARD_WRITE_BATCH = 128
+
+# Graphs with fewer files run cycle detection in Python (scipy setup dominates)
+_SCIPY_SCC_MIN_FILES = 512
+
+# Maximum number of dependencies/dependents listed on a script card
+CARD_LISTING_LIMIT = 10
+
+# Sidecar file in the cards directory mapping file paths to card input hashes
+CARD_MANIFEST_NAME = ".card_hashes.json"
+
+# Bump when the card layout changes so existing cards are regenerated
+_CARD_FORMAT_VERSION = 2
+
+# Footer timestamp format of script cards
+CARD_TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+def _card_listing(files: Set[str]) -> List[str]:
+    """Get the alphabetically first files shown on a script card."""
+    return heapq.nsmallest(CARD_LISTING_LIMIT, files)
+
+
+def _card_inputs(file_info: Dict[str, Any]) -> Tuple[Any, ...]:
+    """
+    Select the file data a script card renders, in a canonical form.
+
+    Only fields read by ScriptCardGenerator.render_card are kept (keep the
+    two in sync), so set-derived lists whose order depends on the hash seed,
+    such as the import lists, cannot change a card's hash between processes.
+
+    Args:
+        file_info: File analysis data
+
+    Returns:
+        Tuple of the rendered values
+    """
+    metadata = file_info.get("metadata") or {}
+    functions = file_info.get("functions") or []
+    classes = file_info.get("classes") or []
+    issues = file_info.get("issues") or []
+    return (
+        file_info.get("file_rel", "unknown"),
+        file_info.get("size_kb", 0),
+        file_info.get("lines", 0),
+        file_info.get("mtime", "unknown"),
+        (metadata.get("owner"), metadata.get("atype"), metadata.get("category_name")),
+        file_info.get("docstring"),
+        len(functions),
+        [(func.get("name", "unknown"), func.get("args", []), func.get("docstring"),
+          func.get("lineno", 0), func.get("complexity"), func.get("reusability_score"),
+          len(func.get("used_in_files") or ()))
+         for func in functions[:20]],
+        len(classes),
+        [(cls.get("name", "unknown"), cls.get("docstring"),
+          len(cls.get("methods") or []),
+          [method.get("name", "unknown") for method in (cls.get("methods") or [])[:5]])
+         for cls in classes[:10]],
+        len(issues),
+        issues[:10],
+    )
+
+
+class _CsrGraph(NamedTuple):
+    """Compressed sparse row (CSR) adjacency of a DependencyGraph."""
+    names: List[str]  # file id -> file path
+    indptr: array[int]  # edges of file u: indices[indptr[u]:indptr[u + 1]]
+    indices: array[int]
+    rev_indptr: array[int]
+    rev_indices: array[int]
+
 
 class DependencyGraph:
-    """Build and analyze import dependency graph."""
+    """
+    Build and analyze import dependency graph.
 
-    def __init__(self):
+    Edges are collected in string-keyed adjacency sets; traversals run on a
+    compressed sparse row (CSR) copy with integer file ids, built on demand
+    by finalize() and discarded whenever a new edge is added.
+    """
+
+    def __init__(self) -> None:
         self.graph: Dict[str, Set[str]] = defaultdict(set)  # file -> imported files
         self.reverse_graph: Dict[str, Set[str]] = defaultdict(set)  # file -> files that import it
 
-    def add_dependency(self, from_file: str, to_file: str):
+        # CSR form (None until finalize(), reset when an edge is added)
+        self._csr: Optional[_CsrGraph] = None
+
+    def add_dependency(self, from_file: str, to_file: str) -> None:
         """Add a dependency edge."""
-        self.graph[from_file].add(to_file)
+        forward = self.graph[from_file]
+        if to_file in forward:
+            return
+        forward.add(to_file)
         self.reverse_graph[to_file].add(from_file)
+        self._csr = None
+
+    def add_dependencies_bulk(self, edges: Iterable[Tuple[str, str]]) -> None:
+        """
+        Add many dependency edges at once.
+
+        Consecutive edges sharing a source file are merged with a single set
+        update, so edges grouped by importer (the order analysis produces
+        them in) are added without per-edge method calls.
+
+        Args:
+            edges: (from_file, to_file) pairs
+        """
+        graph = self.graph
+        reverse_graph = self.reverse_graph
+        for from_file, group in groupby(edges, key=itemgetter(0)):
+            forward = graph[from_file]
+            new_targets = {to_file for _, to_file in group}
+            new_targets.difference_update(forward)
+            if not new_targets:
+                continue
+            forward.update(new_targets)
+            for to_file in new_targets:
+                reverse_graph[to_file].add(from_file)
+            self._csr = None
 
     def get_dependencies(self, file: str) -> Set[str]:
         """Get all files that this file imports."""
@@ -37,52 +269,229 @@ class DependencyGraph:
         """Get all files that import this file."""
         return self.reverse_graph.get(file, set())
 
+    def finalize(self) -> _CsrGraph:
+        """
+        Build the CSR adjacency arrays used by the graph traversals.
+
+        Every file (importer or imported) gets an integer id; forward and
+        reverse edges are stored as contiguous int arrays so traversals index
+        arrays instead of hashing path strings per edge.
+
+        Returns:
+            The CSR arrays (also kept until the next edge is added)
+        """
+        names = list(dict.fromkeys(chain(self.graph, self.reverse_graph)))
+        ids = {name: i for i, name in enumerate(names)}
+
+        indptr, indices = self._build_csr(names, ids, self.graph)
+        rev_indptr, rev_indices = self._build_csr(names, ids, self.reverse_graph)
+        self._csr = _CsrGraph(names, indptr, indices, rev_indptr, rev_indices)
+        return self._csr
+
+    @staticmethod
+    def _build_csr(names: List[str], ids: Dict[str, int],
+                   adjacency: Dict[str, Set[str]]) -> Tuple[array[int], array[int]]:
+        """Convert string adjacency sets to (indptr, indices) arrays."""
+        indptr = array('l', [0])
+        indices = array('l')
+
+        for name in names:
+            neighbors = adjacency.get(name)
+            if neighbors:
+                indices.extend([ids[neighbor] for neighbor in neighbors])
+            indptr.append(len(indices))
+
+        return indptr, indices
+
+    def _ensure_finalized(self) -> _CsrGraph:
+        """Get the CSR arrays, building them if edges changed since the last build."""
+        if self._csr is None:
+            return self.finalize()
+        return self._csr
+
     def find_circular_dependencies(self) -> List[List[str]]:
-        """Find circular dependency cycles using DFS."""
-        visited = set()
-        rec_stack = set()
-        cycles = []
+        """
+        Find circular dependency cycles from strongly connected components.
+
+        Every strongly connected component with more than one file, or a
+        file importing itself, is reported as a cycle. Large graphs use
+        scipy's native SCC kernel when scipy is installed; otherwise an
+        iterative Tarjan runs over the CSR arrays.
+
+        Returns:
+            List of cycles, each listing its files with the first repeated last
+        """
+        csr = self._ensure_finalized()
+        names = csr.names
+
+        if _HAS_SCIPY and len(names) >= _SCIPY_SCC_MIN_FILES:
+            components = self._scipy_cyclic_components(csr)
+        else:
+            components = self._tarjan_cyclic_components(csr)
+
+        return [[names[member] for member in component] + [names[component[0]]]
+                for component in components]
+
+    @staticmethod
+    def _scipy_cyclic_components(csr: _CsrGraph) -> List[List[int]]:
+        """
+        Get cyclic strongly connected components with scipy.sparse.csgraph.
+
+        Args:
+            csr: CSR arrays from finalize()
+
+        Returns:
+            Lists of file ids (ascending), ordered by their first file id
+        """
+        node_count = len(csr.names)
+        indptr = np.frombuffer(csr.indptr, dtype=np.dtype(csr.indptr.typecode))
+        indices = np.frombuffer(csr.indices, dtype=np.dtype(csr.indices.typecode))
+
+        matrix = csr_matrix(
+            (np.ones(len(indices), dtype=bool), indices, indptr),
+            shape=(node_count, node_count)
+        )
+        _, labels = connected_components(matrix, directed=True, connection='strong')
 
-        def dfs(node: str, path: List[str]):
-            visited.add(node)
-            rec_stack.add(node)
-            path.append(node)
+        # Keep files in multi-file components or importing themselves
+        rows = np.repeat(np.arange(node_count), np.diff(indptr))
+        cyclic = np.bincount(labels)[labels] > 1
+        cyclic[rows[rows == indices]] = True
 
-            for neighbor in self.graph.get(node, []):
-                if neighbor not in visited:
-                    dfs(neighbor, path[:])
-                elif neighbor in rec_stack:
-                    # Found cycle
-                    cycle_start = path.index(neighbor)
-                    cycle = path[cycle_start:] + [neighbor]
-                    cycles.append(cycle)
+        members = np.flatnonzero(cyclic)
+        if not len(members):
+            return []
+        members = members[np.argsort(labels[members], kind='stable')]
+        splits = np.flatnonzero(np.diff(labels[members])) + 1
 
-            rec_stack.remove(node)
+        components: List[List[int]] = [group.tolist() for group in np.split(members, splits)]
+        components.sort(key=itemgetter(0))
+        return components
 
-        for node in self.graph.keys():
-            if node not in visited:
-                dfs(node, [])
+    def _tarjan_cyclic_components(self, csr: _CsrGraph) -> List[List[int]]:
+        """
+        Get cyclic strongly connected components with Tarjan's algorithm.
 
-        return cycles
+        Runs iteratively in O(V + E) over the CSR arrays, so deep import
+        chains cannot hit the recursion limit.
 
-    def calculate_fan_metrics(self) -> Dict[str, Dict[str, int]]:
+        Args:
+            csr: CSR arrays from finalize()
+
+        Returns:
+            Lists of file ids in discovery order
+        """
+        names, indptr, indices = csr.names, csr.indptr, csr.indices
+
+        node_count = len(names)
+        index = [-1] * node_count
+        lowlink = [0] * node_count
+        on_stack = [False] * node_count
+        scc_stack: List[int] = []
+        components: List[List[int]] = []
+        counter = 0
+
+        for root in range(node_count):
+            if index[root] >= 0:
+                continue
+
+            index[root] = lowlink[root] = counter
+            counter += 1
+            scc_stack.append(root)
+            on_stack[root] = True
+            # Frames are [node, position of the next edge to explore]
+            work_stack = [[root, indptr[root]]]
+
+            while work_stack:
+                frame = work_stack[-1]
+                node, pos = frame
+                end = indptr[node + 1]
+                descended = False
+
+                while pos < end:
+                    neighbor = indices[pos]
+                    pos += 1
+                    if index[neighbor] < 0:
+                        # Descend into neighbor; resume this node at pos later
+                        frame[1] = pos
+                        index[neighbor] = lowlink[neighbor] = counter
+                        counter += 1
+                        scc_stack.append(neighbor)
+                        on_stack[neighbor] = True
+                        work_stack.append([neighbor, indptr[neighbor]])
+                        descended = True
+                        break
+                    if on_stack[neighbor] and index[neighbor] < lowlink[node]:
+                        lowlink[node] = index[neighbor]
+
+                if descended:
+                    continue
+
+                # All neighbors explored
+                work_stack.pop()
+                if work_stack:
+                    parent = work_stack[-1][0]
+                    if lowlink[node] < lowlink[parent]:
+                        lowlink[parent] = lowlink[node]
+
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = scc_stack.pop()
+                        on_stack[member] = False
+                        component.append(member)
+                        if member == node:
+                            break
+
+                    if len(component) > 1 or names[node] in self.graph.get(names[node], ()):
+                        component.reverse()
+                        components.append(component)
+
+        return components
+
+    def calculate_fan_metrics(self) -> Dict[str, Dict[str, float]]:
         """
         Calculate fan-in and fan-out metrics for each file.
 
+        Computed with a few whole-array numpy operations over the CSR arrays
+        when numpy is available, falling back to a per-file loop otherwise.
+
         Returns:
             Dict mapping file paths to {fan_in, fan_out, instability}
         """
-        metrics = {}
+        csr = self._ensure_finalized()
+        names = csr.names
+
+        # Instability metric: I = fan_out / (fan_in + fan_out)
+        # I = 0: maximally stable (many dependents, few dependencies)
+        # I = 1: maximally unstable (many dependencies, few dependents)
+        if _HAS_NUMPY:
+            indptr = np.frombuffer(csr.indptr, dtype=np.dtype(csr.indptr.typecode))
+            indices = np.frombuffer(csr.indices, dtype=np.dtype(csr.indices.typecode))
+
+            fan_out = np.diff(indptr)  # Dependencies
+            fan_in = np.bincount(indices, minlength=len(names))  # Dependents
+            total = fan_in + fan_out
+            instability = np.divide(fan_out, total, out=np.zeros(len(names)), where=total > 0)
+
+            return {
+                file: {
+                    "fan_in": file_fan_in,
+                    "fan_out": file_fan_out,
+                    "instability": round(file_instability, 3) if file_fan_in + file_fan_out else 0
+                }
+                for file, file_fan_in, file_fan_out, file_instability in zip(
+                    names, fan_in.tolist(), fan_out.tolist(), instability.tolist()
+                )
+            }
 
-        all_files = set(self.graph.keys()) | set(self.reverse_graph.keys())
+        indptr, rev_indptr = csr.indptr, csr.rev_indptr
+        metrics: Dict[str, Dict[str, float]] = {}
 
-        for file in all_files:
-            fan_out = len(self.graph.get(file, set()))  # Dependencies
-            fan_in = len(self.reverse_graph.get(file, set()))  # Dependents
+        for file_id, file in enumerate(names):
+            fan_out = indptr[file_id + 1] - indptr[file_id]  # Dependencies
+            fan_in = rev_indptr[file_id + 1] - rev_indptr[file_id]  # Dependents
 
-            # Instability metric: I = fan_out / (fan_in + fan_out)
-            # I = 0: maximally stable (many dependents, few dependencies)
-            # I = 1: maximally unstable (many dependencies, few dependents)
             total = fan_in + fan_out
             instability = fan_out / total if total > 0 else 0
 
@@ -95,23 +504,57 @@ class DependencyGraph:
         return metrics
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert graph to JSON-serializable dict."""
+        """
+        Convert graph to a dict for the JSON writers.
+
+        Adjacency sets are shared with the graph rather than copied; they are
+        serialized as lists by _write_json (see _json_default).
+        """
         return {
-            "dependencies": {k: list(v) for k, v in self.graph.items()},
-            "dependents": {k: list(v) for k, v in self.reverse_graph.items()},
+            "dependencies": self.graph,
+            "dependents": self.reverse_graph,
             "circular_dependencies": self.find_circular_dependencies(),
             "metrics": self.calculate_fan_metrics()
         }
 
 
+@dataclass(slots=True)
+class FuncRecord:
+    """Indexed function (slotted: no per-record dict or repeated key strings)."""
+    name: str
+    file: str
+    line: int = 0
+    end_line: int = 0
+    class_name: Optional[str] = None
+    qualname: str = ""
+    args: List[Any] = field(default_factory=list)
+    returns: Optional[str] = None
+    docstring: Optional[str] = None
+    complexity: Optional[Any] = None
+    reusability_score: Optional[float] = None
+    used_in: List[str] = field(default_factory=list)
+    usage_count: Optional[int] = 0
+    is_generic: bool = False
+    has_hardcoded_paths: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert record to a JSON-serializable dict (values are shared, not copied)."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
 class FunctionIndex:
     """Index of all functions with signatures and cross-references."""
 
-    def __init__(self):
-        self.functions: Dict[str, Dict[str, Any]] = {}
+    __slots__ = ("functions", "_version", "_topk_cache")
+
+    def __init__(self) -> None:
+        self.functions: Dict[str, FuncRecord] = {}
+        # Ranked subsets keyed by (ranking, limit, version); version bumps on add
+        self._version: int = 0
+        self._topk_cache: Dict[Tuple[str, int, int], List[FuncRecord]] = {}
 
     def add_function(self, file_path: str, func_info: Dict[str, Any],
-                    used_in_files: Set[str] = None):
+                    used_in_files: Optional[Set[str]] = None) -> None:
         """
         Add a function to the index.
 
@@ -120,55 +563,83 @@ class FunctionIndex:
             func_info: Function metadata (name, args, docstring, etc.)
             used_in_files: Set of files where this function is called
         """
-        func_id = f"{file_path}::{func_info['name']}"
-
-        self.functions[func_id] = {
-            "name": func_info["name"],
-            "file": file_path,
-            "line": func_info.get("lineno", 0),
-            "end_line": func_info.get("end_lineno", 0),
-            "class_name": func_info.get("class_name"),
-            "qualname": func_info.get("qualname", func_info["name"]),
-            "args": func_info.get("args", []),
-            "returns": func_info.get("returns"),
-            "docstring": func_info.get("docstring"),
-            "complexity": func_info.get("complexity"),
-            "reusability_score": func_info.get("reusability_score"),
-            "used_in": list(used_in_files) if used_in_files else [],
-            "usage_count": len(used_in_files) if used_in_files else 0,
-            "is_generic": func_info.get("is_generic_name", False),
-            "has_hardcoded_paths": func_info.get("has_hardcoded_paths", False)
-        }
+        # File paths repeat across functions and usage lists; share one string each
+        file_path = sys.intern(file_path)
+        name = func_info["name"]
+        func_id = f"{file_path}::{name}"
+        self._version += 1
+        self._topk_cache.clear()
+
+        self.functions[func_id] = FuncRecord(
+            name=name,
+            file=file_path,
+            line=func_info.get("lineno", 0),
+            end_line=func_info.get("end_lineno", 0),
+            class_name=func_info.get("class_name"),
+            qualname=func_info.get("qualname", name),
+            args=func_info.get("args", []),
+            returns=func_info.get("returns"),
+            docstring=func_info.get("docstring"),
+            complexity=func_info.get("complexity"),
+            reusability_score=func_info.get("reusability_score"),
+            used_in=[sys.intern(f) for f in used_in_files] if used_in_files else [],
+            usage_count=len(used_in_files) if used_in_files else 0,
+            is_generic=func_info.get("is_generic_name", False),
+            has_hardcoded_paths=func_info.get("has_hardcoded_paths", False)
+        )
 
     def get_function(self, func_id: str) -> Optional[Dict[str, Any]]:
         """Get function by ID (file::name)."""
-        return self.functions.get(func_id)
+        func = self.functions.get(func_id)
+        return func.to_dict() if func is not None else None
 
     def search_functions(self, query: str) -> List[Dict[str, Any]]:
         """Search functions by name (partial match)."""
         query_lower = query.lower()
         return [
-            func for func_id, func in self.functions.items()
-            if query_lower in func["name"].lower()
+            func.to_dict() for func in self.functions.values()
+            if query_lower in func.name.lower()
         ]
 
     def get_top_reusable(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get top N most reusable functions."""
-        sorted_funcs = sorted(
-            self.functions.values(),
-            key=lambda f: (f.get("reusability_score", 0), f.get("usage_count", 0)),
-            reverse=True
-        )
-        return sorted_funcs[:limit]
+        return [func.to_dict() for func in self._top_reusable(limit)]
 
     def get_most_used(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get top N most used functions."""
-        sorted_funcs = sorted(
-            self.functions.values(),
-            key=lambda f: f.get("usage_count", 0),
-            reverse=True
+        return [func.to_dict() for func in self._most_used(limit)]
+
+    def _top_reusable(self, limit: int) -> List[FuncRecord]:
+        """Get the top N most reusable function records."""
+        # `or 0` guards against None scores
+        return self._top_k(
+            "reusable", limit,
+            lambda f: (f.reusability_score or 0, f.usage_count or 0)
         )
-        return sorted_funcs[:limit]
+
+    def _most_used(self, limit: int) -> List[FuncRecord]:
+        """Get the top N most used function records."""
+        return self._top_k("most_used", limit, lambda f: f.usage_count or 0)
+
+    def _top_k(self, ranking: str, limit: int,
+               key: Callable[[FuncRecord], Any]) -> List[FuncRecord]:
+        """
+        Get the top N functions for a ranking, memoized until the next add.
+
+        Args:
+            ranking: Cache name of the ranking
+            limit: Number of functions to return
+            key: Sort key (larger ranks first)
+
+        Returns:
+            New list of the top records (nlargest keeps sorted()'s tie order)
+        """
+        cache_key = (ranking, limit, self._version)
+        top = self._topk_cache.get(cache_key)
+        if top is None:
+            top = heapq.nlargest(limit, self.functions.values(), key=key)
+            self._topk_cache[cache_key] = top
+        return list(top)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert index to JSON-serializable dict."""
@@ -176,7 +647,7 @@ class FunctionIndex:
             "total_functions": len(self.functions),
             "top_reusable": self.get_top_reusable(10),
             "most_used": self.get_most_used(10),
-            "functions": self.functions
+            "functions": {func_id: func.to_dict() for func_id, func in self.functions.items()}
         }
 
 
@@ -185,175 +656,287 @@ class ScriptCardGenerator:
 
     @staticmethod
     def generate_card(file_info: Dict[str, Any], dep_graph: DependencyGraph,
-                     func_index: FunctionIndex) -> str:
+                      timestamp: Optional[str] = None) -> str:
         """
         Generate a script card for a single file.
 
         Args:
             file_info: File analysis data
             dep_graph: Dependency graph
-            func_index: Function index
+            timestamp: Footer timestamp (default: current time)
 
         Returns:
             Markdown content for the script card
         """
+        file_path = file_info.get("file_rel", "unknown")
+        dependencies = dep_graph.get_dependencies(file_path)
+        dependents = dep_graph.get_dependents(file_path)
+
+        return ScriptCardGenerator.render_card(
+            file_info,
+            _card_listing(dependencies), _card_listing(dependents),
+            len(dependencies), len(dependents),
+            timestamp=timestamp
+        )
+
+    @staticmethod
+    def render_card(file_info: Dict[str, Any], dependencies: List[str],
+                    dependents: List[str], dependencies_count: Optional[int] = None,
+                    dependents_count: Optional[int] = None,
+                    timestamp: Optional[str] = None) -> str:
+        """
+        Render a script card from plain data.
+
+        Takes no graph objects so it can run in worker processes. Only the
+        first CARD_LISTING_LIMIT entries of each list are shown, so callers
+        may pass pre-truncated lists along with the full counts.
+
+        Args:
+            file_info: File analysis data
+            dependencies: Sorted files imported by this file (may be truncated)
+            dependents: Sorted files importing this file (may be truncated)
+            dependencies_count: Total number of imported files (default: len(dependencies))
+            dependents_count: Total number of importing files (default: len(dependents))
+            timestamp: Footer timestamp; pass one string for a whole batch
+                       (default: current time)
+
+        Returns:
+            Markdown content for the script card
+        """
+        if dependencies_count is None:
+            dependencies_count = len(dependencies)
+        if dependents_count is None:
+            dependents_count = len(dependents)
+        if timestamp is None:
+            timestamp = datetime.now().strftime(CARD_TIMESTAMP_FORMAT)
+
         file_path = file_info.get("file_rel", "unknown")
         file_name = Path(file_path).name
 
-        # Build card
-        card = f"# {file_name}\n\n"
+        # Build card (parts joined once at the end)
+        parts: List[str] = [f"# {file_name}\n\n"]
 
         # Overview
-        card += "## Overview\n\n"
-        card += f"**Path**: `{file_path}`  \n"
-        card += f"**Size**: {file_info.get('size_kb', 0):.1f} KB  \n"
-        card += f"**Lines**: {file_info.get('lines', 0)}  \n"
-        card += f"**Modified**: {file_info.get('mtime', 'unknown')}  \n"
-        card += "\n"
+        parts.append("## Overview\n\n")
+        parts.append(f"**Path**: `{file_path}`  \n")
+        parts.append(f"**Size**: {file_info.get('size_kb', 0):.1f} KB  \n")
+        parts.append(f"**Lines**: {file_info.get('lines', 0)}  \n")
+        parts.append(f"**Modified**: {file_info.get('mtime', 'unknown')}  \n")
+        parts.append("\n")
 
         # Metadata
         metadata = file_info.get("metadata", {})
         if metadata.get("owner") or metadata.get("atype"):
-            card += "## Metadata\n\n"
+            parts.append("## Metadata\n\n")
             if metadata.get("owner"):
-                card += f"**Owner**: {metadata['owner']}  \n"
+                parts.append(f"**Owner**: {metadata['owner']}  \n")
             if metadata.get("atype"):
-                card += f"**Type**: {metadata['atype']}  \n"
+                parts.append(f"**Type**: {metadata['atype']}  \n")
             if metadata.get("category_name"):
-                card += f"**Category**: {metadata['category_name']}  \n"
-            card += "\n"
+                parts.append(f"**Category**: {metadata['category_name']}  \n")
+            parts.append("\n")
 
         # Module docstring
         docstring = file_info.get("docstring")
         if docstring:
-            card += "## Description\n\n"
-            card += f"{docstring}\n\n"
+            parts.append("## Description\n\n")
+            parts.append(f"{docstring}\n\n")
 
         # Dependencies
-        dependencies = dep_graph.get_dependencies(file_path)
-        dependents = dep_graph.get_dependents(file_path)
-
-        if dependencies or dependents:
-            card += "## Dependencies\n\n"
-
-            if dependencies:
-                card += f"**Imports** ({len(dependencies)} files):  \n"
-                for dep in sorted(dependencies)[:10]:
-                    card += f"- `{dep}`\n"
-                if len(dependencies) > 10:
-                    card += f"- _{len(dependencies) - 10} more..._\n"
-                card += "\n"
-
-            if dependents:
-                card += f"**Imported by** ({len(dependents)} files):  \n"
-                for dep in sorted(dependents)[:10]:
-                    card += f"- `{dep}`\n"
-                if len(dependents) > 10:
-                    card += f"- _{len(dependents) - 10} more..._\n"
-                card += "\n"
+        if dependencies_count or dependents_count:
+            parts.append("## Dependencies\n\n")
+
+            if dependencies_count:
+                parts.append(f"**Imports** ({dependencies_count} files):  \n")
+                for dep in dependencies[:CARD_LISTING_LIMIT]:
+                    parts.append(f"- `{dep}`\n")
+                if dependencies_count > CARD_LISTING_LIMIT:
+                    parts.append(f"- _{dependencies_count - CARD_LISTING_LIMIT} more..._\n")
+                parts.append("\n")
+
+            if dependents_count:
+                parts.append(f"**Imported by** ({dependents_count} files):  \n")
+                for dep in dependents[:CARD_LISTING_LIMIT]:
+                    parts.append(f"- `{dep}`\n")
+                if dependents_count > CARD_LISTING_LIMIT:
+                    parts.append(f"- _{dependents_count - CARD_LISTING_LIMIT} more..._\n")
+                parts.append("\n")
 
         # Functions
         functions = file_info.get("functions", [])
         if functions:
-            card += f"## Functions ({len(functions)})\n\n"
+            parts.append(f"## Functions ({len(functions)})\n\n")
 
             for func in functions[:20]:  # Limit to first 20
                 func_name = func.get("name", "unknown")
                 args = func.get("args", [])
                 args_str = ", ".join(args) if args else ""
 
-                card += f"### `{func_name}({args_str})`\n\n"
+                parts.append(f"### `{func_name}({args_str})`\n\n")
 
-                if func.get("docstring"):
-                    card += f"{func['docstring'][:200]}...\n\n" if len(func.get("docstring", "")) > 200 else f"{func['docstring']}\n\n"
+                func_doc = func.get("docstring")
+                if func_doc:
+                    parts.append(f"{func_doc[:200]}...\n\n" if len(func_doc) > 200 else f"{func_doc}\n\n")
 
-                card += f"**Line**: {func.get('lineno', 0)}  \n"
+                parts.append(f"**Line**: {func.get('lineno', 0)}  \n")
 
                 if func.get("complexity"):
-                    card += f"**Complexity**: {func['complexity']}  \n"
+                    parts.append(f"**Complexity**: {func['complexity']}  \n")
 
                 if func.get("reusability_score"):
-                    card += f"**Reusability**: {func['reusability_score']}/15  \n"
+                    parts.append(f"**Reusability**: {func['reusability_score']}/15  \n")
 
                 used_in = func.get("used_in_files", set())
                 if used_in:
-                    card += f"**Used in**: {len(used_in)} files  \n"
+                    parts.append(f"**Used in**: {len(used_in)} files  \n")
 
-                card += "\n"
+                parts.append("\n")
 
             if len(functions) > 20:
-                card += f"_... and {len(functions) - 20} more functions_\n\n"
+                parts.append(f"_... and {len(functions) - 20} more functions_\n\n")
 
         # Classes
         classes = file_info.get("classes", [])
         if classes:
-            card += f"## Classes ({len(classes)})\n\n"
+            parts.append(f"## Classes ({len(classes)})\n\n")
 
             for cls in classes[:10]:
                 cls_name = cls.get("name", "unknown")
-                card += f"### `{cls_name}`\n\n"
+                parts.append(f"### `{cls_name}`\n\n")
 
-                if cls.get("docstring"):
-                    card += f"{cls['docstring'][:200]}...\n\n" if len(cls.get("docstring", "")) > 200 else f"{cls['docstring']}\n\n"
+                cls_doc = cls.get("docstring")
+                if cls_doc:
+                    parts.append(f"{cls_doc[:200]}...\n\n" if len(cls_doc) > 200 else f"{cls_doc}\n\n")
 
                 methods = cls.get("methods", [])
                 if methods:
-                    card += f"**Methods**: {len(methods)}  \n"
+                    parts.append(f"**Methods**: {len(methods)}  \n")
                     for method in methods[:5]:
-                        card += f"- `{method.get('name', 'unknown')}`\n"
+                        parts.append(f"- `{method.get('name', 'unknown')}`\n")
                     if len(methods) > 5:
-                        card += f"- _{len(methods) - 5} more..._\n"
+                        parts.append(f"- _{len(methods) - 5} more..._\n")
 
-                card += "\n"
+                parts.append("\n")
 
         # Issues
         issues = file_info.get("issues", [])
         if issues:
-            card += f"## Issues ({len(issues)})\n\n"
+            parts.append(f"## Issues ({len(issues)})\n\n")
             for issue in issues[:10]:
-                card += f"- ⚠️ {issue}\n"
+                parts.append(f"- ⚠️ {issue}\n")
             if len(issues) > 10:
-                card += f"- _{len(issues) - 10} more issues..._\n"
-            card += "\n"
+                parts.append(f"- _{len(issues) - 10} more issues..._\n")
+            parts.append("\n")
 
         # Footer
-        card += "---\n"
-        card += f"*Generated by Pulsus Repository Analyzer*  \n"
-        card += f"*{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n"
+        parts.append("---\n")
+        parts.append(f"*Generated by Pulsus Repository Analyzer*  \n")
+        parts.append(f"*{timestamp}*\n")
+
+        return "".join(parts)
+
+
+def _render_card_bytes(payload: Tuple[Dict[str, Any], List[str], List[str], int, int, str, str]
+                       ) -> Tuple[str, bytes]:
+    """
+    Render one script card to UTF-8 bytes.
+
+    Args:
+        payload: (file_info, dependencies, dependents, dependencies_count,
+                  dependents_count, card_path, timestamp)
+
+    Returns:
+        Tuple of (card path, encoded card content)
+    """
+    (file_info, dependencies, dependents, dependencies_count, dependents_count,
+     card_path, timestamp) = payload
+    card_content = ScriptCardGenerator.render_card(
+        file_info, dependencies, dependents, dependencies_count, dependents_count,
+        timestamp=timestamp
+    )
+    # Pre-encoded bytes: one write per card, LF line endings on every platform
+    return card_path, card_content.encode('utf-8')
 
-        return card
+
+def _write_card_bytes(rendered: Tuple[str, bytes]) -> None:
+    """Write a rendered script card (thread pool worker)."""
+    card_path, content = rendered
+    Path(card_path).write_bytes(content)
+
+
+def _write_card(payload: Tuple[Dict[str, Any], List[str], List[str], int, int, str, str]) -> None:
+    """
+    Render and write one script card (process pool worker).
+
+    Args:
+        payload: (file_info, dependencies, dependents, dependencies_count,
+                  dependents_count, card_path, timestamp)
+    """
+    _write_card_bytes(_render_card_bytes(payload))
 
 
 class PulseGenerator:
     """Main class for generating all .pulse/ outputs."""
 
     @staticmethod
-    def generate_imports_graph(analysis_data: Dict[str, Any], output_path: Path) -> bool:
+    def _build_structures(files: List[Dict[str, Any]]) -> Tuple[DependencyGraph, FunctionIndex]:
+        """
+        Build the dependency graph and function index in a single pass.
+
+        Args:
+            files: File analysis entries from the repository analysis
+
+        Returns:
+            Tuple of (dependency graph, function index)
+        """
+        dep_graph = DependencyGraph()
+        func_index = FunctionIndex()
+        edges: List[Tuple[str, str]] = []
+
+        # Raw path -> normalized, interned path; popular imports are resolved once
+        path_table: Dict[str, str] = {}
+
+        def normalize(path: str) -> str:
+            normalized = path_table.get(path)
+            if normalized is None:
+                normalized = path_table[path] = _normalize_path(path)
+            return normalized
+
+        for file_info in files:
+            file_rel = normalize(file_info.get("file_rel", ""))
+
+            # Collect local imports as dependencies
+            edges.extend((file_rel, normalize(local_import))
+                         for local_import in file_info.get("imports_local", []))
+
+            # Add functions
+            for func in file_info.get("functions", []):
+                used_in_files = {normalize(f) for f in func.get("used_in_files", [])}
+                func_index.add_function(file_rel, func, used_in_files)
+
+        dep_graph.add_dependencies_bulk(edges)
+        return dep_graph, func_index
+
+    @staticmethod
+    def generate_imports_graph(analysis_data: Dict[str, Any], output_path: Path,
+                               dep_graph: Optional[DependencyGraph] = None) -> bool:
         """
         Generate imports_graph.json from repository analysis.
 
         Args:
             analysis_data: Repository analysis results
             output_path: Path to save imports_graph.json
+            dep_graph: Prebuilt dependency graph (built from analysis_data if omitted)
 
         Returns:
             True if generated successfully
         """
         try:
-            dep_graph = DependencyGraph()
+            if dep_graph is None:
+                dep_graph, _ = PulseGenerator._build_structures(analysis_data.get("files", []))
 
-            files = analysis_data.get("files", [])
             repo_root = Path(analysis_data.get("repository", "."))
 
-            # Build dependency graph
-            for file_info in files:
-                file_rel = file_info.get("file_rel", "")
-
-                # Add local imports as dependencies
-                for local_import in file_info.get("imports_local", []):
-                    # Try to resolve import to actual file
-                    dep_graph.add_dependency(file_rel, local_import)
-
             # Save to JSON
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -361,8 +944,7 @@ class PulseGenerator:
             graph_data["generated_at"] = datetime.now().isoformat()
             graph_data["repository"] = str(repo_root)
 
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(graph_data, f, indent=2)
+            _write_json(output_path, graph_data)
 
             return True
 
@@ -371,29 +953,22 @@ class PulseGenerator:
             return False
 
     @staticmethod
-    def generate_functions_index(analysis_data: Dict[str, Any], output_path: Path) -> bool:
+    def generate_functions_index(analysis_data: Dict[str, Any], output_path: Path,
+                                 func_index: Optional[FunctionIndex] = None) -> bool:
         """
         Generate functions_index.json from repository analysis.
 
         Args:
             analysis_data: Repository analysis results
             output_path: Path to save functions_index.json
+            func_index: Prebuilt function index (built from analysis_data if omitted)
 
         Returns:
             True if generated successfully
         """
         try:
-            func_index = FunctionIndex()
-
-            files = analysis_data.get("files", [])
-
-            # Build function index
-            for file_info in files:
-                file_rel = file_info.get("file_rel", "")
-
-                for func in file_info.get("functions", []):
-                    used_in_files = set(func.get("used_in_files", []))
-                    func_index.add_function(file_rel, func, used_in_files)
+            if func_index is None:
+                _, func_index = PulseGenerator._build_structures(analysis_data.get("files", []))
 
             # Save to JSON
             output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -402,8 +977,7 @@ class PulseGenerator:
             index_data["generated_at"] = datetime.now().isoformat()
             index_data["repository"] = analysis_data.get("repository", ".")
 
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(index_data, f, indent=2)
+            _write_json(output_path, index_data)
 
             return True
 
@@ -412,98 +986,191 @@ class PulseGenerator:
             return False
 
     @staticmethod
-    def generate_script_cards(analysis_data: Dict[str, Any], output_dir: Path) -> int:
+    def generate_script_cards(analysis_data: Dict[str, Any], output_dir: Path,
+                              dep_graph: Optional[DependencyGraph] = None,
+                              func_index: Optional[FunctionIndex] = None,
+                              incremental: bool = True,
+                              stats: Optional[Dict[str, int]] = None) -> int:
         """
         Generate script cards for all files.
 
+        With incremental generation, the inputs of every card are hashed and
+        compared to the manifest of the previous run; cards whose inputs are
+        unchanged (and still exist) are not rewritten and keep their old
+        footer timestamp.
+
         Args:
             analysis_data: Repository analysis results
             output_dir: Directory to save script cards (.pulse/cards/)
+            dep_graph: Prebuilt dependency graph (built from analysis_data if omitted)
+            func_index: Prebuilt function index (built from analysis_data if omitted)
+            incremental: Skip cards whose inputs did not change (default: True)
+            stats: Optional dict filled with 'written' and 'skipped' card counts
 
         Returns:
-            Number of cards generated
+            Number of cards generated (written or already up to date)
         """
         try:
-            # Build dependency graph and function index
-            dep_graph = DependencyGraph()
-            func_index = FunctionIndex()
-
             files = analysis_data.get("files", [])
 
-            # Build structures
-            for file_info in files:
-                file_rel = file_info.get("file_rel", "")
-
-                # Add dependencies
-                for local_import in file_info.get("imports_local", []):
-                    dep_graph.add_dependency(file_rel, local_import)
-
-                # Add functions
-                for func in file_info.get("functions", []):
-                    used_in_files = set(func.get("used_in_files", []))
-                    func_index.add_function(file_rel, func, used_in_files)
-
-            # Generate cards
+            # Build dependency graph and function index
+            if dep_graph is None or func_index is None:
+                built_graph, built_index = PulseGenerator._build_structures(files)
+                if dep_graph is None:
+                    dep_graph = built_graph
+                if func_index is None:
+                    func_index = built_index
+
+            # Prepare one self-contained payload per card
             output_dir.mkdir(parents=True, exist_ok=True)
-            cards_generated = 0
+            manifest_path = output_dir / CARD_MANIFEST_NAME
+            previous_hashes = _load_card_manifest(manifest_path) if incremental else {}
+            card_hashes: Dict[str, str] = {}
+            payloads = []
+            skipped = 0
+            seen_dirs: Set[Path] = {output_dir}
+            timestamp = datetime.now().strftime(CARD_TIMESTAMP_FORMAT)
 
             for file_info in files:
-                file_rel = file_info.get("file_rel", "")
+                file_rel = _normalize_path(file_info.get("file_rel", ""))
 
                 # Create card path maintaining directory structure
                 rel_path = Path(file_rel)
                 card_path = output_dir / rel_path.with_suffix('.md')
 
-                # Ensure parent directory exists
-                card_path.parent.mkdir(parents=True, exist_ok=True)
+                # Only the listed slice is sorted and shipped to the renderer
+                dependencies = dep_graph.get_dependencies(file_rel)
+                dependents = dep_graph.get_dependents(file_rel)
+                dependencies_listed = _card_listing(dependencies)
+                dependents_listed = _card_listing(dependents)
+
+                # Skip cards whose inputs match the previous run
+                card_hash = _card_hash((
+                    _CARD_FORMAT_VERSION, _card_inputs(file_info), dependencies_listed, dependents_listed,
+                    len(dependencies), len(dependents)
+                ))
+                if card_hash is not None:
+                    card_hashes[file_rel] = card_hash
+                    if previous_hashes.get(file_rel) == card_hash and card_path.exists():
+                        skipped += 1
+                        continue
+
+                # Ensure parent directory exists (once per directory)
+                card_dir = card_path.parent
+                if card_dir not in seen_dirs:
+                    card_dir.mkdir(parents=True, exist_ok=True)
+                    seen_dirs.add(card_dir)
+
+                payloads.append((
+                    file_info,
+                    dependencies_listed,
+                    dependents_listed,
+                    len(dependencies),
+                    len(dependents),
+                    str(card_path),
+                    timestamp
+                ))
+
+            # Render and write cards
+            PulseGenerator._write_cards(payloads)
+            _write_json(manifest_path, card_hashes)
+
+            if stats is not None:
+                stats["written"] = len(payloads)
+                stats["skipped"] = skipped
+
+            return len(payloads) + skipped
 
-                # Generate card content
-                card_content = ScriptCardGenerator.generate_card(
-                    file_info, dep_graph, func_index
-                )
+        except Exception as e:
+            print(f"[pulse_generator] Error generating script cards: {e}")
+            return 0
 
-                # Write card
-                with open(card_path, 'w', encoding='utf-8') as f:
-                    f.write(card_content)
+    @staticmethod
+    def _write_cards(payloads: List[Tuple[Dict[str, Any], List[str], List[str], int, int, str, str]]) -> None:
+        """
+        Render and write script cards, in a process pool for large batches.
 
-                cards_generated += 1
+        If no process pool can be started, large batches are rendered here
+        and their files written from a thread pool, so writes overlap on the
+        disk queue instead of running one after another.
 
-            return cards_generated
+        Args:
+            payloads: Card payloads as taken by _write_card
+        """
+        if len(payloads) < _PARALLEL_CARDS_MIN_FILES:
+            for payload in payloads:
+                _write_card(payload)
+            return
 
-        except Exception as e:
-            print(f"[pulse_generator] Error generating script cards: {e}")
-            return 0
+        try:
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                for _ in executor.map(_write_card, payloads, chunksize=16):
+                    pass
+            return
+        except (OSError, BrokenProcessPool, pickle.PicklingError) as e:
+            print(f"[pulse_generator] Process pool unavailable ({e}), writing cards from threads")
+
+        with ThreadPoolExecutor() as executor:
+            # Bounded batches keep at most _CARD_WRITE_BATCH rendered cards in memory
+            for start in range(0, len(payloads), _CARD_WRITE_BATCH):
+                rendered = [_render_card_bytes(payload)
+                            for payload in payloads[start:start + _CARD_WRITE_BATCH]]
+                for _ in executor.map(_write_card_bytes, rendered):
+                    pass
 
     @staticmethod
-    def generate_all(analysis_data: Dict[str, Any], pulse_dir: Path) -> Dict[str, bool]:
+    def generate_all(analysis_data: Dict[str, Any], pulse_dir: Path) -> Dict[str, Any]:
         """
         Generate all .pulse/ outputs from analysis data.
 
+        The dependency graph and function index are built once and shared
+        by all three outputs.
+
         Args:
             analysis_data: Repository analysis results
             pulse_dir: Path to .pulse/ directory
 
         Returns:
-            Dict with generation status for each output type
+            Dict with generation status for each output type (all False
+            when the analysis data cannot be indexed) and card counts
         """
-        results = {}
+        results: Dict[str, Any] = {}
+
+        try:
+            dep_graph, func_index = PulseGenerator._build_structures(analysis_data.get("files", []))
+        except Exception as e:
+            print(f"[pulse_generator] Error building dependency graph and function index: {e}")
+            return {
+                "imports_graph": False,
+                "functions_index": False,
+                "script_cards": False,
+                "cards_generated": 0,
+                "cards_written": 0,
+                "cards_skipped": 0,
+            }
 
         # Generate imports graph
         imports_graph_path = pulse_dir / "imports_graph.json"
         results["imports_graph"] = PulseGenerator.generate_imports_graph(
-            analysis_data, imports_graph_path
+            analysis_data, imports_graph_path, dep_graph=dep_graph
         )
 
         # Generate functions index
         functions_index_path = pulse_dir / "functions_index.json"
         results["functions_index"] = PulseGenerator.generate_functions_index(
-            analysis_data, functions_index_path
+            analysis_data, functions_index_path, func_index=func_index
         )
 
         # Generate script cards
         cards_dir = pulse_dir / "cards"
-        cards_count = PulseGenerator.generate_script_cards(analysis_data, cards_dir)
+        card_stats: Dict[str, int] = {}
+        cards_count = PulseGenerator.generate_script_cards(
+            analysis_data, cards_dir, dep_graph=dep_graph, func_index=func_index,
+            stats=card_stats
+        )
         results["script_cards"] = cards_count > 0
         results["cards_generated"] = cards_count
+        results["cards_written"] = card_stats.get("written", 0)
+        results["cards_skipped"] = card_stats.get("skipped", 0)
 
         return results
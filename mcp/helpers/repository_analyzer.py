@@ -15,36 +15,84 @@ Author: Adapted for MCP by Testudo Framework
 from __future__ import annotations
 
 import ast
-import os
 import sys
 import re
 import json
+import hashlib
+import heapq
+import importlib.util
+import os
+import pickle
+import tokenize
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
+from itertools import repeat
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple, Any
+from typing import Dict, Iterable, Iterator, List, Optional, Pattern, Set, Tuple, Any
 from collections import defaultdict, Counter
 from datetime import datetime
 
-# Optional dependencies
+# Optional dependencies (openpyxl is heavy: checked here, imported on export)
+_HAS_OPENPYXL = importlib.util.find_spec("openpyxl") is not None
+
 try:
-    from radon.complexity import cc_visit
-    _HAS_RADON = True
+    import orjson
+    _HAS_ORJSON = True
 except Exception:
-    _HAS_RADON = False
+    _HAS_ORJSON = False
 
 try:
-    from openpyxl import Workbook
-    from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
-    from openpyxl.chart import BarChart, Reference, PieChart
-    from openpyxl.utils import get_column_letter
-    _HAS_OPENPYXL = True
+    from blake3 import blake3
+    _HAS_BLAKE3 = True
 except Exception:
-    _HAS_OPENPYXL = False
+    _HAS_BLAKE3 = False
+
+# Patterns ignored when the caller passes none (also RepositoryManager's default)
+DEFAULT_IGNORE_PATTERNS = [
+    "__pycache__", ".venv", "venv", ".git", "build", "dist",
+    "node_modules", "test", "tests", ".pytest_cache"
+]
+
+# Repositories with fewer files are scanned in-process (pool startup dominates)
+_PARALLEL_SCAN_MIN_FILES = 50
+
+# Markdown-style "## Title" sections of a module docstring
+_SECTION_RE = re.compile(r"##\s+(.*?)\n(.*?)(?=\n##\s+|$)", re.DOTALL | re.IGNORECASE)
+
+# Hardcoded absolute paths (Windows drives, common POSIX roots) in function code
+_HARDCODED_RE = re.compile(r"C:\\|/home/|/usr/|D:\\")
+
+# Verb prefixes that mark a function name as a generic, reusable helper
+_GENERIC_PREFIX_RE = re.compile(
+    r"(?:get|set|load|save|read|write|parse|format|convert|validate|check|calculate|"
+    r"process|update|create|delete|find|search|filter|sort|clean|transform|generate|"
+    r"build|export|import|extract)_",
+    re.IGNORECASE,
+)
+
+# Environment variable enabling the parse cache when no cache_dir is given.
+# The cache is opt-in: entries are pickles, so the directory must only be
+# writable by users trusted to run code in the analyzing process.
+AST_CACHE_DIR_ENV = "PULSUS_AST_CACHE_DIR"
+
+# Bump when _ASTVisitor or the cached per-file results change
+_AST_CACHE_VERSION = 7
+
+# Content digest algorithm (no cryptographic need: change detection only)
+_HASH_ALGO = "blake3" if _HAS_BLAKE3 else "sha256"
+
+# Bump when the layout of ScanManifest entries changes
+_MANIFEST_VERSION = 1
+
+# Manifest entry of one file: [mtime_ns, size, content digest, line count]
+ManifestEntry = List[Any]
 
 
 # --- Data structures ---
 
-@dataclass
+@dataclass(slots=True)
 class FunctionInfo:
     """Information about a function in a file."""
     file_rel: str
@@ -61,9 +109,12 @@ class FunctionInfo:
     used_in_files: Set[str] = field(default_factory=set)
     has_hardcoded_paths: bool = False
     is_generic_name: bool = False
+    # Reusability points from the function alone (cached with the parse);
+    # points for use across files are added per analysis
+    base_score: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ClassInfo:
     """Information about a class in a file."""
     file_rel: str
@@ -74,7 +125,7 @@ class ClassInfo:
     methods: List[FunctionInfo] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class FileInfo:
     """Complete information about a Python file."""
     file_rel: str
@@ -109,6 +160,183 @@ class FileInfo:
     naming_valid: bool = True
 
 
+def _json_dumps(obj: Any) -> bytes:
+    """
+    Serialize data as compact UTF-8 JSON.
+
+    Uses orjson when available (serializes straight to bytes in C),
+    falling back to the stdlib json module.
+    """
+    if _HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes (orjson when available); invalid data raises ValueError."""
+    if _HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _substring_matcher(patterns: Iterable[str]) -> Optional[Pattern[str]]:
+    """
+    Compile substrings into one regex that finds any of them.
+
+    Args:
+        patterns: Substrings to look for (matched against lowercased text)
+
+    Returns:
+        Compiled alternation, or None when there are no patterns
+    """
+    alternatives = [re.escape(p.lower()) for p in patterns]
+    return re.compile("|".join(alternatives)) if alternatives else None
+
+
+class AstCache:
+    """
+    Content-addressed on-disk cache of per-file parse results.
+
+    Entries hold everything _analyze_file derives from a file's content
+    (header metadata, docstring sections, functions, classes, calls and
+    imports), so unchanged files skip ast.parse on later runs. Keys are
+    derived from the digest of the raw file bytes (BLAKE3 when the blake3
+    package is installed, else SHA-256) plus the cache and Python versions;
+    entries are pickles written atomically. Loading a pickle can run code,
+    so the cache directory is a trust boundary and never defaults to a
+    location inside the analyzed repository.
+    """
+
+    _KEY_PREFIX = (
+        f"{_AST_CACHE_VERSION}|{sys.version_info[0]}.{sys.version_info[1]}|{_HASH_ALGO}\n"
+    ).encode("ascii")
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = Path(cache_dir)
+
+    @staticmethod
+    def digest(data: bytes) -> str:
+        """Get the content digest of a file's raw bytes."""
+        if _HAS_BLAKE3:
+            return blake3(data).hexdigest()
+        return hashlib.sha256(data).hexdigest()
+
+    @classmethod
+    def key_for(cls, digest: str, skip_bodies: bool = False) -> str:
+        """Get the cache key of a content digest (per analysis mode)."""
+        key = hashlib.sha256(cls._KEY_PREFIX)
+        if skip_bodies:
+            key.update(b"skip_bodies\n")
+        key.update(digest.encode("ascii"))
+        return key.hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.pkl"
+
+    def get(self, key: str) -> Optional[Tuple[Any, ...]]:
+        """Load a cached entry (None if missing or unreadable)."""
+        try:
+            with open(self._entry_path(key), "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # Corrupt or incompatible entry: treat as a miss, it gets rewritten
+            return None
+
+    def put(self, key: str, value: Tuple[Any, ...]) -> None:
+        """Store an entry; failures (e.g. read-only cache dir) are ignored."""
+        path = self._entry_path(key)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except (OSError, pickle.PicklingError):
+            pass
+
+
+class ScanManifest:
+    """
+    Per-repository record of file stats and content digests.
+
+    A rescan trusts files whose mtime and size match their entry: the digest
+    (and so the parse-cache key) is taken from the manifest, and the file is
+    neither read nor hashed. Manifests are JSON files kept in the parse cache
+    directory, one per repository root, so analysis never writes into the
+    analyzed repository. A manifest written with another digest algorithm
+    is ignored, so every file is hashed again.
+    """
+
+    def __init__(self, cache_dir: Path, root: Path):
+        root_id = hashlib.sha256(str(root).encode("utf-8")).hexdigest()[:16]
+        self.path = Path(cache_dir) / "manifests" / f"{root_id}.json"
+        self.root = str(root)
+
+    def load(self) -> Dict[str, ManifestEntry]:
+        """Load entries by file path (empty if missing, stale or unreadable)."""
+        try:
+            with open(self.path, "rb") as f:
+                data = _json_loads(f.read())
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != _MANIFEST_VERSION \
+                or data.get("root") != self.root or data.get("hash_algo") != _HASH_ALGO:
+            return {}
+        return data.get("files", {})
+
+    def save(self, entries: Dict[str, ManifestEntry]) -> None:
+        """
+        Store entries atomically; failures (e.g. read-only cache dir) are ignored.
+
+        Each process writes and syncs its own temporary file, then renames it
+        over the manifest, so readers and concurrent writers only ever see a
+        complete manifest (the last writer's).
+        """
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        data = {"version": _MANIFEST_VERSION, "root": self.root, "hash_algo": _HASH_ALGO,
+                "files": entries}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(_json_dumps(data))
+                # On disk before the rename, so a crash never leaves a
+                # truncated manifest in place
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+
+def _analyze_file_worker(path_str: str, root_str: str, cache_dir: Optional[str] = None,
+                         skip_bodies: bool = False) -> Optional[Tuple[FileInfo, ManifestEntry]]:
+    """
+    Analyze one file for the scan pool (module-level so it can be pickled).
+
+    Args:
+        path_str: Path of the Python file
+        root_str: Repository root
+        cache_dir: Parse cache directory (None disables the cache)
+        skip_bodies: Do not walk function bodies (see _analyze_file)
+
+    Returns:
+        (FileInfo, manifest entry), or None if the file could not be analyzed
+    """
+    try:
+        cache = AstCache(Path(cache_dir)) if cache_dir else None
+        return RepositoryAnalyzer._analyze_file_entry(
+            Path(path_str), Path(root_str), cache, skip_bodies
+        )
+    except Exception as e:
+        print(f"Warning: Failed to analyze {path_str}: {e}")
+        return None
+
+
 class RepositoryAnalyzer:
     """
     Comprehensive repository analyzer with MCP integration.
@@ -120,8 +348,23 @@ class RepositoryAnalyzer:
     - Report generation (Excel, HTML)
     """
 
-    def __init__(self):
+    def __init__(self, cache_dir: Optional[str] = None, use_cache: bool = True):
+        """
+        Initialize the analyzer.
+
+        Args:
+            cache_dir: Parse cache directory (default: $PULSUS_AST_CACHE_DIR;
+                without either, parse results are not cached)
+            use_cache: Reuse parse results of unchanged files across runs
+        """
         self.stdlibs = self._get_standard_libs()
+        self.cache_dir: Optional[Path] = None
+        if use_cache:
+            cache_dir = cache_dir or os.environ.get(AST_CACHE_DIR_ENV)
+            self.cache_dir = Path(cache_dir) if cache_dir else None
+        # Manifest entries of the last scan, so validate_file can serve files
+        # unchanged since then from the parse cache without reading them
+        self._scanned: Dict[str, ManifestEntry] = {}
 
     def _get_standard_libs(self) -> Set[str]:
         """Get a set of standard library module names."""
@@ -140,16 +383,25 @@ class RepositoryAnalyzer:
             "urllib", "uuid", "warnings", "xml", "zipfile"
         }
 
-    def analyze_repository(self, repo_path: str, ignore_patterns: Optional[List[str]] = None) -> Dict[str, Any]:
+    def analyze_repository(self, repo_path: str, ignore_patterns: Optional[List[str]] = None,
+                           skip_bodies: bool = False,
+                           output_json_path: Optional[str] = None) -> Dict[str, Any]:
         """
         Analyze a Python repository.
 
         Args:
             repo_path: Path to repository root
             ignore_patterns: Optional list of patterns to ignore (e.g., ['test', '__pycache__'])
+            skip_bodies: Fast structural pass that records functions, classes
+                and imports without walking function bodies. Complexity is not
+                computed and calls made inside functions are not collected, so
+                unused-function detection and reusability scores are shallow.
+            output_json_path: Stream the full result to this JSON file, one
+                file entry at a time, instead of returning the "files" list
 
         Returns:
-            Dictionary with analysis results
+            Dictionary with analysis results (without "files" and with
+            "output_json_path" when the result was written to disk)
         """
         root = Path(repo_path).resolve()
 
@@ -159,13 +411,10 @@ class RepositoryAnalyzer:
                 "error": f"Path is not a directory: {repo_path}"
             }
 
-        ignore_patterns = ignore_patterns or [
-            "__pycache__", ".venv", "venv", ".git", "build", "dist",
-            "node_modules", "test", "tests"
-        ]
+        ignore_patterns = ignore_patterns or list(DEFAULT_IGNORE_PATTERNS)
 
         # Scan all Python files
-        files = self._scan_files(root, ignore_patterns)
+        files = self._scan_files(root, ignore_patterns, skip_bodies)
 
         if not files:
             return {
@@ -189,16 +438,123 @@ class RepositoryAnalyzer:
         # Generate summary statistics
         stats = self._generate_statistics(files)
 
-        return {
+        result = {
             "success": True,
             "repository": str(root),
             "files_analyzed": len(files),
             "statistics": stats,
-            "files": [self._file_to_dict(f) for f in files],
+            "files": None,
             "issues_summary": self._summarize_issues(files),
             "reusability_summary": self._summarize_reusability(files)
         }
 
+        if output_json_path is None:
+            result["files"] = [self._file_to_dict(f) for f in files]
+            return result
+
+        try:
+            self._write_analysis_json(result, files, Path(output_json_path))
+        except OSError as e:
+            return {
+                "success": False,
+                "error": f"Failed to write analysis JSON: {str(e)}"
+            }
+
+        del result["files"]
+        result["output_json_path"] = output_json_path
+        return result
+
+    def _write_analysis_json(self, result: Dict[str, Any], files: List[Optional[FileInfo]],
+                             output_path: Path) -> None:
+        """
+        Write an analysis result as JSON, converting files one at a time.
+
+        The output is the JSON of the result with its "files" list filled
+        in (compact, serialized with orjson when available). Entries of files are released (set to None) once
+        written, so the per-file dicts never all exist at the same time.
+
+        Args:
+            result: Analysis result whose "files" entry is a placeholder
+            files: Analyzed files, in output order
+            output_path: JSON file to write
+        """
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, "wb") as fp:
+            fp.write(b"{")
+            for i, (key, value) in enumerate(result.items()):
+                if i:
+                    fp.write(b",")
+                fp.write(_json_dumps(key) + b":")
+                if key != "files":
+                    fp.write(_json_dumps(value))
+                    continue
+
+                fp.write(b"[")
+                for j, file_info in enumerate(files):
+                    if j:
+                        fp.write(b",")
+                    fp.write(_json_dumps(self._file_to_dict(file_info)))
+                    files[j] = None
+                fp.write(b"]")
+            fp.write(b"}")
+
+    def analyze_imports(self, repo_path: str, ignore_patterns: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Collect the third-party and local imports of every file, without parsing.
+
+        A fast alternative to analyze_repository for dependency views: each
+        file is tokenized only up to its first top-level def or class (see
+        _fast_import_scan), so imports made later in a file or inside
+        functions are not seen.
+
+        Args:
+            repo_path: Path to repository root
+            ignore_patterns: Optional list of patterns to ignore (e.g., ['test', '__pycache__'])
+
+        Returns:
+            Dictionary with "files" entries holding file_rel, imports_third and
+            imports_local (as in analyze_repository)
+        """
+        root = Path(repo_path).resolve()
+
+        if not root.is_dir():
+            return {
+                "success": False,
+                "error": f"Path is not a directory: {repo_path}"
+            }
+
+        ignore_patterns = ignore_patterns or list(DEFAULT_IGNORE_PATTERNS)
+        paths = self._walk_python_files(root, ignore_patterns)
+
+        if not paths:
+            return {
+                "success": False,
+                "error": "No Python files found in repository"
+            }
+
+        local_roots = self._discover_local_roots(root)
+        files = []
+        for entry in paths:
+            path = Path(entry.path)
+            third, local = set(), set()
+            for dep in self._fast_import_scan(path):
+                if dep in local_roots:
+                    local.add(dep)
+                elif dep not in self.stdlibs:
+                    third.add(dep)
+            files.append({
+                "file_rel": str(path.relative_to(root)),
+                "imports_third": list(third),
+                "imports_local": list(local)
+            })
+
+        return {
+            "success": True,
+            "repository": str(root),
+            "files_analyzed": len(files),
+            "files": files
+        }
+
     def generate_excel_report(self, analysis_result: Dict[str, Any], output_path: str) -> Dict[str, Any]:
         """
         Generate comprehensive Excel report from analysis results.
@@ -222,11 +578,8 @@ class RepositoryAnalyzer:
                 "error": "Analysis result indicates failure"
             }
 
-        # Reconstruct FileInfo objects from dictionaries
-        files = [self._dict_to_file(f) for f in analysis_result["files"]]
-
         try:
-            self._export_excel(files, Path(output_path))
+            self._export_excel(analysis_result["files"], Path(output_path))
             return {
                 "success": True,
                 "output_path": output_path,
@@ -271,9 +624,12 @@ class RepositoryAnalyzer:
             }
 
         try:
-            # Analyze the file
-            root = path.parent
-            file_info = self._analyze_file(path, root)
+            # Analyze the file (_analyze_file expects an absolute path)
+            path_abs = path.resolve()
+            cache = AstCache(self.cache_dir) if self.cache_dir else None
+            file_info, _ = self._analyze_file_entry(
+                path_abs, path_abs.parent, cache, known=self._scanned.get(str(path_abs))
+            )
 
             # Validate metadata
             self._validate_file_metadata([file_info])
@@ -304,73 +660,240 @@ class RepositoryAnalyzer:
 
     # --- Internal methods ---
 
-    def _scan_files(self, root: Path, ignore_patterns: List[str]) -> List[FileInfo]:
-        """Scan all Python files in repository."""
-        files: List[FileInfo] = []
-        all_paths = list(root.rglob("*.py"))
-
-        for p in all_paths:
-            # Check if path should be ignored
-            if self._is_ignored(p, ignore_patterns, root):
-                continue
+    def _scan_files(self, root: Path, ignore_patterns: List[str],
+                    skip_bodies: bool = False) -> List[FileInfo]:
+        """
+        Scan all Python files in repository.
 
+        With the parse cache enabled, files unchanged since the previous scan
+        (per the scan manifest) are first restored from the cache in-process.
+        The remaining files are analyzed in a process pool (one file per
+        task, results in path order) unless they are few or no pool can be
+        started. The manifest is then updated.
+        """
+        dir_entries = self._walk_python_files(root, ignore_patterns)
+        paths = [entry.path for entry in dir_entries]
+
+        root_str = str(root)
+        cache_dir = str(self.cache_dir) if self.cache_dir else None
+        manifest = ScanManifest(self.cache_dir, root) if self.cache_dir else None
+        previous = manifest.load() if manifest else {}
+
+        results: List[Optional[Tuple[FileInfo, ManifestEntry]]] = [None] * len(paths)
+        if previous:
+            cache = AstCache(self.cache_dir)
+            for i, entry in enumerate(dir_entries):
+                known = previous.get(entry.path)
+                if known is None:
+                    continue
+                try:
+                    # The walk's stat: no second stat call on Windows
+                    results[i] = self._analyze_file_entry(
+                        Path(entry.path), root, cache, skip_bodies, known, reuse_only=True,
+                        stat=entry.stat()
+                    )
+                except Exception:
+                    pass  # Analyzed (and reported) with the changed files
+
+        pending = [path_str for path_str, result in zip(paths, results) if result is None]
+        analyzed = None
+        if len(pending) >= _PARALLEL_SCAN_MIN_FILES:
             try:
-                file_info = self._analyze_file(p, root)
-                files.append(file_info)
-            except Exception as e:
-                print(f"Warning: Failed to analyze {p}: {e}")
+                workers = os.cpu_count() or 1
+                # About four chunks per worker: few round trips, balanced tails
+                chunksize = max(1, len(pending) // (4 * workers))
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    analyzed = list(executor.map(
+                        _analyze_file_worker, pending, repeat(root_str), repeat(cache_dir),
+                        repeat(skip_bodies), chunksize=chunksize
+                    ))
+            except (OSError, BrokenProcessPool, pickle.PicklingError) as e:
+                print(f"Warning: Process pool unavailable ({e}), scanning sequentially")
+
+        if analyzed is None:
+            analyzed = [_analyze_file_worker(p, root_str, cache_dir, skip_bodies) for p in pending]
+
+        if pending:
+            analyzed_iter = iter(analyzed)
+            results = [next(analyzed_iter) if result is None else result for result in results]
+
+        files = []
+        manifest_entries: Dict[str, ManifestEntry] = {}
+        for path_str, result in zip(paths, results):
+            if result is not None:
+                files.append(result[0])
+                manifest_entries[path_str] = result[1]
+
+        if manifest and manifest_entries != previous:
+            manifest.save(manifest_entries)
+        self._scanned = manifest_entries
 
         return files
 
-    def _is_ignored(self, path: Path, ignore_patterns: List[str], root: Path) -> bool:
-        """Check if path matches ignore patterns."""
-        path_str = str(path.resolve()).lower()
-        root_str = str(root.resolve()).lower()
+    @staticmethod
+    def _walk_python_files(root: Path, ignore_patterns: List[str]) -> List[os.DirEntry]:
+        """
+        List Python files under root, never entering ignored directories.
+
+        A file or directory is ignored when a pattern occurs (case-insensitive)
+        in its name or, for patterns containing a separator, in its path
+        relative to root. Symlinked directories are not followed.
+
+        Args:
+            root: Repository root
+            ignore_patterns: Substrings of names/paths to skip
+
+        Returns:
+            Directory entries of the files (path-like, with .path), in
+            directory pre-order (same order as Path.rglob). Their stat() is
+            cached, and on Windows served from the directory listing.
+        """
+        name_re = _substring_matcher(p for p in ignore_patterns if '/' not in p and '\\' not in p)
+        path_re = _substring_matcher(p.replace('\\', '/') for p in ignore_patterns
+                                     if '/' in p or '\\' in p)
 
-        for pattern in ignore_patterns:
-            if pattern.lower() in path_str and path_str != root_str:
+        def is_ignored(name: str, rel: str) -> bool:
+            if name_re is not None and name_re.search(name.lower()):
                 return True
-        return False
+            return path_re is not None and path_re.search(rel.lower()) is not None
+
+        paths: List[os.DirEntry] = []
+        stack: List[Tuple[str, str]] = [(str(root), "")]
+
+        while stack:
+            dir_path, dir_rel = stack.pop()
+            subdirs = []
+            try:
+                with os.scandir(dir_path) as entries:
+                    for entry in entries:
+                        rel = dir_rel + entry.name
+                        if entry.is_dir(follow_symlinks=False):
+                            if not is_ignored(entry.name, rel):
+                                subdirs.append((entry.path, rel + "/"))
+                        elif entry.name.endswith(".py") and entry.is_file() \
+                                and not is_ignored(entry.name, rel):
+                            paths.append(entry)
+            except OSError as e:
+                print(f"Warning: Cannot scan {dir_path}: {e}")
+                continue
+
+            # Reversed so subdirectories are popped in listing order
+            stack.extend(reversed(subdirs))
+
+        return paths
 
-    def _analyze_file(self, path: Path, root: Path) -> FileInfo:
-        """Analyze a single Python file."""
-        content = self._safe_read_text(path)
-        lines = content.count("\n") + 1
-        stat = path.stat()
+    @staticmethod
+    def _analyze_file(path: Path, root: Path, cache: Optional[AstCache] = None,
+                      skip_bodies: bool = False) -> FileInfo:
+        """
+        Analyze a single Python file.
+
+        Uses no analyzer state, so it can run in worker processes.
+
+        Args:
+            path: Absolute path of the Python file (used as-is for file_abs)
+            root: Repository root
+            cache: Optional parse cache consulted before parsing the content
+            skip_bodies: Record function signatures without walking their
+                bodies (no complexity, nested definitions or inner calls)
+        """
+        return RepositoryAnalyzer._analyze_file_entry(path, root, cache, skip_bodies)[0]
+
+    @staticmethod
+    def _analyze_file_entry(path: Path, root: Path, cache: Optional[AstCache] = None,
+                            skip_bodies: bool = False, known: Optional[ManifestEntry] = None,
+                            reuse_only: bool = False, stat: Optional[os.stat_result] = None
+                            ) -> Optional[Tuple[FileInfo, ManifestEntry]]:
+        """
+        Analyze a single Python file and describe it for the scan manifest.
 
-        file_rel = str(path.relative_to(root))
+        Args:
+            path: Absolute path of the Python file (used as-is for file_abs)
+            root: Repository root
+            cache: Optional parse cache consulted before parsing the content
+            skip_bodies: See _analyze_file
+            known: Manifest entry from the previous scan; when the file's mtime
+                and size still match, its digest is reused without a read
+            reuse_only: Give up (return None) instead of reading the file when
+                it cannot be restored through known and the cache
+            stat: The file's stat result, if already known (e.g. from the walk)
+
+        Returns:
+            (FileInfo, manifest entry), or None in reuse_only mode
+        """
+        if stat is None:
+            stat = path.stat()
+
+        cached = None
+        if cache and known and known[0] == stat.st_mtime_ns and known[1] == stat.st_size:
+            digest, lines = known[2], known[3]
+            cached = cache.get(cache.key_for(digest, skip_bodies))
+
+        if cached is None and reuse_only:
+            return None
+
+        if cached is None:
+            # Changed or new file (or its cache entry is gone): read and hash it
+            data = path.read_bytes()
+            digest = AstCache.digest(data)
+            lines = data.count(b"\n") + 1
+            if b"\r" in data:
+                # Old Mac line endings count as lines, as with universal newlines
+                lines += data.count(b"\r") - data.count(b"\r\n")
+            if cache:
+                cached = cache.get(cache.key_for(digest, skip_bodies))
+
+        # Interned: shared by every function, class and used_in_files entry
+        file_rel = sys.intern(str(path.relative_to(root)))
         folder_rel = str(path.parent.relative_to(root)) if path.parent != root else ""
         parts = Path(file_rel).parts
         direct_folder = parts[0] if len(parts) > 1 else ""
 
-        # Parse metadata
-        header_meta = self._parse_aimsun_header(content)
-        filename_meta = self._parse_filename_convention(file_rel)
-        docstring_sections = self._parse_structured_docstring(content)
+        filename_meta = RepositoryAnalyzer._parse_filename_convention(file_rel)
+
+        if cached is not None:
+            header_meta, docstring_sections, functions, classes, calls, imports = cached
+            # Entries are shared by files with identical content
+            for f in functions:
+                f.file_rel = file_rel
+            for c in classes:
+                c.file_rel = file_rel
+        else:
+            # Only a cache miss needs the decoded text
+            content = RepositoryAnalyzer._decode_source(data)
+
+            # Parse metadata
+            header_meta = RepositoryAnalyzer._parse_aimsun_header(content)
+
+            # Parse AST (one walk also computes complexity)
+            visitor = _ASTVisitor(file_rel, skip_bodies)
+            tree = None
+            try:
+                tree = ast.parse(content)
+                visitor.visit(tree)
+            except Exception as e:
+                print(f"AST parse error in {file_rel}: {e}")
 
-        # Parse AST
-        visitor = _ASTVisitor(file_rel)
-        try:
-            tree = ast.parse(content)
-            visitor.visit(tree)
-        except Exception as e:
-            print(f"AST parse error in {file_rel}: {e}")
+            docstring_sections = RepositoryAnalyzer._parse_structured_docstring(tree)
 
-        # Calculate complexity if radon available
-        comp_map: Dict[str, int] = {}
-        if _HAS_RADON:
-            try:
-                for block in cc_visit(content):
-                    comp_map[block.name] = int(getattr(block, "complexity", 0))
-            except Exception:
-                pass
+            functions, classes = visitor.functions, visitor.classes
+            calls, imports = visitor.calls, visitor.imports
 
-        for f in visitor.functions:
-            f.complexity = comp_map.get(f.qualname) or comp_map.get(f.name)
+            # Scan function bodies for hardcoded paths while the source is at hand
+            source_lines = content.split('\n') if functions else []
+            for fn in functions:
+                if fn.lineno and fn.end_lineno:
+                    func_code = '\n'.join(source_lines[fn.lineno - 1:fn.end_lineno])
+                    fn.has_hardcoded_paths = bool(_HARDCODED_RE.search(func_code))
+                RepositoryAnalyzer._score_function(fn)
 
-        return FileInfo(
+            if cache:
+                cache.put(cache.key_for(digest, skip_bodies),
+                          (header_meta, docstring_sections, functions, classes, calls, imports))
+
+        file_info = FileInfo(
             file_rel=file_rel,
-            file_abs=str(path.resolve()),
+            file_abs=str(path),
             folder_rel=folder_rel,
             direct_folder=direct_folder,
             subfolder=folder_rel,
@@ -382,22 +905,99 @@ class RepositoryAnalyzer:
             category_name=filename_meta.get('category_name'),
             script_name=filename_meta.get('script_name'),
             docstring_sections=docstring_sections,
-            functions=visitor.functions,
-            classes=visitor.classes,
-            calls=visitor.calls,
-            imports_all=set(sorted(visitor.imports)),
+            functions=functions,
+            classes=classes,
+            calls=calls,
+            imports_all=imports,
             naming_valid=filename_meta.get('naming_valid', False),
             issues=filename_meta.get('issues', [])
         )
+        return file_info, [stat.st_mtime_ns, stat.st_size, digest, lines]
 
-    def _safe_read_text(self, path: Path) -> str:
-        """Safely read text file with encoding fallback."""
+    @staticmethod
+    def _decode_source(data: bytes) -> str:
+        """Decode file bytes with encoding fallback and universal newlines."""
         try:
-            return path.read_text(encoding="utf-8")
+            content = data.decode("utf-8")
         except UnicodeDecodeError:
-            return path.read_text(encoding="latin-1", errors="ignore")
+            # latin-1 maps every byte, so this cannot fail or drop characters
+            content = data.decode("latin-1")
+        if "\r" in content:
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
+        return content
+
+    @staticmethod
+    def _fast_import_scan(path: Path) -> Set[str]:
+        """
+        Get the top-level names a file imports, reading only its header.
+
+        Tokenizes until the first top-level def, class or decorator; import
+        statements before it (including those in top-level try/if blocks)
+        are collected the way _ASTVisitor collects them. Files that cannot
+        be tokenized, including non-UTF-8 files, fall back to a full parse
+        of the source decoded by _decode_source.
 
-    def _parse_aimsun_header(self, content: str) -> Dict[str, str]:
+        Args:
+            path: Python file
+
+        Returns:
+            First components of the imported modules
+        """
+        imports: Set[str] = set()
+        try:
+            with open(path, "rb") as f:
+                depth = 0
+                line_start = True
+                statement = None  # "import" / "from" while reading one
+                expect_module = False
+                for tok in tokenize.tokenize(f.readline):
+                    kind, string = tok.type, tok.string
+                    if kind == tokenize.INDENT:
+                        depth += 1
+                        continue
+                    if kind == tokenize.DEDENT:
+                        depth -= 1
+                        continue
+                    if kind in (tokenize.ENCODING, tokenize.NL, tokenize.COMMENT):
+                        continue
+                    if kind in (tokenize.NEWLINE, tokenize.ENDMARKER):
+                        line_start, statement = True, None
+                        continue
+
+                    if line_start:
+                        line_start = False
+                        if depth == 0 and (string in ("def", "class", "async") or string == "@"):
+                            break
+                        if kind == tokenize.NAME and string in ("import", "from"):
+                            statement, expect_module = string, True
+                        continue
+
+                    if statement == "import":
+                        if kind == tokenize.NAME and expect_module:
+                            imports.add(string)
+                            expect_module = False
+                        elif string == ",":
+                            expect_module = True
+                    elif statement == "from" and expect_module:
+                        # Relative dots are skipped; "from . import x" names no module
+                        if kind == tokenize.NAME:
+                            if string != "import":
+                                imports.add(string)
+                            expect_module = False
+            return imports
+        except (tokenize.TokenError, SyntaxError, OSError, ValueError):
+            # ValueError covers UnicodeDecodeError: non-UTF-8 files are decoded below
+            pass
+
+        try:
+            visitor = _ASTVisitor(str(path))
+            visitor.visit(ast.parse(RepositoryAnalyzer._decode_source(path.read_bytes())))
+            return visitor.imports
+        except Exception:
+            return imports
+
+    @staticmethod
+    def _parse_aimsun_header(content: str) -> Dict[str, str]:
         """Parse special Aimsun headers like #atype=... and #owner=..."""
         metadata = {}
         for line in content.splitlines()[:5]:
@@ -410,7 +1010,8 @@ class RepositoryAnalyzer:
                         metadata[key] = value.strip()
         return metadata
 
-    def _parse_filename_convention(self, filename: str) -> Dict[str, Any]:
+    @staticmethod
+    def _parse_filename_convention(filename: str) -> Dict[str, Any]:
         """Decode the _XX_YY_name.py convention and validate it."""
         parts = Path(filename).stem.split('_')
         meta: Dict[str, Any] = {
@@ -427,18 +1028,16 @@ class RepositoryAnalyzer:
 
         return meta
 
-    def _parse_structured_docstring(self, content: str) -> Dict[str, str]:
-        """Extract content from markdown-style sections within the initial docstring."""
+    @staticmethod
+    def _parse_structured_docstring(tree: Optional[ast.AST]) -> Dict[str, str]:
+        """Extract content from markdown-style sections within the module docstring."""
         sections = {}
-        docstring_match = re.search(r'"""(.*?)"""', content, re.DOTALL)
-        if not docstring_match:
+        docstring = ast.get_docstring(tree) if tree is not None else None
+        if not docstring:
             return sections
 
-        docstring = docstring_match.group(1)
-
         # Try to extract sections
-        pattern = r"##\s+(.*?)\n(.*?)(?=\n##\s+|$)"
-        matches = re.findall(pattern, docstring, re.DOTALL | re.IGNORECASE)
+        matches = _SECTION_RE.findall(docstring)
 
         for match in matches:
             title = match[0].strip().upper().replace(' ', '_')
@@ -452,23 +1051,48 @@ class RepositoryAnalyzer:
         return sections
 
     def _discover_local_roots(self, root: Path) -> Set[str]:
-        """Discover local package/module names."""
+        """
+        Discover local package/module names.
+
+        Top-level modules and every top-level directory holding a Python
+        file (at any depth) are local. Each directory is only searched until
+        its first Python file, so large trees such as virtualenvs are not
+        listed in full.
+
+        Args:
+            root: Repository root
+
+        Returns:
+            Top-level names importable from the repository
+        """
         local: Set[str] = set()
-        for p in root.rglob("*.py"):
+        try:
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        if self._contains_python_file(entry.path):
+                            local.add(entry.name)
+                    elif entry.name.endswith(".py"):
+                        local.add(entry.name.split(".")[0])
+        except OSError as e:
+            print(f"Warning: Cannot scan {root}: {e}")
+        return local
+
+    @staticmethod
+    def _contains_python_file(dir_path: str) -> bool:
+        """Check whether a directory tree holds a Python file, stopping at the first."""
+        stack = [dir_path]
+        while stack:
             try:
-                rel = p.relative_to(root)
-            except ValueError:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.name.endswith(".py") and entry.is_file():
+                            return True
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+            except OSError:
                 continue
-            parts = rel.parts
-            if len(parts) == 1:
-                local.add(parts[0].split(".")[0])
-            else:
-                top = parts[0]
-                if (root / top / "__init__.py").exists():
-                    local.add(top)
-                else:
-                    local.add(parts[0])
-        return local
+        return False
 
     def _split_dependencies(self, files: List[FileInfo], local_roots: Set[str]) -> None:
         """Split imports into standard, third-party, and local."""
@@ -487,19 +1111,20 @@ class RepositoryAnalyzer:
 
     def _detect_unused_functions(self, files: List[FileInfo]) -> None:
         """Detect unused functions and track function usage."""
-        defined_names = {fn.name for f in files for fn in f.functions}
-        defined_names |= {fn.qualname for f in files for fn in f.functions if fn.class_name}
-        called_names = {callee for f in files for _, callee in f.calls}
-
+        # Called name -> files calling it; its keys double as the set of called names
         function_callers: Dict[str, Set[str]] = defaultdict(set)
         for f in files:
-            for caller, callee in f.calls:
-                function_callers[callee].add(f.file_rel)
+            file_rel = f.file_rel
+            for _, callee in f.calls:
+                function_callers[callee].add(file_rel)
 
+        empty: Set[str] = set()
         for f in files:
             for fn in f.functions:
-                fn.unused = not ((fn.name in called_names) or (fn.qualname in called_names))
-                fn.used_in_files = function_callers.get(fn.name, set()) | function_callers.get(fn.qualname, set())
+                name_callers = function_callers.get(fn.name, empty)
+                qualname_callers = function_callers.get(fn.qualname, empty)
+                fn.unused = fn.name not in function_callers and fn.qualname not in function_callers
+                fn.used_in_files = name_callers | qualname_callers
 
     def _validate_file_metadata(self, files: List[FileInfo]) -> None:
         """Validate file metadata and naming conventions."""
@@ -512,56 +1137,50 @@ class RepositoryAnalyzer:
             if 'DESCRIPTION' not in f.docstring_sections or not f.docstring_sections.get('DESCRIPTION'):
                 f.issues.append("Missing DESCRIPTION section in docstring")
 
-    def _calculate_reusability_scores(self, files: List[FileInfo]) -> None:
-        """Calculate reusability score for each function."""
-        generic_patterns = [
-            'get_', 'set_', 'load_', 'save_', 'read_', 'write_', 'parse_', 'format_',
-            'convert_', 'validate_', 'check_', 'calculate_', 'process_', 'update_',
-            'create_', 'delete_', 'find_', 'search_', 'filter_', 'sort_', 'clean_',
-            'transform_', 'generate_', 'build_', 'export_', 'import_', 'extract_'
-        ]
+    @staticmethod
+    def _score_function(fn: FunctionInfo) -> None:
+        """
+        Set the reusability points a function earns on its own (base_score).
 
-        hardcoded_patterns = [
-            r'C:\\', r'/home/', r'/usr/', r'D:\\'
-        ]
+        Everything but use across files depends only on the function's file,
+        so this runs once per parse and is served from the parse cache for
+        unchanged files.
+        """
+        score = 0
 
-        for f in files:
-            try:
-                content = Path(f.file_abs).read_text(encoding='utf-8', errors='ignore')
-            except:
-                content = ""
+        # Has documentation? (+2 points)
+        if fn.docstring and len(fn.docstring.strip()) > 20:
+            score += 2
 
-            for fn in f.functions:
-                score = 0
+        # Generic naming pattern? (+2 points)
+        fn.is_generic_name = _GENERIC_PREFIX_RE.match(fn.name) is not None
+        if fn.is_generic_name:
+            score += 2
 
-                # Has documentation? (+2 points)
-                if fn.docstring and len(fn.docstring.strip()) > 20:
-                    score += 2
+        # Not too complex? (+1 point if complexity <= 10)
+        if fn.complexity and fn.complexity <= 10:
+            score += 1
 
-                # Generic naming pattern? (+2 points)
-                fn.is_generic_name = any(fn.name.lower().startswith(pat) for pat in generic_patterns)
-                if fn.is_generic_name:
-                    score += 2
+        # Hardcoded paths? (-3 points penalty; detected in _analyze_file)
+        if fn.has_hardcoded_paths:
+            score -= 3
 
-                # Used in multiple files? (+3 points per additional file, max 6)
-                if len(fn.used_in_files) > 1:
-                    score += min(3 * (len(fn.used_in_files) - 1), 6)
+        # Reasonable function length? (+1 if length < 50 lines)
+        if fn.length and fn.length < 50:
+            score += 1
 
-                # Not too complex? (+1 point if complexity <= 10)
-                if fn.complexity and fn.complexity <= 10:
-                    score += 1
+        fn.base_score = score
 
-                # Check for hardcoded paths (-3 points penalty)
-                if fn.lineno and fn.end_lineno:
-                    lines = content.split('\n')[fn.lineno-1:fn.end_lineno]
-                    func_code = '\n'.join(lines)
-                    fn.has_hardcoded_paths = any(re.search(pat, func_code) for pat in hardcoded_patterns)
-                    if fn.has_hardcoded_paths:
-                        score -= 3
+    def _calculate_reusability_scores(self, files: List[FileInfo]) -> None:
+        """Calculate reusability score for each function."""
+        for f in files:
+            for fn in f.functions:
+                score = fn.base_score
 
-                # Reasonable function length? (+1 if length < 50 lines)
-                if fn.length and fn.length < 50:
-                    score += 1
+                # Used in multiple files? (+3 points per additional file, max 6)
+                used_in = len(fn.used_in_files)
+                if used_in > 1:
+                    score += min(3 * (used_in - 1), 6)
 
                 fn.reusability_score = max(0, score)
 
@@ -593,34 +1212,49 @@ class RepositoryAnalyzer:
 
     def _summarize_issues(self, files: List[FileInfo]) -> Dict[str, Any]:
         """Summarize all issues found."""
-        all_issues = []
+        priority_counts: Counter = Counter()
+        top_issues = []
+        total = 0
         for f in files:
             for issue in f.issues:
-                priority = "HIGH" if "naming" in issue.lower() or "missing owner" in issue.lower() else "MEDIUM"
-                all_issues.append({
-                    "file": f.file_rel,
-                    "issue": issue,
-                    "priority": priority
-                })
-
-        priority_counts = Counter(issue["priority"] for issue in all_issues)
+                issue_lower = issue.lower()
+                priority = "HIGH" if "naming" in issue_lower or "missing owner" in issue_lower else "MEDIUM"
+                priority_counts[priority] += 1
+                total += 1
+                if len(top_issues) < 20:
+                    top_issues.append({
+                        "file": f.file_rel,
+                        "issue": issue,
+                        "priority": priority
+                    })
 
         return {
-            "total_issues": len(all_issues),
+            "total_issues": total,
             "by_priority": dict(priority_counts),
-            "top_issues": all_issues[:20]
+            "top_issues": top_issues
         }
 
     def _summarize_reusability(self, files: List[FileInfo]) -> Dict[str, Any]:
         """Summarize reusability scores."""
-        all_functions = [(f, fn) for f in files for fn in f.functions]
+        total = 0
+        score_sum = 0
+        max_score = 0
+        for f in files:
+            for fn in f.functions:
+                score = fn.reusability_score or 0
+                total += 1
+                score_sum += score
+                if score > max_score:
+                    max_score = score
 
-        if not all_functions:
+        if not total:
             return {"total_functions": 0}
 
-        scores = [fn.reusability_score or 0 for _, fn in all_functions]
-        avg_score = sum(scores) / len(scores) if scores else 0
-
+        top = heapq.nlargest(
+            10,
+            ((f, fn) for f in files for fn in f.functions),
+            key=lambda x: x[1].reusability_score or 0,
+        )
         high_reusability = [
             {
                 "function": fn.qualname,
@@ -628,13 +1262,13 @@ class RepositoryAnalyzer:
                 "score": fn.reusability_score,
                 "used_in": len(fn.used_in_files)
             }
-            for f, fn in sorted(all_functions, key=lambda x: x[1].reusability_score or 0, reverse=True)[:10]
+            for f, fn in top
         ]
 
         return {
-            "total_functions": len(all_functions),
-            "average_score": round(avg_score, 2),
-            "max_score": max(scores) if scores else 0,
+            "total_functions": total,
+            "average_score": round(score_sum / total, 2),
+            "max_score": max_score,
             "top_reusable_functions": high_reusability
         }
 
@@ -656,68 +1290,116 @@ class RepositoryAnalyzer:
             "naming_valid": file_info.naming_valid
         }
 
-    def _dict_to_file(self, data: Dict[str, Any]) -> FileInfo:
-        """Convert dictionary back to FileInfo (simplified)."""
-        return FileInfo(
-            file_rel=data["file_rel"],
-            file_abs=data["file_abs"],
-            folder_rel="",
-            direct_folder="",
-            subfolder="",
-            size_kb=data["size_kb"],
-            mtime="",
-            lines=data["lines"],
-            owner=data.get("owner"),
-            atype=data.get("atype"),
-            category_name=data.get("category"),
-            issues=data.get("issues", []),
-            naming_valid=data.get("naming_valid", True)
-        )
+    def _export_excel(self, files: List[Dict[str, Any]], output_path: Path) -> None:
+        """
+        Generate simplified Excel report.
+
+        The workbook is written in openpyxl's write-only mode: rows are
+        streamed to the sheet XML as they are appended, so memory does not
+        grow with a cell object per value.
+
+        Args:
+            files: File entries of an analysis result (see _file_to_dict)
+            output_path: Path for output Excel file
+        """
+        from openpyxl import Workbook
+
+        # Summary totals in one pass over the entries
+        total_functions = total_lines = files_with_issues = 0
+        for f in files:
+            total_functions += f.get("functions_count", 0)
+            total_lines += f.get("lines", 0)
+            if f.get("issues"):
+                files_with_issues += 1
 
-    def _export_excel(self, files: List[FileInfo], output_path: Path) -> None:
-        """Generate simplified Excel report."""
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Summary"
+        wb = Workbook(write_only=True)
 
         # Summary sheet
+        ws = wb.create_sheet("Summary")
         ws.append(["Repository Analysis Summary"])
         ws.append([])
         ws.append(["Total Files", len(files)])
-        ws.append(["Total Functions", sum(len(f.functions) for f in files)])
-        ws.append(["Total Lines", sum(f.lines for f in files)])
-        ws.append(["Files with Issues", len([f for f in files if f.issues])])
+        ws.append(["Total Functions", total_functions])
+        ws.append(["Total Lines", total_lines])
+        ws.append(["Files with Issues", files_with_issues])
 
-        # Files list sheet
+        # Files list sheet, rows generated as they are written
         ws_files = wb.create_sheet("Files")
         ws_files.append(["File", "Lines", "Functions", "Owner", "Issues"])
-
-        for f in sorted(files, key=lambda x: x.file_rel):
-            ws_files.append([
-                f.file_rel,
-                f.lines,
-                len(f.functions),
-                f.owner or "Unassigned",
-                "; ".join(f.issues[:2]) if f.issues else "None"
-            ])
+        for row in self._excel_file_rows(files):
+            ws_files.append(row)
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
         wb.save(str(output_path))
 
+    @staticmethod
+    def _excel_file_rows(files: List[Dict[str, Any]]) -> Iterator[List[Any]]:
+        """Yield the Files sheet rows, ordered by file path."""
+        for f in sorted(files, key=itemgetter("file_rel")):
+            issues = f.get("issues")
+            yield [
+                f["file_rel"],
+                f.get("lines", 0),
+                f.get("functions_count", 0),
+                f.get("owner") or "Unassigned",
+                "; ".join(issues[:2]) if issues else "None"
+            ]
+
 
 # --- AST Visitor ---
 
 class _ASTVisitor(ast.NodeVisitor):
-    """AST visitor to extract functions, classes, calls, and imports."""
+    """
+    AST visitor to extract functions, classes, calls, and imports.
+
+    Also computes the cyclomatic (McCabe) complexity of every function in
+    the same walk, with radon's counting rules: 1 + one per if/elif,
+    conditional expression, loop (and loop else), except handler, try else,
+    extra boolean operand, comprehension (and its ifs), assert and
+    non-wildcard match case. Nested functions are scored separately, not
+    added to their enclosing function.
 
-    def __init__(self, file_rel: str):
+    With skip_bodies, function bodies are not visited at all: only
+    module- and class-level definitions, calls and imports are collected.
+    """
+
+    def __init__(self, file_rel: str, skip_bodies: bool = False):
         self.file_rel = file_rel
+        self.skip_bodies = skip_bodies
         self.functions: List[FunctionInfo] = []
         self.classes: List[ClassInfo] = []
         self.calls: List[Tuple[str, str]] = []
         self.imports: Set[str] = set()
         self._class_stack: List[str] = []
         self._func_stack: List[str] = []
+        self._complexity_stack: List[int] = []
+
+    def visit(self, node: ast.AST):
+        # Type-keyed lookup instead of NodeVisitor's per-node name building
+        method = _VISIT_DISPATCH.get(type(node))
+        if method is not None:
+            return method(self, node)
+        return self.generic_visit(node)
+
+    def generic_visit(self, node: ast.AST):
+        # Same traversal as NodeVisitor.generic_visit, with the dispatch
+        # inlined and no iter_fields generator per node
+        for field_name in node._fields:
+            value = getattr(node, field_name, None)
+            if isinstance(value, list):
+                for item in value:
+                    if isinstance(item, ast.AST):
+                        method = _VISIT_DISPATCH.get(type(item))
+                        if method is not None:
+                            method(self, item)
+                        else:
+                            self.generic_visit(item)
+            elif isinstance(value, ast.AST):
+                method = _VISIT_DISPATCH.get(type(value))
+                if method is not None:
+                    method(self, value)
+                else:
+                    self.generic_visit(value)
 
     def current_class(self) -> Optional[str]:
         return self._class_stack[-1] if self._class_stack else None
@@ -727,7 +1409,7 @@ class _ASTVisitor(ast.NodeVisitor):
 
     def current_qualname(self) -> Optional[str]:
         fn, cls = self.current_func_name(), self.current_class()
-        return f"{cls}.{fn}" if fn and cls else fn
+        return sys.intern(f"{cls}.{fn}") if fn and cls else fn
 
     def visit_ClassDef(self, node: ast.ClassDef):
         info = ClassInfo(
@@ -743,7 +1425,7 @@ class _ASTVisitor(ast.NodeVisitor):
         self._class_stack.pop()
 
     def visit_FunctionDef(self, node: ast.FunctionDef):
-        qual = f"{self.current_class()}.{node.name}" if self.current_class() else node.name
+        qual = sys.intern(f"{self.current_class()}.{node.name}") if self.current_class() else node.name
         end_ln = getattr(node, "end_lineno", None)
         length = max(0, end_ln - node.lineno + 1) if end_ln is not None else None
 
@@ -762,13 +1444,66 @@ class _ASTVisitor(ast.NodeVisitor):
             self.classes[-1].methods.append(info)
 
         self.functions.append(info)
+        if self.skip_bodies:
+            # Signature-only pass: complexity stays None (not computed)
+            return
+
         self._func_stack.append(node.name)
+        self._complexity_stack.append(1)
         self.generic_visit(node)
+        info.complexity = self._complexity_stack.pop()
         self._func_stack.pop()
 
     def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef):
         self.visit_FunctionDef(node)
 
+    # --- Complexity (decision points of the innermost function) ---
+
+    def _add_complexity(self, node: ast.AST, amount: int) -> None:
+        if self._complexity_stack:
+            self._complexity_stack[-1] += amount
+        self.generic_visit(node)
+
+    def visit_If(self, node: ast.If):
+        self._add_complexity(node, 1)
+
+    def visit_IfExp(self, node: ast.IfExp):
+        self._add_complexity(node, 1)
+
+    def visit_For(self, node: ast.For):
+        self._add_complexity(node, 1 + bool(node.orelse))
+
+    def visit_AsyncFor(self, node: ast.AsyncFor):
+        self._add_complexity(node, 1 + bool(node.orelse))
+
+    def visit_While(self, node: ast.While):
+        self._add_complexity(node, 1 + bool(node.orelse))
+
+    def visit_Try(self, node: ast.Try):
+        self._add_complexity(node, len(node.handlers) + bool(node.orelse))
+
+    # except* blocks (Python 3.11+) count like except blocks
+    visit_TryStar = visit_Try
+
+    def visit_BoolOp(self, node: ast.BoolOp):
+        self._add_complexity(node, len(node.values) - 1)
+
+    def visit_comprehension(self, node: ast.comprehension):
+        self._add_complexity(node, 1 + len(node.ifs))
+
+    def visit_Match(self, node: ast.AST):
+        # A capture-all case (`case _:`) is the default branch, like an else
+        has_default = any(getattr(case.pattern, "pattern", False) is None for case in node.cases)
+        self._add_complexity(node, max(0, len(node.cases) - has_default))
+
+    def visit_Assert(self, node: ast.Assert):
+        # One point per assert; decisions inside the test are not counted
+        if self._complexity_stack:
+            self._complexity_stack[-1] += 1
+        self._complexity_stack.append(0)
+        self.generic_visit(node)
+        self._complexity_stack.pop()
+
     def visit_Call(self, node: ast.Call):
         callee = None
         if isinstance(node.func, ast.Name):
@@ -776,8 +1511,11 @@ class _ASTVisitor(ast.NodeVisitor):
         elif isinstance(node.func, ast.Attribute):
             callee = node.func.attr
 
-        if callee and self.current_qualname():
-            self.calls.append((self.current_qualname(), callee))
+        # Identifiers from the parser are interned, so with the interned
+        # qualnames every call edge of a function shares its strings
+        caller = self.current_qualname()
+        if callee and caller:
+            self.calls.append((caller, callee))
 
         self.generic_visit(node)
 
@@ -788,3 +1526,12 @@ class _ASTVisitor(ast.NodeVisitor):
     def visit_ImportFrom(self, node: ast.ImportFrom):
         if node.module:
             self.imports.add(node.module.split(".")[0])
+
+
+# Node type -> visit_* method of _ASTVisitor, used by _ASTVisitor.visit.
+# Node types missing from this Python version (e.g. TryStar) are skipped.
+_VISIT_DISPATCH = {
+    getattr(ast, name[len("visit_"):]): method
+    for name, method in vars(_ASTVisitor).items()
+    if name.startswith("visit_") and hasattr(ast, name[len("visit_"):])
+}
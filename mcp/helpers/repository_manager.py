@@ -13,10 +13,15 @@ using the MCP Core Framework (Phase 1).
 """
 
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Set
+from typing import Dict, Any, List, Optional, Tuple
 import ast
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from collections import Counter, defaultdict
+from collections import Counter, OrderedDict, defaultdict
+from functools import cached_property
 
 # MCP Core Framework imports
 from agents.mcp.core import (
@@ -27,10 +32,12 @@ from agents.mcp.core import (
     cached,
     get_mcp_logger
 )
+from agents.mcp.helpers.pulse_generator import DependencyGraph
 
 # Import the existing repository analyzer for data structures
 try:
     from agents.mcp.helpers.repository_analyzer import (
+        DEFAULT_IGNORE_PATTERNS,
         RepositoryAnalyzer,
         FileInfo,
         FunctionInfo,
@@ -44,6 +51,69 @@ except ImportError:
     class FileInfo: pass
     class FunctionInfo: pass
     class ClassInfo: pass
+    DEFAULT_IGNORE_PATTERNS: List[str] = []
+
+# Seconds an analysis is shared by the summary methods (as analyze_repository's cache)
+_ANALYSIS_TTL = 600
+
+# Analyses kept per manager (least recently used evicted); each holds every
+# file entry of its repository, so long-lived processes must not keep them all
+_ANALYSIS_CACHE_SIZE = 8
+
+# Finished background report jobs kept until polled (oldest evicted first)
+_REPORT_JOBS_SIZE = 64
+
+# Excel reports generated in the background, by job id (see get_report_status);
+# guarded by _report_jobs_lock since managers may be shared across threads
+_report_jobs: "OrderedDict[str, Future]" = OrderedDict()
+_report_jobs_lock = threading.Lock()
+_report_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="excel-report")
+
+
+class AnalysisBundle:
+    """
+    Result of one repository analysis with views derived on first use.
+
+    The analysis and summary methods of RepositoryManager share one bundle
+    per repository and ignore patterns, so the repository is analyzed once
+    and each derived view is computed at most once.
+
+    Views are not shared across analyses: they are linear in the file
+    entries, so rebuilding them is cheaper than fingerprinting the entries
+    to detect an unchanged repository.
+    """
+
+    def __init__(self, root: Path, ignore_patterns: List[str], analysis: Dict[str, Any]):
+        self.root = root
+        self.ignore_patterns = ignore_patterns
+        self.analysis = analysis
+        self.created = time.monotonic()
+
+    @property
+    def files(self) -> List[Dict[str, Any]]:
+        return self.analysis.get('files', [])
+
+    @cached_property
+    def dependency_graph(self) -> Dict[str, Any]:
+        return RepositoryManager._build_dependency_graph(self.files)
+
+    @cached_property
+    def dependency_metrics(self) -> Dict[str, Any]:
+        return RepositoryManager._calculate_dependency_metrics(self.dependency_graph)
+
+    @cached_property
+    def issues_by_priority(self) -> Dict[str, List[Dict[str, Any]]]:
+        # The analyzer assigns upper-case priorities ('HIGH', 'MEDIUM')
+        buckets: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for issue in self.analysis.get('issues_summary', {}).get('top_issues', []):
+            buckets[issue.get('priority', '')].append(issue)
+        return dict(buckets)
+
+    def issues(self, priority: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Top issues, optionally only those of one priority (case-insensitive); a new list per call."""
+        if not priority:
+            return list(self.analysis.get('issues_summary', {}).get('top_issues', []))
+        return list(self.issues_by_priority.get(priority.upper(), []))
 
 
 class RepositoryManager(MCPBase):
@@ -82,6 +152,66 @@ class RepositoryManager(MCPBase):
         else:
             raise ImportError("RepositoryAnalyzer not available - check installation")
 
+        # LRU of (resolved root, sorted ignore patterns) -> shared analysis
+        self._analysis_cache: "OrderedDict[Tuple[str, Tuple[str, ...]], AnalysisBundle]" = OrderedDict()
+
+    def _get_bundle(self, repo_path: str, ignore_patterns: Optional[List[str]] = None,
+                    imports_only: bool = False) -> AnalysisBundle:
+        """
+        Get the shared analysis of a repository, analyzing it if needed.
+
+        Args:
+            repo_path: Path to repository root
+            ignore_patterns: Optional list of patterns to ignore (default patterns if None)
+            imports_only: Without a shared analysis, only collect imports
+                (RepositoryAnalyzer.analyze_imports); such bundles are not shared
+
+        Returns:
+            AnalysisBundle; its analysis has "success": False on failure
+            (failed analyses are not shared)
+        """
+        root = Path(repo_path).resolve()
+        if ignore_patterns is None:
+            ignore_patterns = list(DEFAULT_IGNORE_PATTERNS)
+
+        key = (str(root), tuple(sorted(ignore_patterns)))
+        bundle = self._analysis_cache.get(key)
+        if bundle is not None:
+            if time.monotonic() - bundle.created < _ANALYSIS_TTL:
+                self._analysis_cache.move_to_end(key)
+                return bundle
+            del self._analysis_cache[key]
+
+        if not root.is_dir():
+            analysis = {"success": False, "error": f"Path is not a directory: {repo_path}"}
+        elif imports_only:
+            return AnalysisBundle(root, ignore_patterns,
+                                  self.analyzer.analyze_imports(str(root), ignore_patterns))
+        else:
+            analysis = self.analyzer.analyze_repository(str(root), ignore_patterns)
+
+        bundle = AnalysisBundle(root, ignore_patterns, analysis)
+        if analysis.get("success"):
+            self._store_bundle(key, bundle)
+        return bundle
+
+    def _store_bundle(self, key: Tuple[str, Tuple[str, ...]], bundle: AnalysisBundle) -> None:
+        """
+        Share an analysis, evicting expired then least recently used ones.
+
+        Args:
+            key: (resolved root, sorted ignore patterns)
+            bundle: Successful analysis to share
+        """
+        cache = self._analysis_cache
+        if len(cache) >= _ANALYSIS_CACHE_SIZE:
+            now = time.monotonic()
+            for old_key in [k for k, b in cache.items() if now - b.created >= _ANALYSIS_TTL]:
+                del cache[old_key]
+            while len(cache) >= _ANALYSIS_CACHE_SIZE:
+                cache.popitem(last=False)
+        cache[key] = bundle
+
     # ===== Repository Analysis =====
 
     @read_only
@@ -97,7 +227,9 @@ class RepositoryManager(MCPBase):
         - Calculates reusability scores
         - Generates statistics
 
-        Results are cached for 10 minutes for performance.
+        Results are cached for 10 minutes for performance. Across processes,
+        files unchanged since the previous scan (same mtime and size) are
+        served from the analyzer's on-disk parse cache without being read.
 
         Args:
             repo_path: Path to repository root
@@ -110,30 +242,18 @@ class RepositoryManager(MCPBase):
         response.add_trace(f"Analyzing repository: {repo_path}")
 
         try:
-            root = Path(repo_path).resolve()
-
-            if not root.is_dir():
-                response.set_error(f"Path is not a directory: {repo_path}")
-                return response
-
-            response.add_trace(f"Repository root: {root}")
-
-            # Set default ignore patterns
-            if ignore_patterns is None:
-                ignore_patterns = [
-                    "__pycache__", ".venv", "venv", ".git", "build", "dist",
-                    "node_modules", "test", "tests", ".pytest_cache"
-                ]
-
-            response.add_trace(f"Ignore patterns: {', '.join(ignore_patterns)}")
-
-            # Perform analysis using underlying analyzer
-            analysis = self.analyzer.analyze_repository(str(root), ignore_patterns)
+            # Perform analysis using underlying analyzer (shared with the summary methods)
+            bundle = self._get_bundle(repo_path, ignore_patterns)
+            analysis = bundle.analysis
 
             if not analysis.get("success"):
                 response.set_error(analysis.get("error", "Analysis failed"))
                 return response
 
+            root = bundle.root
+            response.add_trace(f"Repository root: {root}")
+            response.add_trace(f"Ignore patterns: {', '.join(bundle.ignore_patterns)}")
+
             # Enrich response with trace information
             stats = analysis.get("statistics", {})
             response.add_trace(f"Analyzed {analysis.get('files_analyzed', 0)} files")
@@ -228,7 +348,8 @@ class RepositoryManager(MCPBase):
     # ===== Report Generation =====
 
     @write_safe
-    def generate_excel_report(self, analysis_result: Dict[str, Any], output_path: str) -> MCPResponse:
+    def generate_excel_report(self, analysis_result: Dict[str, Any], output_path: str,
+                              background: bool = False) -> MCPResponse:
         """
         Generate comprehensive Excel report from analysis results.
 
@@ -238,9 +359,12 @@ class RepositoryManager(MCPBase):
         Args:
             analysis_result: Result from analyze_repository() (MCPResponse.data)
             output_path: Path for output Excel file
+            background: Write the report in a worker thread and return at once
+                with a job_id to poll with get_report_status()
 
         Returns:
-            MCPResponse with report path and sheets generated
+            MCPResponse with report path and sheets generated (or the job_id
+            and 'running' status in background mode)
         """
         response = self._create_response()
         response.add_trace(f"Generating Excel report: {output_path}")
@@ -268,6 +392,22 @@ class RepositoryManager(MCPBase):
                 'repository': analysis_result.get('repository', '')
             }
 
+            if background:
+                job_id = uuid.uuid4().hex
+                future = _report_pool.submit(
+                    self.analyzer.generate_excel_report, export_data, output_path
+                )
+                with _report_jobs_lock:
+                    _report_jobs[job_id] = future
+                    self._prune_report_jobs()
+                response.add_trace(f"Report job started: {job_id}")
+                response.data = {
+                    'job_id': job_id,
+                    'status': 'running',
+                    'output_path': output_path
+                }
+                return response
+
             # Generate report using underlying analyzer
             result = self.analyzer.generate_excel_report(export_data, output_path)
 
@@ -289,11 +429,70 @@ class RepositoryManager(MCPBase):
             response.set_error(f"Error generating Excel report: {str(e)}")
             return response
 
+    @staticmethod
+    def _prune_report_jobs() -> None:
+        """Forget the oldest finished report jobs beyond _REPORT_JOBS_SIZE (caller holds _report_jobs_lock)."""
+        excess = len(_report_jobs) - _REPORT_JOBS_SIZE
+        if excess <= 0:
+            return
+        for job_id in [j for j, future in _report_jobs.items() if future.done()][:excess]:
+            del _report_jobs[job_id]
+
+    @read_only
+    def get_report_status(self, job_id: str) -> MCPResponse:
+        """
+        Get the status of an Excel report generated in the background.
+
+        Safe read-only operation.
+
+        Args:
+            job_id: Job id returned by generate_excel_report(background=True)
+
+        Returns:
+            MCPResponse with the job status ('running', 'done' or 'error'),
+            plus the report path and sheets once done or the error message.
+            A finished job is forgotten once its final status is returned.
+        """
+        response = self._create_response()
+        response.add_trace(f"Checking report job: {job_id}")
+
+        with _report_jobs_lock:
+            future = _report_jobs.get(job_id)
+            if future is not None and future.done():
+                del _report_jobs[job_id]
+
+        if future is None:
+            response.set_error(f"Unknown report job: {job_id}")
+            return response
+
+        if not future.done():
+            response.data = {'job_id': job_id, 'status': 'running'}
+            return response
+
+        error = future.exception()
+        result = future.result() if error is None else {'error': str(error)}
+        if error is None and result.get('success'):
+            response.data = {
+                'job_id': job_id,
+                'status': 'done',
+                'output_path': result.get('output_path'),
+                'sheets': result.get('sheets', [])
+            }
+        else:
+            response.data = {
+                'job_id': job_id,
+                'status': 'error',
+                'error': result.get('error', 'Report generation failed')
+            }
+
+        return response
+
     # ===== Dependency Analysis =====
 
     @read_only
     @cached(ttl=300)
-    def analyze_dependencies(self, repo_path: str, ignore_patterns: Optional[List[str]] = None) -> MCPResponse:
+    def analyze_dependencies(self, repo_path: str, ignore_patterns: Optional[List[str]] = None,
+                             imports_only: bool = False) -> MCPResponse:
         """
         Analyze dependencies in a repository.
 
@@ -302,6 +501,9 @@ class RepositoryManager(MCPBase):
         Args:
             repo_path: Path to repository root
             ignore_patterns: Optional list of patterns to ignore
+            imports_only: Unless the repository was already analyzed, only
+                scan file headers for imports instead of a full analysis
+                (faster; imports after the first def/class are not seen)
 
         Returns:
             MCPResponse with dependency analysis
@@ -310,20 +512,17 @@ class RepositoryManager(MCPBase):
         response.add_trace(f"Analyzing dependencies: {repo_path}")
 
         try:
-            # First perform full repository analysis
-            analysis_result = self.analyze_repository(repo_path, ignore_patterns)
+            # Shared repository analysis
+            bundle = self._get_bundle(repo_path, ignore_patterns, imports_only)
 
-            if not analysis_result.success:
-                return analysis_result
-
-            # Extract dependency information
-            files = analysis_result.data.get('files', [])
-
-            # Build dependency graph
-            dependency_graph = self._build_dependency_graph(files)
+            if not bundle.analysis.get("success"):
+                response.set_error(bundle.analysis.get("error", "Analysis failed"))
+                return response
 
-            # Calculate dependency metrics
-            metrics = self._calculate_dependency_metrics(dependency_graph)
+            # Dependency graph and metrics (computed once per analysis)
+            files = bundle.files
+            dependency_graph = bundle.dependency_graph
+            metrics = bundle.dependency_metrics
 
             response.add_trace(f"Analyzed dependencies for {len(files)} files")
             response.add_trace(f"Found {metrics['total_dependencies']} dependencies")
@@ -341,7 +540,8 @@ class RepositoryManager(MCPBase):
             response.set_error(f"Error analyzing dependencies: {str(e)}")
             return response
 
-    def _build_dependency_graph(self, files: List[Dict[str, Any]]) -> Dict[str, Any]:
+    @staticmethod
+    def _build_dependency_graph(files: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Build dependency graph from file list.
 
@@ -366,7 +566,8 @@ class RepositoryManager(MCPBase):
 
         return graph
 
-    def _calculate_dependency_metrics(self, dependency_graph: Dict[str, Any]) -> Dict[str, Any]:
+    @staticmethod
+    def _calculate_dependency_metrics(dependency_graph: Dict[str, Any]) -> Dict[str, Any]:
         """
         Calculate metrics from dependency graph.
 
@@ -376,13 +577,20 @@ class RepositoryManager(MCPBase):
         Returns:
             Dictionary with metrics
         """
-        total_deps = sum(data['total'] for data in dependency_graph.values())
-
-        # Count most imported modules
-        module_counts = Counter()
+        # One pass: total and a flat list of every imported module
+        total_deps = 0
+        imported: List[str] = []
         for file_data in dependency_graph.values():
-            module_counts.update(file_data['third_party'])
-            module_counts.update(file_data['local'])
+            total_deps += file_data['total']
+            imported += file_data['third_party']
+            imported += file_data['local']
+
+        # Count most imported modules (most_common(n) keeps a heap of n items)
+        module_counts = Counter(imported)
+
+        cycles = RepositoryManager._find_cycles(
+            RepositoryManager._local_import_graph(dependency_graph)
+        )
 
         return {
             'total_dependencies': total_deps,
@@ -391,9 +599,70 @@ class RepositoryManager(MCPBase):
                 {'module': mod, 'count': count}
                 for mod, count in module_counts.most_common(10)
             ],
-            'circular_dependencies': []  # Placeholder for circular dependency detection
+            'circular_dependencies': cycles
         }
 
+    @staticmethod
+    def _local_import_graph(dependency_graph: Dict[str, Any]) -> Dict[str, List[str]]:
+        """
+        Resolve local imports in the dependency graph to the files they load.
+
+        Local imports are recorded by top-level name, so each resolves to
+        that module's file (``name.py``) or package (``name/__init__.py``).
+        Imports of a file's own top-level package are skipped, as they would
+        otherwise all point at its ``__init__.py``.
+
+        Args:
+            dependency_graph: Dependency graph structure
+
+        Returns:
+            Adjacency list mapping each file to the local files it imports
+        """
+        modules: Dict[str, str] = {}
+        for file_rel in dependency_graph:
+            parts = file_rel.replace('\\', '/').split('/')
+            if len(parts) == 1 and parts[0].endswith('.py'):
+                modules.setdefault(parts[0][:-3], file_rel)
+            elif len(parts) == 2 and parts[1] == '__init__.py':
+                modules[parts[0]] = file_rel
+
+        graph: Dict[str, List[str]] = {}
+        for file_rel, file_data in dependency_graph.items():
+            parts = file_rel.replace('\\', '/').split('/')
+            own = parts[0] if len(parts) > 1 else None
+            graph[file_rel] = [
+                modules[name] for name in file_data['local']
+                if name != own and name in modules
+            ]
+
+        return graph
+
+    @staticmethod
+    def _find_cycles(graph: Dict[str, List[str]]) -> List[List[str]]:
+        """
+        Find circular dependencies as strongly connected components.
+
+        Delegates to DependencyGraph.find_circular_dependencies() (iterative
+        Tarjan over CSR arrays, so deep import chains cannot hit the
+        recursion limit). Every component with more than one file, or a file
+        importing itself, is a cycle.
+
+        Args:
+            graph: Adjacency list mapping each file to the files it imports
+
+        Returns:
+            Cycles (each a sorted list of files), largest first
+        """
+        dep_graph = DependencyGraph()
+        dep_graph.add_dependencies_bulk(
+            (file_rel, target) for file_rel, targets in graph.items() for target in targets
+        )
+
+        # Cycles come back closed (first file repeated at the end)
+        cycles = [sorted(cycle[:-1]) for cycle in dep_graph.find_circular_dependencies()]
+        cycles.sort(key=len, reverse=True)
+        return cycles
+
     # ===== Reusability Analysis =====
 
     @read_only
@@ -417,14 +686,15 @@ class RepositoryManager(MCPBase):
         response.add_trace(f"Analyzing reusability: {repo_path}")
 
         try:
-            # Perform full repository analysis
-            analysis_result = self.analyze_repository(repo_path, ignore_patterns)
+            # Shared repository analysis
+            bundle = self._get_bundle(repo_path, ignore_patterns)
 
-            if not analysis_result.success:
-                return analysis_result
+            if not bundle.analysis.get("success"):
+                response.set_error(bundle.analysis.get("error", "Analysis failed"))
+                return response
 
             # Extract reusability summary
-            reusability = analysis_result.data.get('reusability_summary', {})
+            reusability = bundle.analysis.get('reusability_summary', {})
 
             # Filter functions by minimum score
             top_functions = reusability.get('top_reusable_functions', [])
@@ -472,22 +742,18 @@ class RepositoryManager(MCPBase):
         response.add_trace(f"Getting issues summary: {repo_path}")
 
         try:
-            # Perform full repository analysis
-            analysis_result = self.analyze_repository(repo_path, ignore_patterns)
+            # Shared repository analysis
+            bundle = self._get_bundle(repo_path, ignore_patterns)
 
-            if not analysis_result.success:
-                return analysis_result
+            if not bundle.analysis.get("success"):
+                response.set_error(bundle.analysis.get("error", "Analysis failed"))
+                return response
 
             # Extract issues summary
-            issues = analysis_result.data.get('issues_summary', {})
+            issues = bundle.analysis.get('issues_summary', {})
 
-            # Filter by priority if specified
-            top_issues = issues.get('top_issues', [])
-            if priority:
-                top_issues = [
-                    issue for issue in top_issues
-                    if issue.get('priority', '').upper() == priority.upper()
-                ]
+            # Filter by priority if specified (bucketed once per analysis)
+            top_issues = bundle.issues(priority)
 
             response.add_trace(f"Total issues: {issues.get('total_issues', 0)}")
             if priority:
@@ -527,14 +793,15 @@ class RepositoryManager(MCPBase):
         response.add_trace(f"Getting statistics: {repo_path}")
 
         try:
-            # Perform full repository analysis
-            analysis_result = self.analyze_repository(repo_path, ignore_patterns)
+            # Shared repository analysis
+            bundle = self._get_bundle(repo_path, ignore_patterns)
 
-            if not analysis_result.success:
-                return analysis_result
+            if not bundle.analysis.get("success"):
+                response.set_error(bundle.analysis.get("error", "Analysis failed"))
+                return response
 
             # Extract statistics
-            stats = analysis_result.data.get('statistics', {})
+            stats = bundle.analysis.get('statistics', {})
 
             response.add_trace(f"Total files: {stats.get('total_files', 0)}")
             response.add_trace(f"Total functions: {stats.get('total_functions', 0)}")
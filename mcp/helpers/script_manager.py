@@ -12,10 +12,20 @@ This refactors the procedural script_ops.py into a class-based architecture
 using the MCP Core Framework (Phase 1).
 """
 
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from itertools import islice, repeat
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, FrozenSet, List, NamedTuple, Optional, Pattern, Tuple, Union
 import ast
+import fnmatch
+import json
+import os
+import pickle
+import re
 import requests
+from requests.adapters import HTTPAdapter
 
 # MCP Core Framework imports
 from agents.mcp.core import (
@@ -32,6 +42,242 @@ from agents.pulsus.config.settings import load_settings
 from agents.pulsus.ui import display_manager as ui
 
 
+_FUNCTION_NODES = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+# Below this many files a process pool costs more to start than it saves
+_PARALLEL_DEPENDENCY_MIN_FILES = 50
+
+# First top-level def, class or decorator: where a file's import header ends
+_HEADER_END = re.compile(r'^(?:(?:async\s+)?def\b|class\b|@)', re.M)
+
+# Compiled scan patterns: (literal entry names, regex of the globs or None)
+_NamePatterns = Tuple[FrozenSet[str], Optional[Pattern]]
+
+# Module attributes read statically as script metadata
+_METADATA_DUNDERS = {'__domain__': 'domain', '__action__': 'action'}
+
+
+# Operands of an X | Y annotation that ast.unparse never parenthesizes
+_UNION_OPERANDS = (ast.Name, ast.Attribute, ast.Subscript, ast.Constant)
+
+
+def _fmt_ann(node: ast.AST) -> str:
+    """
+    Render an annotation like ast.unparse, without building an unparser.
+
+    Handles names, dotted names, simple constants, subscripts and X | Y
+    unions, which cover almost all annotations; anything else (or any
+    form where ast.unparse would add parentheses or pick other quotes)
+    falls back to ast.unparse.
+    """
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute) and isinstance(node.value, (ast.Name, ast.Attribute)):
+        return f"{_fmt_ann(node.value)}.{node.attr}"
+    if isinstance(node, ast.Subscript) and isinstance(node.value, (ast.Name, ast.Attribute)):
+        index = node.slice
+        if isinstance(index, ast.Tuple) and index.elts:
+            inner = ", ".join(_fmt_ann(elt) for elt in index.elts)
+        else:
+            inner = _fmt_ann(index)
+        return f"{_fmt_ann(node.value)}[{inner}]"
+    if isinstance(node, ast.Constant):
+        value = node.value
+        if value is None or isinstance(value, (bool, int)):
+            return repr(value)
+        if isinstance(value, str) and value.isidentifier():
+            return repr(value)
+    if isinstance(node, ast.List):
+        return f"[{', '.join(_fmt_ann(elt) for elt in node.elts)}]"
+    if (isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitOr)
+            and isinstance(node.left, _UNION_OPERANDS + (ast.BinOp,))
+            and isinstance(node.right, _UNION_OPERANDS)):
+        return f"{_fmt_ann(node.left)} | {_fmt_ann(node.right)}"
+    return ast.unparse(node)
+
+
+class _StructureVisitor(ast.NodeVisitor):
+    """
+    Collect functions, classes and imports of a module in one descent.
+
+    Only statement bodies are descended: expressions cannot hold
+    definitions or imports. Functions and classes are recorded at module
+    and class level; function bodies are still searched for imports, but
+    helpers nested inside them are not reported. Module-level string
+    assignments to __domain__ and __action__ are kept as metadata.
+    """
+
+    def __init__(self):
+        self.functions: List[ast.AST] = []
+        self.classes: List[ast.ClassDef] = []
+        self.imports: List[ast.AST] = []
+        self.metadata: Dict[str, Any] = {}
+        self._function_depth = 0
+        self._class_depth = 0
+
+    def generic_visit(self, node):
+        for field in ('body', 'orelse', 'finalbody', 'handlers', 'cases'):
+            for child in getattr(node, field, ()):
+                self.visit(child)
+
+    def visit_FunctionDef(self, node):
+        if not self._function_depth:
+            self.functions.append(node)
+        self._function_depth += 1
+        self.generic_visit(node)
+        self._function_depth -= 1
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_ClassDef(self, node):
+        if not self._function_depth:
+            self.classes.append(node)
+        self._class_depth += 1
+        self.generic_visit(node)
+        self._class_depth -= 1
+
+    def visit_Assign(self, node):
+        if self._function_depth or self._class_depth or len(node.targets) != 1:
+            return
+        target = node.targets[0]
+        if (isinstance(target, ast.Name) and target.id in _METADATA_DUNDERS
+                and isinstance(node.value, ast.Constant)):
+            self.metadata[_METADATA_DUNDERS[target.id]] = node.value.value
+
+    def visit_Import(self, node):
+        self.imports.append(node)
+
+    visit_ImportFrom = visit_Import
+
+
+class Parsed(NamedTuple):
+    """Content, lines, AST and structure of a Python file, shared between helpers."""
+    content: str
+    lines: List[str]
+    tree: ast.Module
+    structure: _StructureVisitor
+
+
+@lru_cache(maxsize=256)
+def _parsed(path_str: str, mtime_ns: int, size: int) -> Parsed:
+    """
+    Read and parse a Python file once per (path, mtime, size).
+
+    The stat fields are only part of the key: an edited file gets a new
+    key, so stale entries are never returned and age out of the LRU.
+    """
+    content = Path(path_str).read_text(encoding='utf-8')
+    tree = ast.parse(content, filename=path_str)
+    structure = _StructureVisitor()
+    structure.visit(tree)
+    return Parsed(content, content.split('\n'), tree, structure)
+
+
+def _parse_file(file_path: Union[str, Path]) -> Parsed:
+    """
+    Return the cached parse of a Python file.
+
+    Args:
+        file_path: Path to Python file
+
+    Returns:
+        Parsed(content, lines, tree, structure) for the file's current contents
+    """
+    stat = os.stat(file_path)
+    return _parsed(str(file_path), stat.st_mtime_ns, stat.st_size)
+
+
+def _header_imports(content: str, path_str: str) -> List[ast.AST]:
+    """
+    Get the import nodes of a file's header, parsing only the header.
+
+    The header is everything before the first top-level def, class or
+    decorator. Imports made later in the file or inside functions are not
+    seen. A cut that is not valid Python (e.g. a "def" at the start of a
+    docstring line) moves on to the next candidate; after a few, the
+    whole file is parsed instead.
+
+    Args:
+        content: File content
+        path_str: Path to Python file
+
+    Returns:
+        Import and ImportFrom nodes
+    """
+    for end in islice(_HEADER_END.finditer(content), 3):
+        try:
+            header = ast.parse(content[:end.start()], filename=path_str)
+        except SyntaxError:
+            continue
+        structure = _StructureVisitor()
+        structure.visit(header)
+        return structure.imports
+    return _parse_file(path_str).structure.imports
+
+
+def _file_dependencies(path_str: str, relative_path: str, header_only: bool = False) -> Dict[str, Any]:
+    """
+    Build one file's dependency map entry.
+
+    Module-level so it can run in a process pool worker.
+
+    Args:
+        path_str: Path to Python file
+        relative_path: Path relative to the scanned directory
+        header_only: Only collect the imports before the first top-level
+            def or class (see _header_imports)
+
+    Returns:
+        Entry with the file's imports and line count, or its parse error
+    """
+    try:
+        if header_only:
+            content = Path(path_str).read_text(encoding='utf-8')
+            import_nodes = _header_imports(content, path_str)
+        else:
+            parsed = _parse_file(path_str)
+            content, import_nodes = parsed.content, parsed.structure.imports
+    except Exception as e:
+        return {'path': path_str, 'error': str(e)}
+
+    # Extract imports
+    imports = []
+    for node in import_nodes:
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                imports.append({
+                    'type': 'import',
+                    'module': alias.name,
+                    'alias': alias.asname
+                })
+        else:
+            module = node.module or ''
+            for alias in node.names:
+                imports.append({
+                    'type': 'from_import',
+                    'module': module,
+                    'name': alias.name,
+                    'alias': alias.asname
+                })
+
+    return {
+        'path': path_str,
+        'relative_path': relative_path,
+        'imports': imports,
+        'num_imports': len(imports),
+        'lines': len(content.splitlines())
+    }
+
+
+def _path_version(path: str, *args, **kwargs) -> Optional[Tuple[int, int]]:
+    """Cache key part for a file argument: its (mtime_ns, size), None if missing."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
 class ScriptManager(MCPBase):
     """
     Class-based MCP helper for Python script operations.
@@ -65,6 +311,25 @@ class ScriptManager(MCPBase):
         # Load settings
         self.settings = load_settings()
 
+        # One keep-alive session for all LLM calls, pooled for add_comments
+        pool_size = max(self.settings.model.concurrency, 1)
+        self._http = requests.Session()
+        self._http.mount('http://', HTTPAdapter(pool_maxsize=pool_size))
+        self._http.mount('https://', HTTPAdapter(pool_maxsize=pool_size))
+
+    def clear_cache(self) -> MCPResponse:
+        """
+        Drop cached script reads, structure scans and parsed files.
+
+        Returns:
+            MCPResponse confirming the caches were cleared
+        """
+        ScriptManager.read_script.cache_clear()
+        ScriptManager.scan_structure.cache_clear()
+        _parsed.cache_clear()
+
+        return self._create_response(data={'message': 'Script caches cleared'})
+
     # ===== Path Validation =====
 
     def _validate_path(self, path: str) -> MCPResponse:
@@ -109,7 +374,7 @@ class ScriptManager(MCPBase):
     # ===== Script Reading & Analysis =====
 
     @read_only
-    @cached(ttl=60)
+    @cached(ttl=60, maxsize=128, version=_path_version)
     def read_script(self, path: str) -> MCPResponse:
         """
         Read and analyze a Python script.
@@ -120,7 +385,8 @@ class ScriptManager(MCPBase):
         - Extracts metadata
         - Returns structured information
 
-        Results are cached for 60 seconds for performance.
+        Results are cached for 60 seconds (128 scripts at most); editing
+        the file invalidates its entry.
 
         Args:
             path: Path to the Python script
@@ -140,7 +406,7 @@ class ScriptManager(MCPBase):
 
         try:
             # Read content
-            content = file_path.read_text(encoding='utf-8')
+            content = _parse_file(file_path).content
             response.add_trace(f"Read {len(content)} bytes")
 
             # Perform AST analysis
@@ -172,46 +438,52 @@ class ScriptManager(MCPBase):
             file_path: Path to Python file
 
         Returns:
-            Dictionary containing functions, classes, imports, and module docstring
+            Dictionary containing functions, classes, imports, module docstring
+            and the one-line function/class summaries used in prompts
         """
         try:
-            content = file_path.read_text(encoding='utf-8')
-            tree = ast.parse(content)
+            _, _, tree, structure = _parse_file(file_path)
 
             analysis = {
                 "functions": [],
                 "classes": [],
                 "imports": [],
-                "module_docstring": ast.get_docstring(tree) or ""
+                "module_docstring": ast.get_docstring(tree) or "",
+                "function_summaries": [],
+                "class_summaries": []
             }
 
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    func_info = {
-                        "name": node.name,
-                        "args": [arg.arg for arg in node.args.args],
-                        "docstring": ast.get_docstring(node) or "",
-                        "line": node.lineno
-                    }
-                    analysis["functions"].append(func_info)
-
-                elif isinstance(node, ast.ClassDef):
-                    class_info = {
-                        "name": node.name,
-                        "methods": [m.name for m in node.body if isinstance(m, ast.FunctionDef)],
-                        "docstring": ast.get_docstring(node) or "",
-                        "line": node.lineno
-                    }
-                    analysis["classes"].append(class_info)
+            # Prompt summary lines are built here, where the docstrings are at hand
+            for node in structure.functions:
+                func_info = {
+                    "name": node.name,
+                    "args": [arg.arg for arg in node.args.args],
+                    "docstring": ast.get_docstring(node) or "",
+                    "line": node.lineno
+                }
+                analysis["functions"].append(func_info)
+                analysis["function_summaries"].append(
+                    f"- {func_info['name']}({', '.join(func_info['args'])}): {func_info['docstring'][:100]}"
+                )
 
-                elif isinstance(node, (ast.Import, ast.ImportFrom)):
-                    if isinstance(node, ast.Import):
-                        for alias in node.names:
-                            analysis["imports"].append(alias.name)
-                    else:
-                        module = node.module or ""
-                        for alias in node.names:
-                            analysis["imports"].append(f"{module}.{alias.name}")
+            for node in structure.classes:
+                class_info = {
+                    "name": node.name,
+                    "methods": [m.name for m in node.body if isinstance(m, _FUNCTION_NODES)],
+                    "docstring": ast.get_docstring(node) or "",
+                    "line": node.lineno
+                }
+                analysis["classes"].append(class_info)
+                analysis["class_summaries"].append(f"- {class_info['name']}: {class_info['docstring'][:100]}")
+
+            for node in structure.imports:
+                if isinstance(node, ast.Import):
+                    for alias in node.names:
+                        analysis["imports"].append(alias.name)
+                else:
+                    module = node.module or ""
+                    for alias in node.names:
+                        analysis["imports"].append(f"{module}.{alias.name}")
 
             return analysis
 
@@ -220,7 +492,10 @@ class ScriptManager(MCPBase):
 
     def _load_module_metadata(self, file_path: Path) -> Dict[str, Any]:
         """
-        Load module and extract metadata attributes like __domain__, __action__.
+        Extract metadata attributes like __domain__, __action__ without importing.
+
+        The values are read from module-level constant assignments in the
+        AST, so the script's imports and top-level code are never executed.
 
         Args:
             file_path: Path to Python file
@@ -228,8 +503,6 @@ class ScriptManager(MCPBase):
         Returns:
             Dictionary with metadata
         """
-        import importlib.util
-
         metadata = {
             "domain": None,
             "action": None,
@@ -237,13 +510,10 @@ class ScriptManager(MCPBase):
         }
 
         try:
-            spec = importlib.util.spec_from_file_location(file_path.stem, file_path)
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
+            _, _, tree, structure = _parse_file(file_path)
 
-            metadata["domain"] = getattr(module, "__domain__", None)
-            metadata["action"] = getattr(module, "__action__", None)
-            metadata["doc"] = getattr(module, "__doc__", None)
+            metadata.update(structure.metadata)
+            metadata["doc"] = ast.get_docstring(tree, clean=False)
 
         except Exception as e:
             metadata["error"] = str(e)
@@ -326,15 +596,8 @@ class ScriptManager(MCPBase):
             Markdown documentation content
         """
         # Build structured prompt for comprehensive documentation
-        functions_list = "\n".join([
-            f"- {f['name']}({', '.join(f['args'])}): {f['docstring'][:100]}"
-            for f in ast_analysis.get('functions', [])
-        ])
-
-        classes_list = "\n".join([
-            f"- {c['name']}: {c['docstring'][:100]}"
-            for c in ast_analysis.get('classes', [])
-        ])
+        functions_list = "\n".join(ast_analysis.get('function_summaries', []))
+        classes_list = "\n".join(ast_analysis.get('class_summaries', []))
 
         prompt = f"""Create comprehensive documentation in Markdown format for this Python script.
 
@@ -401,27 +664,39 @@ Write in clear, professional technical documentation style. Be comprehensive but
             ui.info("Generating comprehensive documentation with LLM (this may take 30-60 seconds)...")
             ui.info("📝 Analyzing code structure and relationships...")
 
-            response = requests.post(
+            # Stream the reply: the read timeout then applies per chunk, and
+            # an error surfaces with the first line instead of after 2048 tokens
+            with self._http.post(
                 f"{self.settings.model.host}/api/generate",
                 json={
                     "model": self.settings.model.name,
                     "prompt": prompt,
-                    "stream": False,
+                    "stream": True,
                     "options": {
                         "temperature": 0.2,
                         "num_predict": 2048,
                     }
                 },
-                timeout=120
-            )
-
-            if response.status_code == 200:
-                result = response.json()
-                ui.success("✓ Documentation generated successfully!")
-                return result.get("response", "").strip()
-            else:
-                ui.warn(f"LLM request failed (status {response.status_code}). Using fallback documentation.")
-                return self._generate_fallback_documentation(file_path, ast_analysis, metadata)
+                timeout=120,
+                stream=True
+            ) as response:
+                if response.status_code != 200:
+                    ui.warn(f"LLM request failed (status {response.status_code}). Using fallback documentation.")
+                    return self._generate_fallback_documentation(file_path, ast_analysis, metadata)
+
+                parts = []
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    chunk = json.loads(line)
+                    if "error" in chunk:
+                        raise RuntimeError(chunk["error"])
+                    parts.append(chunk.get("response", ""))
+                    if chunk.get("done"):
+                        break
+
+            ui.success("✓ Documentation generated successfully!")
+            return "".join(parts).strip()
 
         except requests.exceptions.ConnectionError:
             ui.warn(f"Cannot connect to Ollama at {self.settings.model.host}. Using fallback documentation.")
@@ -444,51 +719,52 @@ Write in clear, professional technical documentation style. Be comprehensive but
         Returns:
             Basic markdown documentation
         """
-        doc = f"# {file_path.name}\n\n"
-        doc += "## Overview\n\n"
-        doc += f"{ast_analysis.get('module_docstring', 'No description available.')}\n\n"
+        parts = [
+            f"# {file_path.name}\n\n",
+            "## Overview\n\n",
+            f"{ast_analysis.get('module_docstring', 'No description available.')}\n\n",
+        ]
+        append = parts.append
 
         # Metadata
         if metadata.get('domain') or metadata.get('action'):
-            doc += "## Metadata\n\n"
+            append("## Metadata\n\n")
             if metadata.get('domain'):
-                doc += f"- **Domain**: {metadata['domain']}\n"
+                append(f"- **Domain**: {metadata['domain']}\n")
             if metadata.get('action'):
-                doc += f"- **Action**: {metadata['action']}\n"
-            doc += "\n"
+                append(f"- **Action**: {metadata['action']}\n")
+            append("\n")
 
         # Functions
         if ast_analysis.get('functions'):
-            doc += "## Functions\n\n"
+            append("## Functions\n\n")
             for func in ast_analysis['functions']:
-                args = ', '.join(func['args'])
-                doc += f"### `{func['name']}({args})`\n\n"
+                append(f"### `{func['name']}({', '.join(func['args'])})`\n\n")
                 if func['docstring']:
-                    doc += f"{func['docstring']}\n\n"
-                doc += f"**Line**: {func['line']}\n\n"
+                    append(f"{func['docstring']}\n\n")
+                append(f"**Line**: {func['line']}\n\n")
 
         # Classes
         if ast_analysis.get('classes'):
-            doc += "## Classes\n\n"
+            append("## Classes\n\n")
             for cls in ast_analysis['classes']:
-                doc += f"### `{cls['name']}`\n\n"
+                append(f"### `{cls['name']}`\n\n")
                 if cls['docstring']:
-                    doc += f"{cls['docstring']}\n\n"
+                    append(f"{cls['docstring']}\n\n")
                 if cls['methods']:
-                    doc += f"**Methods**: {', '.join(cls['methods'])}\n\n"
-                doc += f"**Line**: {cls['line']}\n\n"
+                    append(f"**Methods**: {', '.join(cls['methods'])}\n\n")
+                append(f"**Line**: {cls['line']}\n\n")
 
         # Imports
         if ast_analysis.get('imports'):
-            doc += "## Dependencies\n\n"
-            for imp in ast_analysis['imports'][:20]:
-                doc += f"- `{imp}`\n"
-            doc += "\n"
+            append("## Dependencies\n\n")
+            parts.extend(f"- `{imp}`\n" for imp in ast_analysis['imports'][:20])
+            append("\n")
 
-        doc += "---\n"
-        doc += f"*Auto-generated documentation by Pulsus MCP*\n"
+        append("---\n")
+        append("*Auto-generated documentation by Pulsus MCP*\n")
 
-        return doc
+        return "".join(parts)
 
     # ===== Function Commenting =====
 
@@ -533,22 +809,33 @@ Write in clear, professional technical documentation style. Be comprehensive but
 
             # Get file context
             try:
-                content = file_path.read_text(encoding='utf-8')
-                tree = ast.parse(content)
+                tree = _parse_file(file_path).tree
                 file_context = ast.get_docstring(tree) or f"Python module: {file_path.name}"
             except:
                 file_context = f"Python module: {file_path.name}"
 
-            # Generate comments for each function
-            comments = []
+            # Generate comments concurrently; each call waits on the LLM
             total_funcs = len(functions)
+            workers = max(1, min(self.settings.model.concurrency, total_funcs))
+
+            if show_progress:
+                ui.info(f"Generating docstrings for {total_funcs} functions ({workers} at a time)...")
+
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="docstring") as executor:
+                futures = [
+                    executor.submit(self._generate_function_comment, func, file_context)
+                    for func in functions
+                ]
+                names = {future: func['name'] for future, func in zip(futures, functions)}
 
-            for idx, func in enumerate(functions, 1):
-                # Show progress to user
-                if show_progress:
-                    ui.info(f"Generating docstring for {func['name']}() [{idx}/{total_funcs}]...")
+                for done, future in enumerate(as_completed(futures), 1):
+                    # Show progress to user
+                    if show_progress:
+                        ui.info(f"Generated docstring for {names[future]}() [{done}/{total_funcs}]")
 
-                comment = self._generate_function_comment(func, file_context)
+            comments = []
+            for func, future in zip(functions, futures):
+                comment = future.result()
                 formatted_comment = self._format_docstring(comment)
 
                 comments.append({
@@ -583,38 +870,36 @@ Write in clear, professional technical documentation style. Be comprehensive but
             List of dictionaries containing function information
         """
         try:
-            content = file_path.read_text(encoding='utf-8')
-            tree = ast.parse(content)
+            structure = _parse_file(file_path).structure
 
             functions = []
 
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    # Extract function signature
-                    args_list = []
-                    for arg in node.args.args:
-                        arg_str = arg.arg
-                        if arg.annotation:
-                            arg_str += f": {ast.unparse(arg.annotation)}"
-                        args_list.append(arg_str)
-
-                    # Get return annotation
-                    returns = ""
-                    if node.returns:
-                        returns = ast.unparse(node.returns)
-
-                    # Extract source code
-                    source = self._extract_function_source(file_path, node)
-
-                    func_info = {
-                        "name": node.name,
-                        "args": args_list,
-                        "returns": returns,
-                        "line": node.lineno,
-                        "existing_docstring": ast.get_docstring(node) or "",
-                        "source": source
-                    }
-                    functions.append(func_info)
+            for node in structure.functions:
+                # Extract function signature
+                args_list = []
+                for arg in node.args.args:
+                    arg_str = arg.arg
+                    if arg.annotation:
+                        arg_str += f": {_fmt_ann(arg.annotation)}"
+                    args_list.append(arg_str)
+
+                # Get return annotation
+                returns = ""
+                if node.returns:
+                    returns = _fmt_ann(node.returns)
+
+                # Extract source code
+                source = self._extract_function_source(file_path, node)
+
+                func_info = {
+                    "name": node.name,
+                    "args": args_list,
+                    "returns": returns,
+                    "line": node.lineno,
+                    "existing_docstring": ast.get_docstring(node) or "",
+                    "source": source
+                }
+                functions.append(func_info)
 
             return functions
 
@@ -633,8 +918,7 @@ Write in clear, professional technical documentation style. Be comprehensive but
             Source code of the function as string
         """
         try:
-            content = file_path.read_text(encoding='utf-8')
-            lines = content.split('\n')
+            lines = _parse_file(file_path).lines
 
             start_line = func_node.lineno - 1
             end_line = func_node.end_lineno if hasattr(func_node, 'end_lineno') else start_line + 10
@@ -680,7 +964,7 @@ Use Google-style docstring format. Be concise but thorough.
 Output ONLY the docstring text (no code fences, no extra commentary)."""
 
         try:
-            response = requests.post(
+            response = self._http.post(
                 f"{self.settings.model.host}/api/generate",
                 json={
                     "model": self.settings.model.name,
@@ -747,18 +1031,21 @@ Or set OLLAMA_HOST environment variable to a different endpoint.
     # ===== Structure Scanning =====
 
     @read_only
-    @cached(ttl=300)
+    @cached(ttl=300, maxsize=32)
     def scan_structure(self, base_dir: str, include_patterns: Optional[List[str]] = None,
-                      exclude_patterns: Optional[List[str]] = None) -> MCPResponse:
+                      exclude_patterns: Optional[List[str]] = None,
+                      header_only: bool = False) -> MCPResponse:
         """
         Scan directory structure and create dependency map.
 
-        Safe read-only operation. Results cached for 5 minutes.
+        Safe read-only operation. Results cached for 5 minutes (32 scans at most).
 
         Args:
             base_dir: Base directory to scan
-            include_patterns: Optional list of glob patterns to include (e.g., ['*.py'])
-            exclude_patterns: Optional list of patterns to exclude (e.g., ['__pycache__', '*.pyc'])
+            include_patterns: Optional list of file names or glob patterns to include (e.g., ['*.py'])
+            exclude_patterns: Optional list of entry names or glob patterns to exclude (e.g., ['__pycache__', '*.pyc'])
+            header_only: Only map the imports before each file's first top-level
+                def or class, parsing just that header (faster on large trees)
 
         Returns:
             MCPResponse with structure, dependency map, and statistics
@@ -786,12 +1073,14 @@ Or set OLLAMA_HOST environment variable to a different endpoint.
             response.add_trace(f"Include patterns: {include_patterns}")
             response.add_trace(f"Exclude patterns: {exclude_patterns}")
 
-            # Scan directory structure
-            structure = self._build_directory_tree(base_path, include_patterns, exclude_patterns)
+            # Scan directory structure, collecting included files on the way
+            included = self._compile_name_patterns(include_patterns)
+            excluded = self._compile_name_patterns(exclude_patterns)
+            python_files = []
+            structure = self._build_directory_tree(base_path, included, excluded, python_files)
 
             # Analyze Python files for dependencies
-            python_files = self._find_python_files(base_path, include_patterns, exclude_patterns)
-            dependency_map = self._build_dependency_map(python_files, base_path)
+            dependency_map = self._build_dependency_map(python_files, base_path, header_only)
 
             # Calculate statistics
             statistics = self._calculate_statistics(structure, dependency_map)
@@ -810,116 +1099,102 @@ Or set OLLAMA_HOST environment variable to a different endpoint.
             response.set_error(f"Error scanning structure: {str(e)}")
             return response
 
-    def _build_directory_tree(self, base_path: Path, include_patterns: List[str],
-                             exclude_patterns: List[str]) -> Dict[str, Any]:
-        """Build hierarchical directory tree structure."""
+    def _build_directory_tree(self, directory: Union[Path, os.DirEntry], included: _NamePatterns,
+                             excluded: _NamePatterns, python_files: List[str]) -> Dict[str, Any]:
+        """
+        Build hierarchical directory tree structure with one scandir per directory.
+
+        Subdirectories are passed down as their DirEntry, so no Path is built
+        per entry. Included files are also appended to python_files, so the
+        dependency map does not need a second walk. Symlinked directories
+        are not followed.
+        """
         tree = {
-            'name': base_path.name,
-            'path': str(base_path),
+            'name': directory.name,
+            'path': os.fspath(directory),
             'type': 'directory',
             'children': []
         }
 
         try:
-            for item in sorted(base_path.iterdir()):
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda entry: os.path.normcase(entry.name))
+
+            for entry in entries:
                 # Check if excluded
-                if self._should_exclude(item, exclude_patterns):
+                if self._matches_name(entry.name, excluded):
                     continue
 
-                if item.is_dir():
+                if entry.is_dir(follow_symlinks=False):
                     # Recursively build subdirectory tree
-                    subtree = self._build_directory_tree(item, include_patterns, exclude_patterns)
+                    subtree = self._build_directory_tree(entry, included, excluded, python_files)
                     tree['children'].append(subtree)
-                elif item.is_file():
+                elif entry.is_file():
                     # Check if file matches include patterns
-                    if self._should_include(item, include_patterns):
+                    if self._matches_name(entry.name, included):
                         tree['children'].append({
-                            'name': item.name,
-                            'path': str(item),
+                            'name': entry.name,
+                            'path': entry.path,
                             'type': 'file',
-                            'size': item.stat().st_size
+                            'size': entry.stat().st_size
                         })
+                        python_files.append(entry.path)
 
         except PermissionError:
             pass
 
         return tree
 
-    def _should_exclude(self, path: Path, exclude_patterns: List[str]) -> bool:
-        """Check if path should be excluded."""
-        for pattern in exclude_patterns:
-            if pattern in str(path):
-                return True
-            if path.match(pattern):
-                return True
-        return False
-
-    def _should_include(self, path: Path, include_patterns: List[str]) -> bool:
-        """Check if path should be included."""
-        for pattern in include_patterns:
-            if path.match(pattern):
-                return True
-        return False
-
-    def _find_python_files(self, base_path: Path, include_patterns: List[str],
-                          exclude_patterns: List[str]) -> List[Path]:
-        """Find all Python files in directory."""
-        python_files = []
-
-        for pattern in include_patterns:
-            for file_path in base_path.rglob(pattern):
-                if file_path.is_file() and not self._should_exclude(file_path, exclude_patterns):
-                    python_files.append(file_path)
-
-        return python_files
-
-    def _build_dependency_map(self, python_files: List[Path], base_path: Path) -> Dict[str, Any]:
-        """Build dependency map for Python files."""
-        dependency_map = {}
-
-        for file_path in python_files:
-            try:
-                content = file_path.read_text(encoding='utf-8')
-                tree = ast.parse(content)
-
-                # Extract imports
-                imports = []
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.Import):
-                        for alias in node.names:
-                            imports.append({
-                                'type': 'import',
-                                'module': alias.name,
-                                'alias': alias.asname
-                            })
-                    elif isinstance(node, ast.ImportFrom):
-                        module = node.module or ''
-                        for alias in node.names:
-                            imports.append({
-                                'type': 'from_import',
-                                'module': module,
-                                'name': alias.name,
-                                'alias': alias.asname
-                            })
-
-                # Get file info
-                relative_path = file_path.relative_to(base_path)
-
-                dependency_map[str(relative_path)] = {
-                    'path': str(file_path),
-                    'relative_path': str(relative_path),
-                    'imports': imports,
-                    'num_imports': len(imports),
-                    'lines': len(content.splitlines())
-                }
+    @staticmethod
+    def _compile_name_patterns(patterns: List[str]) -> _NamePatterns:
+        """
+        Split name patterns into literal names and one compiled glob regex.
 
-            except Exception as e:
-                dependency_map[str(file_path.relative_to(base_path))] = {
-                    'path': str(file_path),
-                    'error': str(e)
-                }
+        Args:
+            patterns: Entry names (e.g. '.git') or globs (e.g. '*.py')
 
-        return dependency_map
+        Returns:
+            Tuple of (literal names, regex matching any glob or None)
+        """
+        patterns = [os.path.normcase(pattern) for pattern in patterns]
+        names = frozenset(p for p in patterns if not any(c in p for c in '*?['))
+        globs = [fnmatch.translate(p) for p in patterns if p not in names]
+        return names, re.compile('|'.join(globs)) if globs else None
+
+    @staticmethod
+    def _matches_name(name: str, patterns: _NamePatterns) -> bool:
+        """Check if a directory entry name matches compiled name patterns."""
+        names, globs = patterns
+        name = os.path.normcase(name)
+        return name in names or (globs is not None and globs.match(name) is not None)
+
+    def _build_dependency_map(self, python_files: List[str], base_path: Path,
+                              header_only: bool = False) -> Dict[str, Any]:
+        """
+        Build dependency map for Python files.
+
+        Large scans parse in a process pool (ast.parse holds the GIL);
+        small ones, or a pool that cannot start, run here and share the
+        parse cache.
+        """
+        paths = [os.fspath(file_path) for file_path in python_files]
+        relative_paths = [os.path.relpath(path, base_path) for path in paths]
+
+        entries = None
+        if len(paths) >= _PARALLEL_DEPENDENCY_MIN_FILES:
+            try:
+                workers = os.cpu_count() or 1
+                chunksize = max(1, len(paths) // (4 * workers))
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    entries = list(executor.map(_file_dependencies, paths, relative_paths,
+                                                repeat(header_only), chunksize=chunksize))
+            except (OSError, BrokenProcessPool, pickle.PicklingError) as e:
+                ui.warn(f"Process pool unavailable ({e}), scanning sequentially")
+
+        if entries is None:
+            entries = [_file_dependencies(p, rel, header_only) for p, rel in zip(paths, relative_paths)]
+
+        return dict(zip(relative_paths, entries))
 
     def _calculate_statistics(self, structure: Dict[str, Any],
                              dependency_map: Dict[str, Any]) -> Dict[str, Any]:
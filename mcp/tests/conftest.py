@@ -0,0 +1,57 @@
+"""
+Shared fixtures for the MCP helper tests.
+
+Puts the testudo root on sys.path once for every test module and provides
+the small sample repository used by the analyzer and manager tests.
+"""
+
+import pytest
+from pathlib import Path
+import sys
+
+# Add testudo to path
+testudo_root = Path(__file__).parents[3]
+if str(testudo_root) not in sys.path:
+    sys.path.insert(0, str(testudo_root))
+
+
+SAMPLE_FILES = {
+    'pkg/__init__.py': '',
+    'pkg/io_utils.py': (
+        '"""Read and write helpers."""\n'
+        'import json\n'
+        'import requests\n'
+        'def load_config(path):\n'
+        '    """Load a JSON configuration file from disk."""\n'
+        '    return json.loads(open(path).read())\n'
+    ),
+    'pkg/runner.py': (
+        'from pkg import io_utils\n'
+        'import requests\n'
+        'class Runner:\n'
+        '    def run(self):\n'
+        '        return io_utils.load_config("C:\\\\cfg.json")\n'
+    ),
+    'main.py': 'from pkg.runner import Runner\nRunner().run()\n',
+}
+
+
+def _write_repo(root, files):
+    """Create a repository from {relative path: content}"""
+    for rel, content in files.items():
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding='utf-8')
+    return root
+
+
+@pytest.fixture
+def write_repo():
+    """Get the helper creating a repository from {relative path: content}"""
+    return _write_repo
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Create the sample repository (a package, a runner and a main script)"""
+    return _write_repo(tmp_path / 'repo', SAMPLE_FILES)
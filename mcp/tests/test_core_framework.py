@@ -79,6 +79,20 @@ class TestMCPResponse:
         assert response.error == 'Something went wrong'
         assert response.status == MCPStatus.ERROR
 
+    def test_clone(self):
+        """Test cloning a response keeps containers independent"""
+        response = MCPResponse.success_response(data={'test': 'value'})
+        response.add_trace('Step 1')
+
+        clone = response.clone()
+        clone.add_trace('Step 2')
+        clone.context['cached'] = True
+
+        assert clone.data is response.data
+        assert response.trace == ['Step 1']
+        assert 'cached' not in response.context
+        assert clone.metadata == response.metadata
+
     def test_to_dict(self):
         """Test converting response to dictionary"""
         response = MCPResponse.success_response(data={'test': 'value'})
@@ -226,6 +240,38 @@ class TestDecorators:
         assert result3.data['count'] == 2  # New call
         assert result3.context.get('cached') is False
 
+    def test_cached_decorator_bounds_and_versions(self):
+        """Test cached decorator LRU bound, version key and cache_clear"""
+        versions = {}
+
+        class VersionedHelper(MCPBase):
+            def __init__(self):
+                super().__init__()
+                self.call_count = 0
+
+            @read_only
+            @cached(ttl=10, maxsize=2, version=versions.get)
+            def expensive_operation(self, param: str) -> MCPResponse:
+                self.call_count += 1
+                return MCPResponse.success_response(data={'count': self.call_count})
+
+        helper = VersionedHelper()
+
+        helper.expensive_operation('a')
+        helper.expensive_operation('b')
+        helper.expensive_operation('a')      # hit, 'a' becomes most recent
+        helper.expensive_operation('c')      # evicts 'b'
+        assert helper.expensive_operation('a').context['cached'] is True
+        assert helper.expensive_operation('b').context['cached'] is False
+        assert helper.call_count == 4
+
+        versions['b'] = 1                    # changed input misses
+        assert helper.expensive_operation('b').context['cached'] is False
+
+        VersionedHelper.expensive_operation.cache_clear()
+        assert helper.expensive_operation('b').context['cached'] is False
+        assert helper.call_count == 6
+
     def test_restricted_write_decorator(self):
         """Test restricted_write decorator"""
 
@@ -0,0 +1,410 @@
+"""
+Unit Tests for Model Inspector
+
+Tests for ModelInspector's query and properties caches, name search and
+listing, using small fake Aimsun and QGIS catalogs.
+"""
+
+import gc
+import types
+import pytest
+
+from mcp.helpers import model_inspector
+from mcp.helpers.model_inspector import ModelInspector, _catalog_cache
+
+
+# ========== Fake Platform Objects ==========
+
+class GKSection:
+    """Fake Aimsun section"""
+
+    def __init__(self, obj_id, name, stamp=None):
+        self._id = obj_id
+        self._name = name
+        self.stamp = stamp
+        self.getter_calls = 0
+
+    def getId(self):
+        return self._id
+
+    def getName(self):
+        return self._name
+
+    def getSpeed(self):
+        self.getter_calls += 1
+        return 50.0
+
+    def getModificationStamp(self):
+        if self.stamp is None:
+            raise RuntimeError('not tracked')
+        return self.stamp
+
+
+class GKNode(GKSection):
+    """Fake Aimsun node"""
+
+    def getPosition(self):
+        return None
+
+
+class FakeCatalog:
+    """Fake Aimsun catalog, optionally stamped and file-backed"""
+
+    def __init__(self, objects, stamp=None, path=None):
+        self.objects = objects
+        self.stamp = stamp
+        self.path = path
+        self.calls = 0
+
+    def getObjectsOfType(self, object_type):
+        self.calls += 1
+        return [obj for obj in self.objects if type(obj).__name__ == object_type]
+
+    def getModificationTime(self):
+        if self.stamp is None:
+            raise RuntimeError('not stamped')
+        return self.stamp
+
+    def getDocumentFileName(self):
+        return self.path
+
+
+class FakeFolder:
+    """Fake Aimsun folder"""
+
+    def __init__(self, objects):
+        self.objects = objects
+
+    def getContents(self):
+        return iter(self.objects)
+
+
+class QgsVectorLayer:
+    """Fake QGIS vector layer"""
+
+    def __init__(self, name):
+        self._name = name
+
+    def name(self):
+        return self._name
+
+
+class QgsRasterLayer(QgsVectorLayer):
+    """Fake QGIS raster layer"""
+
+
+class FakeProject:
+    """Fake QGIS project"""
+
+    def __init__(self, layers):
+        self.layers = layers
+
+    def mapLayers(self):
+        return dict(self.layers)
+
+
+def _sections(count, stamp=None):
+    """Create sections named Road0..Road9, Road0.. cyclically"""
+    return [GKSection(i, f'Road{i % 10}-{i}', stamp) for i in range(count)]
+
+
+@pytest.fixture(autouse=True)
+def clear_query_cache():
+    """Isolate the process-wide catalog query cache between tests"""
+    ModelInspector.query_catalog.cache_clear()
+    yield
+    ModelInspector.query_catalog.cache_clear()
+
+
+@pytest.fixture
+def inspector():
+    """Create an Aimsun ModelInspector without tracing"""
+    return ModelInspector(platform='aimsun', tracing=False)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the cache clock with a controllable one"""
+    now = [1000.0]
+    monkeypatch.setattr(model_inspector, 'time', types.SimpleNamespace(time=lambda: now[0]))
+    return now
+
+
+# ========== Query Cache Tests ==========
+
+class TestQueryCatalogCache:
+    """Test catalog query caching"""
+
+    def test_cache_hit(self, inspector):
+        """Test that a repeated query is served from cache"""
+        catalog = FakeCatalog(_sections(3))
+
+        first = inspector.query_catalog(catalog, 'GKSection')
+        second = inspector.query_catalog(catalog, 'GKSection')
+
+        assert catalog.calls == 1
+        assert first.context['cached'] is False
+        assert second.context['cached'] is True
+        assert second.data == first.data
+        assert sorted(second.data) == [
+            'catalog_type', 'filter_applied', 'object_count', 'object_type', 'objects'
+        ]
+
+    def test_stamp_invalidation(self, inspector, clock):
+        """Test that stamped entries last until the stamp changes"""
+        catalog = FakeCatalog(_sections(3), stamp=1)
+
+        inspector.query_catalog(catalog, 'GKSection')
+        clock[0] += 3600
+        assert inspector.query_catalog(catalog, 'GKSection').context['cached'] is True
+
+        catalog.stamp = 2
+        catalog.objects.append(GKSection(99, 'New'))
+        result = inspector.query_catalog(catalog, 'GKSection')
+
+        assert result.context['cached'] is False
+        assert result.data['object_count'] == 4
+        assert catalog.calls == 2
+
+    def test_ttl_expiry(self, inspector, clock):
+        """Test that unstamped entries expire after the TTL"""
+        catalog = FakeCatalog(_sections(3))
+
+        inspector.query_catalog(catalog, 'GKSection')
+        clock[0] += 59
+        assert inspector.query_catalog(catalog, 'GKSection').context['cached'] is True
+        clock[0] += 1
+        assert inspector.query_catalog(catalog, 'GKSection').context['cached'] is False
+        assert catalog.calls == 2
+
+    def test_lru_eviction(self, clock):
+        """Test that the least recently used entry is evicted when full"""
+        class Probe(ModelInspector):
+            @_catalog_cache(ttl=60, maxsize=2)
+            def query(self, catalog, object_type=None, filter_criteria=None):
+                return ModelInspector.query_catalog.__wrapped__.__wrapped__(self, catalog, object_type)
+
+        probe = Probe(tracing=False)
+        catalogs = [FakeCatalog(_sections(1)) for _ in range(3)]
+
+        probe.query(catalogs[0], 'GKSection')
+        probe.query(catalogs[1], 'GKSection')
+        probe.query(catalogs[0], 'GKSection')
+        probe.query(catalogs[2], 'GKSection')
+
+        assert probe.query(catalogs[0], 'GKSection').context['cached'] is True
+        assert probe.query(catalogs[1], 'GKSection').context['cached'] is False
+
+    def test_collected_catalog_entries_are_dropped(self, inspector):
+        """Test that a recycled id() never serves a dead catalog's results"""
+        catalog = FakeCatalog(_sections(3))
+        inspector.query_catalog(catalog, 'GKSection')
+
+        del catalog
+        gc.collect()
+
+        assert not any(key[1][0] == 'id' for key in _query_cache_keys())
+
+    def test_file_backed_catalogs_share_entries(self, inspector):
+        """Test that catalogs are identified by their document path"""
+        first = FakeCatalog(_sections(3), stamp=1, path='/models/city.ang')
+        second = FakeCatalog(_sections(3), stamp=1, path='/models/city.ang')
+
+        inspector.query_catalog(first, 'GKSection')
+        result = inspector.query_catalog(second, 'GKSection')
+
+        assert result.context['cached'] is True
+        assert second.calls == 0
+
+
+def _query_cache_keys():
+    """Get the keys of the process-wide catalog query cache"""
+    wrapper = ModelInspector.query_catalog.__wrapped__
+    cache = next(
+        cell.cell_contents for cell in wrapper.__closure__
+        if isinstance(cell.cell_contents, dict)
+    )
+    return list(cache)
+
+
+# ========== Properties Cache Tests ==========
+
+class TestPropertiesCache:
+    """Test get_object_properties caching"""
+
+    def test_stamped_object_is_cached(self, inspector):
+        """Test that properties are cached until the object's stamp changes"""
+        section = GKSection(1, 'Main', stamp=1)
+
+        first = inspector.get_object_properties(section)
+        second = inspector.get_object_properties(section)
+        assert first.data['properties']['speed'] == '50.0'
+        assert second.context['cached'] is True
+        assert section.getter_calls == 2  # getSpeed: section branch + generic getters
+
+        section.stamp = 2
+        third = inspector.get_object_properties(section)
+        assert third.context.get('cached') is not True
+        assert section.getter_calls == 4
+
+    def test_unstamped_object_is_not_cached(self, inspector):
+        """Test that objects without a stamp are always re-inspected"""
+        section = GKSection(1, 'Main')
+
+        inspector.get_object_properties(section)
+        result = inspector.get_object_properties(section)
+
+        assert result.context.get('cached') is not True
+        assert not inspector._props_cache
+
+    def test_entries_dropped_with_object(self, inspector):
+        """Test that entries are removed when the object is collected"""
+        section = GKSection(1, 'Main', stamp=1)
+        inspector.get_object_properties(section)
+        assert len(inspector._props_cache) == 1
+
+        del section
+        gc.collect()
+
+        assert not inspector._props_cache
+
+    def test_failing_getter_is_not_pruned(self, inspector):
+        """Test that a getter failing on one instance still runs on others"""
+        class GKCentroid:
+            def __init__(self, ok):
+                self.ok = ok
+
+            def getLabel(self):
+                if not self.ok:
+                    raise RuntimeError('no label')
+                return 'label'
+
+        first = inspector.get_object_properties(GKCentroid(False))
+        second = inspector.get_object_properties(GKCentroid(True))
+
+        assert 'label' not in first.data['properties']
+        assert second.data['properties']['label'] == 'label'
+
+
+# ========== Search Tests ==========
+
+SEARCH_PATHS = [
+    pytest.param(True, True, id='arrow'),
+    pytest.param(False, True, id='bloom-numpy'),
+    pytest.param(False, False, id='bloom-list'),
+]
+
+
+class TestSearchObjects:
+    """Test name search paths"""
+
+    @pytest.mark.parametrize('use_arrow,use_numpy', SEARCH_PATHS)
+    def test_search_paths_agree(self, inspector, monkeypatch, use_arrow, use_numpy):
+        """Test that Arrow, bloom and plain scans return the same matches"""
+        if use_arrow and not model_inspector._HAS_PYARROW:
+            pytest.skip('pyarrow not installed')
+        if use_numpy and not model_inspector._HAS_NUMPY:
+            pytest.skip('numpy not installed')
+        monkeypatch.setattr(model_inspector, '_HAS_PYARROW', use_arrow)
+        monkeypatch.setattr(model_inspector, '_HAS_NUMPY', use_numpy)
+
+        objects = _sections(model_inspector._BLOOM_MIN_OBJECTS + 20)
+        catalog = FakeCatalog(objects)
+
+        for term in ('road7', 'ROAD3-1', 'd1-', 'missing'):
+            result = inspector.search_objects(catalog, term, object_type='GKSection')
+            expected = [obj.getId() for obj in objects if term.lower() in obj.getName().lower()]
+            assert [match['id'] for match in result.data['matches']] == expected
+
+        assert catalog.calls == 1
+
+    def test_exact_match_uses_index(self, inspector):
+        """Test that exact search matches whole names case-insensitively"""
+        catalog = FakeCatalog(_sections(30) + [GKSection(100, 'road1-1')])
+
+        result = inspector.search_objects(catalog, 'ROAD1-1', object_type='GKSection',
+                                          exact_match=True)
+        multi_field = inspector.search_objects(catalog, 'ROAD1-1', object_type='GKSection',
+                                               search_fields=['name', 'type'], exact_match=True)
+
+        assert [match['id'] for match in result.data['matches']] == [1, 100]
+        assert multi_field.data['matches'] == result.data['matches']
+
+    def test_search_structures_stay_private(self, inspector):
+        """Test that name search structures never reach query responses"""
+        catalog = FakeCatalog(_sections(model_inspector._BLOOM_MIN_OBJECTS))
+
+        inspector.search_objects(catalog, 'road', object_type='GKSection')
+        inspector.search_objects(catalog, 'road1-1', object_type='GKSection', exact_match=True)
+        result = inspector.query_catalog(catalog, 'GKSection')
+
+        assert not [key for key in result.data if key.startswith('_')]
+        assert inspector._name_search
+
+
+# ========== Filter and Listing Tests ==========
+
+class TestFiltersAndListing:
+    """Test object_type filters and list_objects"""
+
+    def test_aimsun_object_type_filter(self, inspector):
+        """Test that only objects of the requested type are returned"""
+        catalog = FakeCatalog(_sections(3) + [GKNode(10, 'Junction')])
+
+        sections = inspector.query_catalog(catalog, 'GKSection')
+        nodes = inspector.query_catalog(catalog, 'GKNode')
+
+        assert sections.data['object_count'] == 3
+        assert nodes.data['objects'] == [{'id': 10, 'name': 'Junction', 'type': 'GKNode'}]
+
+    def test_qgis_object_type_filter(self):
+        """Test that QGIS layers are filtered by class name"""
+        inspector = ModelInspector(platform='qgis', tracing=False)
+        project = FakeProject({
+            'roads': QgsVectorLayer('Roads'),
+            'dem': QgsRasterLayer('DEM'),
+        })
+
+        vectors = inspector.query_catalog(project, 'QgsVectorLayer')
+        everything = inspector.query_catalog(project)
+
+        assert vectors.data['objects'] == [{'id': 'roads', 'name': 'Roads', 'type': 'QgsVectorLayer'}]
+        assert everything.data['object_count'] == 2
+
+    def test_filter_criteria(self, inspector):
+        """Test that filter criteria are applied and cached separately"""
+        catalog = FakeCatalog(_sections(12))
+
+        filtered = inspector.query_catalog(catalog, 'GKSection', {'name': 'Road1-11'})
+        unfiltered = inspector.query_catalog(catalog, 'GKSection')
+
+        assert [obj['id'] for obj in filtered.data['objects']] == [11]
+        assert unfiltered.data['object_count'] == 12
+
+    def test_partial_results_kept_on_error(self, inspector):
+        """Test that objects extracted before a failure are kept"""
+        class Broken(GKSection):
+            def getName(self):
+                raise RuntimeError('deleted object')
+
+        catalog = FakeCatalog([GKSection(1, 'A'), Broken(2, 'B')])
+        catalog.getObjectsOfType = lambda object_type: catalog.objects
+
+        objects = inspector.query_catalog(catalog, 'GKSection').data['objects']
+
+        assert objects == [{'id': 1, 'name': 'A', 'type': 'GKSection'}, {'_error': 'deleted object'}]
+
+    @pytest.mark.parametrize('max_results,truncated', [(3, True), (5, False), (10, False)])
+    def test_list_objects_truncation(self, inspector, max_results, truncated):
+        """Test that listing stops at max_results and reports truncation"""
+        folder = FakeFolder(_sections(5))
+
+        result = inspector.list_objects(folder, 'GKSection', max_results=max_results)
+
+        assert result.data['truncated'] is truncated
+        assert result.data['total_found'] == min(max_results, 5)
+        assert [obj['id'] for obj in result.data['objects']] == list(range(min(max_results, 5)))
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,402 @@
+"""
+Unit Tests for Pulse Generator
+
+Tests for DependencyGraph, FunctionIndex, ScriptCardGenerator and PulseGenerator.
+"""
+
+import json
+import sys
+from collections import Counter
+
+import pytest
+
+from mcp.helpers.pulse_generator import DependencyGraph, FunctionIndex, PulseGenerator
+
+
+def _build_graph(edges):
+    """Build a dependency graph from (from_file, to_file) pairs"""
+    graph = DependencyGraph()
+    for from_file, to_file in edges:
+        graph.add_dependency(from_file, to_file)
+    return graph
+
+
+def _sample_analysis():
+    """Build a small repository analysis result"""
+    return {
+        'repository': '/repo',
+        'files': [
+            {
+                'file_rel': 'pkg/a.py',
+                'imports_local': ['pkg/b.py'],
+                'functions': [{'name': 'load', 'lineno': 3, 'args': ['path'],
+                               'reusability_score': 9, 'used_in_files': ['pkg/b.py']}],
+            },
+            {
+                'file_rel': 'pkg/b.py',
+                'imports_local': ['pkg/a.py'],
+                'functions': [{'name': 'save', 'lineno': 7, 'reusability_score': 4}],
+            },
+        ],
+    }
+
+
+# ========== DependencyGraph Tests ==========
+
+class TestDependencyGraph:
+    """Test DependencyGraph class"""
+
+    def test_no_cycles_in_dag(self):
+        """Test that an acyclic graph reports no cycles"""
+        graph = _build_graph([('a', 'b'), ('b', 'c'), ('a', 'c')])
+
+        assert graph.find_circular_dependencies() == []
+
+    def test_simple_cycle(self):
+        """Test detecting a two-file cycle"""
+        graph = _build_graph([('a', 'b'), ('b', 'a'), ('b', 'c')])
+
+        cycles = graph.find_circular_dependencies()
+
+        assert len(cycles) == 1
+        assert set(cycles[0]) == {'a', 'b'}
+        assert cycles[0][0] == cycles[0][-1]
+
+    def test_self_import_cycle(self):
+        """Test detecting a file that imports itself"""
+        graph = _build_graph([('a', 'a'), ('a', 'b')])
+
+        assert graph.find_circular_dependencies() == [['a', 'a']]
+
+    def test_separate_cycles(self):
+        """Test that disjoint cycles are reported separately"""
+        graph = _build_graph([
+            ('a', 'b'), ('b', 'c'), ('c', 'a'),
+            ('c', 'd'),
+            ('d', 'e'), ('e', 'd'),
+        ])
+
+        cycles = sorted(sorted(set(cycle)) for cycle in graph.find_circular_dependencies())
+
+        assert cycles == [['a', 'b', 'c'], ['d', 'e']]
+
+    def test_deep_chain_does_not_recurse(self):
+        """Test that long import chains do not hit the recursion limit"""
+        depth = sys.getrecursionlimit() * 2
+        edges = [(f'f{i}', f'f{i + 1}') for i in range(depth)]
+        edges.append((f'f{depth}', 'f0'))
+        graph = _build_graph(edges)
+
+        cycles = graph.find_circular_dependencies()
+
+        assert len(cycles) == 1
+        assert len(cycles[0]) == depth + 2
+
+    def test_shared_subgraphs_explored_once(self):
+        """Test that diamond-shaped imports explore each file's edges once"""
+        reads = Counter()
+
+        class CountingIndices:
+            def __init__(self, values):
+                self.values = values
+
+            def __getitem__(self, pos):
+                reads[pos] += 1
+                return self.values[pos]
+
+        # Layered diamonds: every file in a layer imports every file in the next
+        layers = [[f'l{layer}_{i}' for i in range(4)] for layer in range(6)]
+        edges = [
+            (src, dst)
+            for upper, lower in zip(layers, layers[1:])
+            for src in upper for dst in lower
+        ]
+        graph = _build_graph(edges)
+        csr = graph.finalize()
+        counting = csr._replace(indices=CountingIndices(csr.indices))
+
+        assert graph._tarjan_cyclic_components(counting) == []
+        assert sorted(reads) == list(range(len(edges)))
+        assert set(reads.values()) == {1}
+
+    def test_scipy_cycles_match_tarjan(self, monkeypatch):
+        """Test the scipy SCC path reports the same cycles as Tarjan"""
+        pytest.importorskip('scipy')
+        from mcp.helpers import pulse_generator
+
+        graph = _build_graph([
+            ('a', 'b'), ('b', 'c'), ('c', 'a'),
+            ('c', 'd'), ('d', 'd'),
+            ('d', 'e'), ('e', 'f'), ('f', 'e'), ('f', 'g'),
+        ])
+        expected = graph.find_circular_dependencies()
+
+        monkeypatch.setattr(pulse_generator, '_SCIPY_SCC_MIN_FILES', 0)
+        cycles = graph.find_circular_dependencies()
+
+        assert sorted(sorted(set(c)) for c in cycles) == sorted(sorted(set(c)) for c in expected)
+        assert all(c[0] == c[-1] for c in cycles)
+        assert ['d', 'd'] in cycles
+
+    def test_fan_metrics(self):
+        """Test fan-in, fan-out and instability per file"""
+        graph = _build_graph([('a', 'b'), ('a', 'c'), ('b', 'c')])
+
+        metrics = graph.calculate_fan_metrics()
+
+        assert metrics['a'] == {'fan_in': 0, 'fan_out': 2, 'instability': 1.0}
+        assert metrics['b'] == {'fan_in': 1, 'fan_out': 1, 'instability': 0.5}
+        assert metrics['c'] == {'fan_in': 2, 'fan_out': 0, 'instability': 0}
+
+    def test_edges_added_after_traversal(self):
+        """Test that adding edges after a traversal is reflected"""
+        graph = _build_graph([('a', 'b')])
+        assert graph.find_circular_dependencies() == []
+
+        graph.add_dependency('b', 'a')
+
+        assert len(graph.find_circular_dependencies()) == 1
+        assert graph.calculate_fan_metrics()['a']['fan_in'] == 1
+
+    def test_bulk_edges_match_single_adds(self):
+        """Test bulk edge insertion matches add_dependency, duplicates included"""
+        edges = [('a', 'b'), ('a', 'c'), ('b', 'c'), ('a', 'b'), ('c', 'a'), ('b', 'c')]
+        single = _build_graph(edges)
+        bulk = DependencyGraph()
+        bulk.add_dependencies_bulk(edges)
+
+        assert bulk.graph == single.graph
+        assert bulk.reverse_graph == single.reverse_graph
+        assert bulk.find_circular_dependencies() == single.find_circular_dependencies()
+
+
+# ========== FunctionIndex Tests ==========
+
+class TestFunctionIndex:
+    """Test FunctionIndex class"""
+
+    def test_top_functions_with_missing_scores(self):
+        """Test ranking tolerates None scores and keeps insertion order on ties"""
+        index = FunctionIndex()
+        for i in range(15):
+            index.add_function(f"m{i}.py", {"name": f"f{i}"})
+        index.functions["m3.py::f3"].reusability_score = 90
+        index.functions["m5.py::f5"].reusability_score = None
+        index.functions["m7.py::f7"].usage_count = None
+
+        top = index.get_top_reusable(3)
+        assert [f["name"] for f in top] == ["f3", "f0", "f1"]
+        assert len(index.get_most_used(10)) == 10
+        assert len(index.get_top_reusable(50)) == 15
+
+    def test_records_are_slotted_and_share_paths(self):
+        """Test function records use slots and interned file paths"""
+        index = FunctionIndex()
+        index.add_function(''.join(['pkg/', 'a.py']), {"name": "f"}, {''.join(['pkg/', 'b.py'])})
+        index.add_function(''.join(['pkg/', 'b.py']), {"name": "g"})
+
+        f, g = index.functions["pkg/a.py::f"], index.functions["pkg/b.py::g"]
+        assert not hasattr(f, '__dict__')
+        assert f.used_in[0] is g.file
+        assert index.to_dict()["functions"]["pkg/a.py::f"]["usage_count"] == 1
+
+    def test_public_getters_return_dicts(self):
+        """Test lookups return plain dicts rather than internal records"""
+        index = FunctionIndex()
+        index.add_function("pkg/a.py", {"name": "load_config", "reusability_score": 50})
+
+        assert index.get_function("pkg/a.py::load_config")["file"] == "pkg/a.py"
+        assert index.get_function("pkg/a.py::missing") is None
+        assert index.search_functions("CONFIG") == [index.get_function("pkg/a.py::load_config")]
+        assert isinstance(index.get_most_used(1)[0], dict)
+
+    def test_top_functions_cached_until_add(self):
+        """Test ranked subsets are reused until a function is added"""
+        index = FunctionIndex()
+        index.add_function("a.py", {"name": "low", "reusability_score": 10})
+        assert index.get_top_reusable(1)[0]["name"] == "low"
+        assert len(index._topk_cache) == 1
+
+        index.get_top_reusable(1).clear()
+        assert index.get_top_reusable(1)[0]["name"] == "low"
+
+        index.add_function("b.py", {"name": "high", "reusability_score": 80})
+        assert index.get_top_reusable(1)[0]["name"] == "high"
+
+
+# ========== PulseGenerator Tests ==========
+
+class TestPulseGenerator:
+    """Test PulseGenerator class"""
+
+    def test_generate_all_outputs(self, tmp_path):
+        """Test generating the graph, index and cards"""
+        results = PulseGenerator.generate_all(_sample_analysis(), tmp_path)
+
+        assert results['imports_graph'] is True
+        assert results['functions_index'] is True
+        assert results['cards_generated'] == 2
+
+        graph_data = json.loads((tmp_path / 'imports_graph.json').read_text(encoding='utf-8'))
+        assert graph_data['dependencies']['pkg/a.py'] == ['pkg/b.py']
+        assert len(graph_data['circular_dependencies']) == 1
+
+        index_data = json.loads((tmp_path / 'functions_index.json').read_text(encoding='utf-8'))
+        assert index_data['total_functions'] == 2
+        assert index_data['top_reusable'][0]['name'] == 'load'
+
+        card = (tmp_path / 'cards' / 'pkg' / 'a.md').read_text(encoding='utf-8')
+        assert card.startswith('# a.py')
+        assert '- `pkg/b.py`' in card
+
+    def test_windows_paths_share_vertices(self, tmp_path):
+        """Test that backslash and slash spellings of a path are one file"""
+        analysis = {
+            'repository': '/repo',
+            'files': [
+                {'file_rel': 'pkg\\a.py', 'imports_local': ['pkg/b.py']},
+                {'file_rel': 'pkg/b.py', 'imports_local': ['pkg\\a.py']},
+            ],
+        }
+
+        dep_graph, _ = PulseGenerator._build_structures(analysis['files'])
+        PulseGenerator.generate_script_cards(analysis, tmp_path, dep_graph=dep_graph)
+
+        assert set(dep_graph.graph) == {'pkg/a.py', 'pkg/b.py'}
+        assert len(dep_graph.find_circular_dependencies()) == 1
+        assert '- `pkg/b.py`' in (tmp_path / 'pkg' / 'a.md').read_text(encoding='utf-8')
+
+    def test_generate_all_builds_structures_once(self, tmp_path, monkeypatch):
+        """Test that all outputs share one graph and index build"""
+        calls = []
+        original = PulseGenerator._build_structures
+
+        def counting_build(files):
+            calls.append(len(files))
+            return original(files)
+
+        monkeypatch.setattr(PulseGenerator, '_build_structures', staticmethod(counting_build))
+
+        PulseGenerator.generate_all(_sample_analysis(), tmp_path)
+
+        assert calls == [2]
+
+    def test_generate_all_malformed_data(self, tmp_path, capsys):
+        """Test that malformed analysis data is reported, not raised"""
+        analysis = {'repository': '/repo', 'files': [{'file_rel': 'a.py', 'functions': [None]}]}
+
+        results = PulseGenerator.generate_all(analysis, tmp_path)
+
+        assert results['imports_graph'] is False
+        assert results['functions_index'] is False
+        assert results['cards_generated'] == 0
+        assert '[pulse_generator] Error' in capsys.readouterr().out
+        assert not (tmp_path / 'imports_graph.json').exists()
+
+    def test_generate_script_cards_large_batch(self, tmp_path):
+        """Test that batches rendered in worker processes write every card"""
+        analysis = {
+            'repository': '/repo',
+            'files': [
+                {'file_rel': f'pkg/mod{i}.py', 'imports_local': [f'pkg/mod{(i + 1) % 40}.py']}
+                for i in range(40)
+            ],
+        }
+
+        count = PulseGenerator.generate_script_cards(analysis, tmp_path)
+
+        assert count == 40
+        card = (tmp_path / 'pkg' / 'mod0.md').read_text(encoding='utf-8')
+        assert '- `pkg/mod1.py`' in card
+        assert '**Imported by** (1 files)' in card
+
+    def test_generate_script_cards_incremental(self, tmp_path):
+        """Test that unchanged cards are skipped on regeneration"""
+        analysis = _sample_analysis()
+        PulseGenerator.generate_script_cards(analysis, tmp_path)
+        card_b = tmp_path / 'pkg' / 'b.md'
+        card_b.write_text('stale', encoding='utf-8')
+
+        analysis['files'][0]['lines'] = 999
+        stats = {}
+        count = PulseGenerator.generate_script_cards(analysis, tmp_path, stats=stats)
+
+        assert count == 2
+        assert stats == {'written': 1, 'skipped': 1}
+        assert card_b.read_text(encoding='utf-8') == 'stale'
+
+        stats = {}
+        card_b.unlink()
+        PulseGenerator.generate_script_cards(analysis, tmp_path, stats=stats)
+        assert stats == {'written': 1, 'skipped': 1}
+        assert card_b.read_text(encoding='utf-8').startswith('# b.py')
+
+        stats = {}
+        PulseGenerator.generate_script_cards(analysis, tmp_path, incremental=False, stats=stats)
+        assert stats == {'written': 2, 'skipped': 0}
+
+    def test_card_hashes_ignore_import_order(self, tmp_path):
+        """Test that reordered set-derived import lists do not rewrite cards"""
+        analysis = _sample_analysis()
+        analysis['files'][0]['imports_third'] = ['json', 'requests', 'yaml']
+        analysis['files'][0]['functions'][0]['used_in_files'] = ['pkg/b.py', 'pkg/c.py']
+        PulseGenerator.generate_script_cards(analysis, tmp_path)
+
+        analysis['files'][0]['imports_third'].reverse()
+        analysis['files'][0]['functions'][0]['used_in_files'].reverse()
+        stats = {}
+        PulseGenerator.generate_script_cards(analysis, tmp_path, stats=stats)
+
+        assert stats == {'written': 0, 'skipped': 2}
+
+    def test_card_hashes_stable_across_hash_seeds(self, tmp_path):
+        """Test that a run under another hash seed skips every card"""
+        import os
+        import subprocess
+        repo = tmp_path / 'repo'
+        (repo / 'pkg').mkdir(parents=True)
+        for i in range(4):
+            (repo / 'pkg' / f'mod{i}.py').write_text(
+                ''.join(f'import {name}\n' for name in ('yaml', 'requests', 'click', 'attr', 'toml', 'six'))
+                + f'from pkg import mod{(i + 1) % 4}\n',
+                encoding='utf-8'
+            )
+        script = (
+            'import json, sys\n'
+            'from pathlib import Path\n'
+            'from mcp.helpers.repository_analyzer import RepositoryAnalyzer\n'
+            'from mcp.helpers.pulse_generator import PulseGenerator\n'
+            'analysis = RepositoryAnalyzer(use_cache=False).analyze_repository(sys.argv[1])\n'
+            'stats = {}\n'
+            'PulseGenerator.generate_script_cards(analysis, Path(sys.argv[2]), stats=stats)\n'
+            'print(json.dumps(stats))\n'
+        )
+        runs = []
+        for seed in ('1', '2', '3'):
+            env = dict(os.environ, PYTHONHASHSEED=seed,
+                       PYTHONPATH=os.pathsep.join(filter(None, sys.path)))
+            output = subprocess.run(
+                [sys.executable, '-c', script, str(repo), str(tmp_path / 'cards')],
+                env=env, capture_output=True, text=True, check=True
+            ).stdout
+            runs.append(json.loads(output.strip().splitlines()[-1]))
+
+        assert runs[0] == {'written': 4, 'skipped': 0}
+        assert runs[1:] == [{'written': 0, 'skipped': 4}] * 2
+
+    def test_generate_script_cards_thread_fallback(self, tmp_path, monkeypatch):
+        """Test that large batches are written from threads without a process pool"""
+        from mcp.helpers import pulse_generator
+
+        def no_pool(*args, **kwargs):
+            raise OSError("no process pool")
+
+        monkeypatch.setattr(pulse_generator, 'ProcessPoolExecutor', no_pool)
+        monkeypatch.setattr(pulse_generator, '_CARD_WRITE_BATCH', 7)
+        analysis = {
+            'repository': '/repo',
+            'files': [{'file_rel': f'pkg/mod{i}.py'} for i in range(40)],
+        }
+
+        assert PulseGenerator.generate_script_cards(analysis, tmp_path) == 40
+        assert len(list((tmp_path / 'pkg').glob('*.md'))) == 40
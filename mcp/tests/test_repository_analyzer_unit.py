@@ -0,0 +1,530 @@
+"""
+Unit Tests for Repository Analyzer
+
+Tests for RepositoryAnalyzer file scanning and the parse cache.
+"""
+
+import pytest
+from pathlib import Path
+
+from mcp.helpers import repository_analyzer
+from mcp.helpers.repository_analyzer import AstCache, RepositoryAnalyzer
+
+
+# ========== RepositoryAnalyzer Tests ==========
+
+class TestRepositoryAnalyzer:
+    """Test RepositoryAnalyzer class"""
+
+    def test_analyze_repository(self, tmp_path, repo):
+        """Test analyzing a small repository"""
+        analyzer = RepositoryAnalyzer(cache_dir=str(tmp_path / 'cache'))
+
+        result = analyzer.analyze_repository(str(repo))
+
+        assert result['success'] is True
+        assert result['files_analyzed'] == 4
+        files = {f['file_rel'].replace('\\', '/'): f for f in result['files']}
+        assert files['pkg/io_utils.py']['imports_third'] == ['requests']
+        assert files['pkg/runner.py']['imports_local'] == ['pkg']
+        assert result['statistics']['total_functions'] == 2
+
+    def test_analyze_repository_streams_json(self, tmp_path, repo):
+        """Test that the streamed JSON matches the in-memory result"""
+        import json
+        analyzer = RepositoryAnalyzer(use_cache=False)
+        output = tmp_path / 'out' / 'analysis.json'
+
+        in_memory = analyzer.analyze_repository(str(repo))
+        streamed = analyzer.analyze_repository(str(repo), output_json_path=str(output))
+
+        assert json.loads(output.read_text(encoding='utf-8')) == in_memory
+        assert 'files' not in streamed
+        assert streamed['output_json_path'] == str(output)
+        assert streamed['statistics'] == in_memory['statistics']
+
+    def test_excel_report(self, tmp_path, repo):
+        """Test the streamed Excel report from an analysis result"""
+        openpyxl = pytest.importorskip('openpyxl')
+        analyzer = RepositoryAnalyzer(use_cache=False)
+        output = tmp_path / 'out' / 'report.xlsx'
+
+        result = analyzer.generate_excel_report(analyzer.analyze_repository(str(repo)), str(output))
+
+        assert result['success'] is True
+        wb = openpyxl.load_workbook(output)
+        assert wb.sheetnames == ['Summary', 'Files']
+        assert [c.value for c in wb['Summary']['A4':'B4'][0]] == ['Total Functions', 2]
+        rows = list(wb['Files'].iter_rows(min_row=2, values_only=True))
+        assert [r[0] for r in rows] == sorted(r[0] for r in rows)
+        assert dict((r[0].replace('\\', '/'), r[2]) for r in rows)['pkg/io_utils.py'] == 1
+
+    def test_walk_prunes_ignored_directories(self, tmp_path, write_repo):
+        """Test that ignored names are skipped relative to the repository root"""
+        repo = write_repo(tmp_path / 'repo', {
+            'app.py': '',
+            'pkg/core.py': '',
+            'pkg/test_core.py': '',
+            'pkg/vendor/lib.py': '',
+            'node_modules/x/y.py': '',
+            '.venv/lib/site.py': '',
+            'notes.txt': '',
+        })
+
+        paths = RepositoryAnalyzer._walk_python_files(
+            repo, ['node_modules', '.venv', 'test', 'pkg/vendor']
+        )
+
+        assert sorted(Path(p).relative_to(repo).as_posix() for p in paths) == [
+            'app.py', 'pkg/core.py'
+        ]
+
+    def test_discover_local_roots(self, tmp_path, write_repo):
+        """Test that top-level modules and directories holding Python files are local"""
+        repo = write_repo(tmp_path / 'repo', {
+            'app.py': '',
+            'pkg/__init__.py': '',
+            'scripts/tools/deep/run.py': '',
+            'data/notes.txt': '',
+        })
+
+        local = RepositoryAnalyzer()._discover_local_roots(repo)
+
+        assert local == {'app', 'pkg', 'scripts'}
+
+    def test_ignore_patterns_are_literal_substrings(self, tmp_path, write_repo):
+        """Test that regex characters in patterns are matched literally"""
+        repo = write_repo(tmp_path / 'repo', {
+            'a.b/x.py': '',
+            'axb/y.py': '',
+            'Build/z.py': '',
+        })
+
+        paths = RepositoryAnalyzer._walk_python_files(repo, ['a.b', 'build'])
+
+        assert [Path(p).relative_to(repo).as_posix() for p in paths] == ['axb/y.py']
+        assert repository_analyzer._substring_matcher([]) is None
+
+    def test_hardcoded_paths_detected_while_analyzing(self, tmp_path, repo):
+        """Test that hardcoded paths are flagged per function without a re-read"""
+
+        runner = RepositoryAnalyzer._analyze_file(repo / 'pkg' / 'runner.py', repo)
+        io_utils = RepositoryAnalyzer._analyze_file(repo / 'pkg' / 'io_utils.py', repo)
+
+        assert runner.functions[0].has_hardcoded_paths is True
+        assert io_utils.functions[0].has_hardcoded_paths is False
+
+    def test_parallel_scan_matches_sequential(self, tmp_path, monkeypatch, write_repo):
+        """Test that the process pool scan returns the same files in order"""
+        files = {f'mod{i}.py': f'def f{i}():\n    return {i}\n' for i in range(12)}
+        repo = write_repo(tmp_path / 'repo', files)
+        analyzer = RepositoryAnalyzer(use_cache=False)
+
+        sequential = analyzer._scan_files(repo, [])
+        monkeypatch.setattr(repository_analyzer, '_PARALLEL_SCAN_MIN_FILES', 1)
+        parallel = analyzer._scan_files(repo, [])
+
+        assert [f.file_rel for f in parallel] == [f.file_rel for f in sequential]
+        assert [f.functions[0].name for f in parallel] == [f.functions[0].name for f in sequential]
+
+    def test_records_are_slotted_and_picklable(self, tmp_path, repo):
+        """Test that analysis records have no __dict__ and survive pickling"""
+        import pickle
+
+        info = RepositoryAnalyzer._analyze_file(repo / 'pkg' / 'runner.py', repo)
+
+        assert not hasattr(info, '__dict__')
+        assert not hasattr(info.classes[0], '__dict__')
+        assert not hasattr(info.functions[0], '__dict__')
+        assert pickle.loads(pickle.dumps(info)) == info
+
+    def test_skip_bodies_records_signatures_only(self, tmp_path, write_repo):
+        """Test the structural pass that does not walk function bodies"""
+        repo = write_repo(tmp_path / 'repo', {
+            'mod.py': (
+                'import os\n'
+                'def outer(x):\n'
+                '    """Outer doc."""\n'
+                '    import json\n'
+                '    def inner():\n'
+                '        return helper()\n'
+                '    return inner() if x else None\n'
+                'class C:\n'
+                '    def m(self):\n'
+                '        return outer(1)\n'
+            ),
+        })
+        cache = AstCache(tmp_path / 'cache')
+
+        full = RepositoryAnalyzer._analyze_file(repo / 'mod.py', repo, cache)
+        shallow = RepositoryAnalyzer._analyze_file(repo / 'mod.py', repo, cache, skip_bodies=True)
+
+        assert [f.qualname for f in full.functions] == ['outer', 'inner', 'C.m']
+        assert [f.qualname for f in shallow.functions] == ['outer', 'C.m']
+        assert shallow.functions[0].docstring == 'Outer doc.'
+        assert all(f.complexity is None for f in shallow.functions)
+        assert shallow.calls == []
+        assert shallow.imports_all == {'os'}
+        assert full.imports_all == {'os', 'json'}
+
+    def test_line_endings_and_encodings(self, tmp_path):
+        """Test that lines and text match universal-newline reading"""
+        repo = tmp_path / 'repo'
+        repo.mkdir()
+        (repo / 'crlf.py').write_bytes(b'#owner=ana\r\ndef f():\r\n    """Doc."""\r\n')
+        (repo / 'cr.py').write_bytes(b'x = 1\ry = 2\r')
+        (repo / 'latin.py').write_bytes(b'#owner=jos\xe9\ndef g():\n    pass\n')
+
+        crlf = RepositoryAnalyzer._analyze_file(repo / 'crlf.py', repo)
+        cr = RepositoryAnalyzer._analyze_file(repo / 'cr.py', repo)
+        latin = RepositoryAnalyzer._analyze_file(repo / 'latin.py', repo)
+
+        assert (crlf.lines, crlf.owner, crlf.functions[0].docstring) == (4, 'ana', 'Doc.')
+        assert cr.lines == 3
+        assert (latin.lines, latin.owner, latin.functions[0].name) == (4, 'jos\xe9', 'g')
+
+    def test_fast_import_scan_reads_header_only(self, tmp_path):
+        """Test that imports are collected up to the first definition"""
+        path = tmp_path / 'mod.py'
+        path.write_text(
+            '"""Doc."""\n'
+            'from __future__ import annotations\n'
+            'import os.path, json as j\n'
+            'from . import sibling\n'
+            'from .pkg.sub import x\n'
+            'try:\n'
+            '    from lxml import (etree,\n'
+            '                      html)\n'
+            'except ImportError:\n'
+            '    pass\n'
+            'LIMIT = 3\n'
+            'def f():\n'
+            '    import late\n'
+            'import after_def\n',
+            encoding='utf-8'
+        )
+        broken = tmp_path / 'broken.py'
+        broken.write_text('import os\nclass C:\n    """unterminated\n', encoding='utf-8')
+
+        assert RepositoryAnalyzer._fast_import_scan(path) == {
+            '__future__', 'os', 'json', 'pkg', 'lxml'
+        }
+        assert RepositoryAnalyzer._fast_import_scan(broken) == {'os'}
+
+    def test_fast_import_scan_latin1(self, tmp_path):
+        """Test that a non-UTF-8 file falls back to the decoded full parse"""
+        path = tmp_path / 'latin.py'
+        path.write_bytes('import os\nimport json\n# caf\xe9\nimport re\ndef f():\n    import late\n'.encode('latin-1'))
+
+        assert RepositoryAnalyzer._fast_import_scan(path) == {'os', 'json', 're', 'late'}
+
+    def test_imports_only_analysis_with_latin1_file(self, tmp_path, write_repo):
+        """Test that analyze_imports does not fail on a latin-1 file"""
+        repo = write_repo(tmp_path / 'repo', {'main.py': 'import requests\n'})
+        (repo / 'latin.py').write_bytes('import os\n\n# \xe9\nimport yaml\n'.encode('latin-1'))
+        analyzer = RepositoryAnalyzer(use_cache=False)
+
+        result = analyzer.analyze_imports(str(repo))
+
+        imports = {f['file_rel']: f['imports_third'] for f in result['files']}
+        assert imports == {'main.py': ['requests'], 'latin.py': ['yaml']}
+
+    def test_structured_docstring_from_module_docstring(self):
+        """Test that sections come from the module docstring only"""
+        parse = RepositoryAnalyzer._parse_structured_docstring
+        tree = repository_analyzer.ast.parse(
+            "r'''\n## Description\nLoads data\n  from disk.\n## Owner\nteam\n'''\n"
+        )
+        no_module_doc = repository_analyzer.ast.parse('def f():\n    """Function doc."""\n')
+
+        assert parse(tree) == {'DESCRIPTION': 'Loads data from disk.', 'OWNER': 'team'}
+        assert parse(no_module_doc) == {}
+        assert parse(None) == {}
+
+
+# ========== Complexity Tests ==========
+
+class TestComplexity:
+    """Test cyclomatic complexity computed by the AST visitor"""
+
+    def _complexities(self, source):
+        visitor = repository_analyzer._ASTVisitor('x.py')
+        visitor.visit(repository_analyzer.ast.parse(source))
+        return {f.qualname: f.complexity for f in visitor.functions}
+
+    def test_decision_points(self):
+        """Test counting branches, loops, handlers and boolean operands"""
+        source = (
+            'def f(items):\n'
+            '    assert items and len(items) > 1\n'
+            '    for x in items:\n'
+            '        if x > 1 and x < 5 or x == 9:\n'
+            '            continue\n'
+            '        elif x:\n'
+            '            pass\n'
+            '    else:\n'
+            '        pass\n'
+            '    try:\n'
+            '        return [y for y in items if y]\n'
+            '    except ValueError:\n'
+            '        return None\n'
+            '    except KeyError:\n'
+            '        return 1 if items else 2\n'
+        )
+
+        # 1 + assert 1 + for 2 + if 1 + boolops 2 + elif 1 + comprehension 2
+        # + handlers 2 + conditional expression 1
+        assert self._complexities(source) == {'f': 13}
+
+    def test_nested_functions_scored_separately(self):
+        """Test that closures and methods get their own scores"""
+        source = (
+            'class A:\n'
+            '    def m(self, x):\n'
+            '        def inner():\n'
+            '            while x:\n'
+            '                pass\n'
+            '        return inner if x else None\n'
+        )
+
+        assert self._complexities(source) == {'A.m': 2, 'A.inner': 2}
+
+    def test_dispatch_table_covers_handlers(self):
+        """Test that every visit_* handler is reachable through the type dispatch"""
+        dispatch = repository_analyzer._VISIT_DISPATCH
+        ast = repository_analyzer.ast
+
+        assert dispatch[ast.FunctionDef] is repository_analyzer._ASTVisitor.visit_FunctionDef
+        assert dispatch[ast.comprehension] is repository_analyzer._ASTVisitor.visit_comprehension
+        assert ast.Constant not in dispatch
+
+    def test_match_default_case(self):
+        """Test that a wildcard case is not counted"""
+        source = (
+            'def f(v):\n'
+            '    match v:\n'
+            '        case 1:\n'
+            '            return 1\n'
+            '        case 2:\n'
+            '            return 2\n'
+            '        case _:\n'
+            '            return 0\n'
+        )
+
+        assert self._complexities(source) == {'f': 3}
+
+
+# ========== AstCache Tests ==========
+
+class TestAstCache:
+    """Test the on-disk parse cache"""
+
+    def test_second_run_skips_parsing(self, tmp_path, monkeypatch, repo):
+        """Test that unchanged files are served from the cache"""
+        analyzer = RepositoryAnalyzer(cache_dir=str(tmp_path / 'cache'))
+        first = analyzer.analyze_repository(str(repo))
+
+        def fail_parse(*args, **kwargs):
+            raise AssertionError('file was parsed again')
+
+        monkeypatch.setattr(repository_analyzer.ast, 'parse', fail_parse)
+        second = analyzer.analyze_repository(str(repo))
+
+        assert first['success'] is True
+        assert second == first
+
+    def test_cache_is_opt_in(self, tmp_path, monkeypatch, repo):
+        """Test that nothing is cached unless a cache directory is configured"""
+        monkeypatch.delenv(repository_analyzer.AST_CACHE_DIR_ENV, raising=False)
+        monkeypatch.setenv('HOME', str(tmp_path / 'home'))
+
+        result = RepositoryAnalyzer().analyze_repository(str(repo))
+
+        assert result['success'] is True
+        assert RepositoryAnalyzer().cache_dir is None
+        assert not (tmp_path / 'home').exists()
+        assert not any(p.name == '.pulsus_cache' for p in repo.rglob('*'))
+
+        monkeypatch.setenv(repository_analyzer.AST_CACHE_DIR_ENV, str(tmp_path / 'env-cache'))
+        assert RepositoryAnalyzer().cache_dir == tmp_path / 'env-cache'
+        assert RepositoryAnalyzer(use_cache=False).cache_dir is None
+
+    def test_validate_file_uses_cache(self, tmp_path, monkeypatch, repo):
+        """Test that validating an unchanged file does not parse it again"""
+        analyzer = RepositoryAnalyzer(cache_dir=str(tmp_path / 'cache'))
+        first = analyzer.validate_file(str(repo / 'pkg' / 'io_utils.py'))
+
+        def fail_parse(*args, **kwargs):
+            raise AssertionError('file was parsed again')
+
+        monkeypatch.setattr(repository_analyzer.ast, 'parse', fail_parse)
+        second = analyzer.validate_file(str(repo / 'pkg' / 'io_utils.py'))
+
+        assert first['success'] is True
+        assert second == first
+
+    def test_identical_content_keeps_own_path(self, tmp_path, write_repo):
+        """Test that files sharing a cache entry report their own paths"""
+        content = 'def helper():\n    return 1\n'
+        repo = write_repo(tmp_path / 'repo', {'a.py': content, 'b.py': content})
+        cache = AstCache(tmp_path / 'cache')
+
+        first = RepositoryAnalyzer._analyze_file(repo / 'a.py', repo, cache)
+        second = RepositoryAnalyzer._analyze_file(repo / 'b.py', repo, cache)
+
+        assert first.functions[0].file_rel == 'a.py'
+        assert second.functions[0].file_rel == 'b.py'
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path):
+        """Test that unreadable entries are ignored and rewritten"""
+        cache = AstCache(tmp_path / 'cache')
+        key = AstCache.key_for(AstCache.digest(b'x = 1\n'))
+        entry = tmp_path / 'cache' / key[:2] / f'{key}.pkl'
+        entry.parent.mkdir(parents=True)
+        entry.write_bytes(b'not a pickle')
+
+        assert cache.get(key) is None
+        cache.put(key, ('ok',))
+        assert cache.get(key) == ('ok',)
+
+
+# ========== ScanManifest Tests ==========
+
+class TestScanManifest:
+    """Test the per-repository scan manifest"""
+
+    def test_unchanged_files_are_not_read(self, tmp_path, monkeypatch, repo):
+        """Test that a rescan only reads files whose stats changed"""
+        analyzer = RepositoryAnalyzer(cache_dir=str(tmp_path / 'cache'))
+        first = analyzer.analyze_repository(str(repo))
+
+        (repo / 'main.py').write_text('import os\n', encoding='utf-8')
+        read = []
+        original_read_bytes = Path.read_bytes
+
+        def tracking_read_bytes(self):
+            read.append(self.name)
+            return original_read_bytes(self)
+
+        monkeypatch.setattr(Path, 'read_bytes', tracking_read_bytes)
+        second = analyzer.analyze_repository(str(repo))
+
+        assert read == ['main.py']
+        assert second['statistics']['total_functions'] == first['statistics']['total_functions']
+        main = next(f for f in second['files'] if f['file_rel'] == 'main.py')
+        assert main['lines'] == 2
+
+    def test_unchanged_file_scores_follow_new_callers(self, tmp_path, repo):
+        """Test that cached base scores still get points for use across files"""
+        analyzer = RepositoryAnalyzer(cache_dir=str(tmp_path / 'cache'))
+
+        def load_config_score():
+            analyzer.analyze_repository(str(repo))
+            files = analyzer._scan_files(repo, [])
+            analyzer._detect_unused_functions(files)
+            analyzer._calculate_reusability_scores(files)
+            io_utils = next(f for f in files if f.file_rel.endswith('io_utils.py'))
+            return io_utils.functions[0].reusability_score
+
+        before = load_config_score()
+        for name in ('main.py', 'cli.py'):
+            (repo / name).write_text(
+                'from pkg.io_utils import load_config\ndef main():\n    load_config("x")\n',
+                encoding='utf-8'
+            )
+        after = load_config_score()
+
+        # Called from runner.py only, then also from main.py and cli.py
+        assert after == before + 6
+
+    def test_validate_after_scan_does_not_read(self, tmp_path, monkeypatch, repo):
+        """Test that files unchanged since the last scan are validated unread"""
+        analyzer = RepositoryAnalyzer(cache_dir=str(tmp_path / 'cache'))
+        analyzer.analyze_repository(str(repo))
+
+        (repo / 'main.py').write_text('import os\n', encoding='utf-8')
+        read = []
+        original_read_bytes = Path.read_bytes
+
+        def tracking_read_bytes(self):
+            read.append(self.name)
+            return original_read_bytes(self)
+
+        monkeypatch.setattr(Path, 'read_bytes', tracking_read_bytes)
+        unchanged = analyzer.validate_file(str(repo / 'pkg' / 'io_utils.py'))
+        changed = analyzer.validate_file(str(repo / 'main.py'))
+
+        assert read == ['main.py']
+        assert unchanged['success'] is True and changed['success'] is True
+        assert unchanged['statistics']['functions'] == 1
+
+    def test_manifest_is_per_root_and_versioned(self, tmp_path):
+        """Test that manifests of other roots or versions are ignored"""
+        import json
+        manifest = repository_analyzer.ScanManifest(tmp_path / 'cache', tmp_path / 'a')
+        manifest.save({'x.py': [1, 2, 'digest', 3]})
+        assert manifest.load() == {'x.py': [1, 2, 'digest', 3]}
+
+        other = repository_analyzer.ScanManifest(tmp_path / 'cache', tmp_path / 'b')
+        data = json.loads(manifest.path.read_text(encoding='utf-8'))
+        manifest.path.write_text(json.dumps({**data, 'version': 0}), encoding='utf-8')
+
+        assert other.load() == {}
+        assert manifest.load() == {}
+
+    def test_manifest_save_is_synced_before_rename(self, tmp_path, monkeypatch):
+        """Test that the manifest is replaced only once its content is on disk"""
+        manifest = repository_analyzer.ScanManifest(tmp_path / 'cache', tmp_path / 'a')
+        manifest.save({'x.py': [1, 2, 'digest', 3]})
+        events = []
+        original_replace = repository_analyzer.os.replace
+
+        def failing_fsync(fd):
+            events.append('fsync')
+            raise OSError('disk full')
+
+        monkeypatch.setattr(repository_analyzer.os, 'fsync', failing_fsync)
+        monkeypatch.setattr(repository_analyzer.os, 'replace',
+                            lambda *args: events.append('replace') or original_replace(*args))
+        manifest.save({'y.py': [1, 2, 'digest', 3]})
+
+        assert events == ['fsync']
+        assert manifest.load() == {'x.py': [1, 2, 'digest', 3]}
+        assert list(manifest.path.parent.iterdir()) == [manifest.path]
+
+    def test_manifest_of_other_hash_algo_is_ignored(self, tmp_path, monkeypatch):
+        """Test that digests of another algorithm are not trusted"""
+        manifest = repository_analyzer.ScanManifest(tmp_path / 'cache', tmp_path / 'a')
+        manifest.save({'x.py': [1, 2, 'digest', 3]})
+
+        other_algo = 'sha256' if repository_analyzer._HASH_ALGO != 'sha256' else 'blake3'
+        monkeypatch.setattr(repository_analyzer, '_HASH_ALGO', other_algo)
+
+        assert manifest.load() == {}
+
+    def test_only_changed_files_go_to_the_pool(self, tmp_path, monkeypatch, write_repo):
+        """Test that unchanged files are restored in-process before pooling"""
+        files = {f'mod{i}.py': f'def f{i}():\n    return {i}\n' for i in range(6)}
+        repo = write_repo(tmp_path / 'repo', files)
+        analyzer = RepositoryAnalyzer(cache_dir=str(tmp_path / 'cache'))
+        first = analyzer.analyze_repository(str(repo))
+
+        pooled = []
+
+        def fake_pool(*args, **kwargs):
+            raise OSError('no pool')
+
+        original_worker = repository_analyzer._analyze_file_worker
+
+        def tracking_worker(path_str, *args):
+            pooled.append(Path(path_str).name)
+            return original_worker(path_str, *args)
+
+        monkeypatch.setattr(repository_analyzer, '_PARALLEL_SCAN_MIN_FILES', 1)
+        monkeypatch.setattr(repository_analyzer, 'ProcessPoolExecutor', fake_pool)
+        monkeypatch.setattr(repository_analyzer, '_analyze_file_worker', tracking_worker)
+        (repo / 'mod3.py').write_text('def g():\n    return 33\n', encoding='utf-8')
+        second = analyzer.analyze_repository(str(repo))
+
+        assert pooled == ['mod3.py']
+        assert [f['file_rel'] for f in second['files']] == [f['file_rel'] for f in first['files']]
@@ -0,0 +1,211 @@
+"""
+Unit Tests for Repository Manager
+
+Tests for RepositoryManager and the analysis shared by its summary methods.
+"""
+
+import pytest
+import sys
+
+from mcp.helpers.repository_manager import RepositoryManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Create a RepositoryManager with an isolated parse cache"""
+    manager = RepositoryManager()
+    manager.analyzer.cache_dir = tmp_path / 'cache'
+    return manager
+
+
+# ========== Shared Analysis Tests ==========
+
+class TestAnalysisBundle:
+    """Test the analysis shared by the summary methods"""
+
+    def test_summary_methods_share_one_analysis(self, manager, repo, monkeypatch):
+        """Test that the repository is analyzed once for all summaries"""
+        calls = []
+        analyze = manager.analyzer.analyze_repository
+
+        def counting_analyze(*args, **kwargs):
+            calls.append(args[0])
+            return analyze(*args, **kwargs)
+
+        monkeypatch.setattr(manager.analyzer, 'analyze_repository', counting_analyze)
+        patterns = ['__pycache__', 'unused-pattern']
+
+        dependencies = manager.analyze_dependencies(str(repo), patterns)
+        reusability = manager.analyze_reusability(str(repo), list(reversed(patterns)))
+        issues = manager.get_issues_summary(str(repo), patterns)
+        statistics = manager.get_statistics(str(repo), patterns)
+
+        assert calls == [str(repo.resolve())]
+        assert dependencies.success and reusability.success
+        assert issues.success and statistics.success
+        assert statistics.data['total_files'] == 4
+        assert {'module': 'requests', 'count': 2} in dependencies.data['top_imported']
+
+    def test_failed_analysis_is_not_shared(self, manager, tmp_path):
+        """Test that errors are reported and not reused"""
+        missing = tmp_path / 'missing'
+
+        first = manager.get_statistics(str(missing))
+        missing.mkdir()
+        (missing / 'a.py').write_text('x = 1\n', encoding='utf-8')
+        second = manager.get_issues_summary(str(missing))
+
+        assert first.success is False
+        assert 'not a directory' in first.error
+        assert second.success is True
+
+    def test_shared_analyses_are_bounded(self, manager, tmp_path, monkeypatch):
+        """Test that the least recently used analysis is evicted when full"""
+        from mcp.helpers import repository_manager
+        monkeypatch.setattr(repository_manager, '_ANALYSIS_CACHE_SIZE', 2)
+        repos = []
+        for name in ('a', 'b', 'c'):
+            root = tmp_path / name
+            root.mkdir()
+            (root / 'mod.py').write_text('x = 1\n', encoding='utf-8')
+            repos.append(str(root.resolve()))
+
+        manager.get_statistics(repos[0])
+        manager.get_statistics(repos[1])
+        manager.get_issues_summary(repos[0])
+        manager.get_statistics(repos[2])
+
+        assert [key[0] for key in manager._analysis_cache] == [repos[0], repos[2]]
+
+    def test_issues_by_priority(self, manager, repo):
+        """Test that the priority filter is case-insensitive"""
+        everything = manager.get_issues_summary(str(repo), ['__pycache__'])
+        high = manager.get_issues_summary(str(repo), ['__pycache__'], priority='high')
+        unknown = manager.get_issues_summary(str(repo), ['__pycache__'], priority='LOW')
+
+        assert high.data['issues']
+        assert high.data['issues'] == [
+            i for i in everything.data['issues'] if i['priority'] == 'HIGH'
+        ]
+        assert unknown.data['issues'] == []
+
+    def test_issues_are_copies(self, manager, repo):
+        """Test that callers cannot mutate the shared issue lists"""
+        first = manager.get_issues_summary(str(repo), ['__pycache__'], priority='HIGH')
+        first.data['issues'].clear()
+        everything = manager.get_issues_summary(str(repo), ['__pycache__'])
+        everything.data['issues'].clear()
+
+        second = manager.get_issues_summary(str(repo), ['__pycache__'], priority='HIGH')
+        assert second.data['issues']
+        assert manager.get_issues_summary(str(repo), ['__pycache__']).data['issues']
+
+    def test_imports_only_dependencies(self, manager, repo, monkeypatch):
+        """Test the header-only import scan used without a shared analysis"""
+        def fail_analyze(*args, **kwargs):
+            raise AssertionError('full analysis was run')
+
+        monkeypatch.setattr(manager.analyzer, 'analyze_repository', fail_analyze)
+        response = manager.analyze_dependencies(str(repo), ['__pycache__'], imports_only=True)
+
+        graph = response.data['dependency_graph']
+        assert response.success is True
+        assert graph['pkg/runner.py'] == {'third_party': ['requests'], 'local': ['pkg'], 'total': 2}
+        assert graph['pkg/io_utils.py']['third_party'] == ['requests']
+
+
+# ========== Circular Dependency Tests ==========
+
+class TestCircularDependencies:
+    """Test circular dependency detection"""
+
+    def test_find_cycles(self):
+        """Test that components and self-loops are cycles, largest first"""
+        graph = {
+            'a.py': ['b.py'],
+            'b.py': ['c.py'],
+            'c.py': ['a.py', 'd.py'],
+            'd.py': [],
+            'e.py': ['f.py'],
+            'f.py': ['e.py'],
+            'g.py': ['g.py'],
+        }
+
+        cycles = RepositoryManager._find_cycles(graph)
+
+        assert cycles == [['a.py', 'b.py', 'c.py'], ['e.py', 'f.py'], ['g.py']]
+
+    def test_find_cycles_deep_chain(self):
+        """Test that long import chains do not hit the recursion limit"""
+        depth = sys.getrecursionlimit() * 2
+        graph = {f'm{i}.py': [f'm{i + 1}.py'] for i in range(depth)}
+        graph[f'm{depth}.py'] = ['m0.py']
+
+        cycles = RepositoryManager._find_cycles(graph)
+
+        assert len(cycles) == 1 and len(cycles[0]) == depth + 1
+
+    def test_dependencies_report_cycles(self, manager, repo):
+        """Test that local imports are resolved to files for cycle detection"""
+        (repo / 'helpers.py').write_text('import pkg\n', encoding='utf-8')
+        (repo / 'pkg' / '__init__.py').write_text('import helpers\n', encoding='utf-8')
+
+        response = manager.analyze_dependencies(str(repo), ['__pycache__'])
+
+        assert response.success is True
+        assert response.data['circular_dependencies'] == [['helpers.py', 'pkg/__init__.py']]
+
+
+# ========== Report Generation Tests ==========
+
+class TestReportJobs:
+    """Test Excel reports generated in the background"""
+
+    def test_background_report(self, manager, repo, tmp_path):
+        """Test that a background report is polled until done"""
+        pytest.importorskip('openpyxl')
+        from mcp.helpers import repository_manager
+        analysis = manager.analyzer.analyze_repository(str(repo))
+        output = tmp_path / 'report.xlsx'
+
+        # Undecorated call: no interactive confirmation in tests
+        started = RepositoryManager.generate_excel_report.__wrapped__(
+            manager, analysis, str(output), background=True
+        )
+        job_id = started.data['job_id']
+        repository_manager._report_jobs[job_id].result(timeout=30)
+        status = manager.get_report_status(job_id)
+
+        assert started.success is True and started.data['status'] == 'running'
+        assert status.data['status'] == 'done'
+        assert status.data['output_path'] == str(output)
+        assert output.exists()
+        assert job_id not in repository_manager._report_jobs
+
+    def test_finished_jobs_are_bounded(self, manager, monkeypatch):
+        """Test that only the oldest finished jobs are pruned when full"""
+        from concurrent.futures import Future
+        from mcp.helpers import repository_manager
+        monkeypatch.setattr(repository_manager, '_REPORT_JOBS_SIZE', 2)
+        monkeypatch.setattr(repository_manager, '_report_jobs', repository_manager.OrderedDict())
+        jobs = repository_manager._report_jobs
+        running = Future()
+        jobs['running'] = running
+        for job_id in ('done1', 'done2'):
+            jobs[job_id] = Future()
+            jobs[job_id].set_result({'success': True})
+
+        with repository_manager._report_jobs_lock:
+            manager._prune_report_jobs()
+
+        assert list(jobs) == ['running', 'done2']
+        assert manager.get_report_status('running').data['status'] == 'running'
+        assert manager.get_report_status('done2').data['status'] == 'done'
+        assert list(jobs) == ['running']
+
+    def test_unknown_report_job(self, manager):
+        """Test that polling an unknown job is an error"""
+        response = manager.get_report_status('missing')
+
+        assert response.success is False
+        assert 'Unknown report job' in response.error
@@ -0,0 +1,367 @@
+"""
+Unit Tests for Script Manager
+
+Tests for ScriptManager script analysis, commenting and structure scanning.
+"""
+
+import pytest
+from pathlib import Path
+
+pytest.importorskip('requests')
+pytest.importorskip('colorama')
+
+from mcp.helpers import script_manager
+from mcp.helpers.script_manager import ScriptManager, _fmt_ann
+
+
+SAMPLE_SCRIPT = (
+    '"""Sample module."""\n'
+    'import os\n'
+    'from pathlib import Path\n'
+    '\n'
+    'def first(a: int, b: str) -> bool:\n'
+    '    """First function."""\n'
+    '    return bool(a)\n'
+    '\n'
+    'def second(path):\n'
+    '    return Path(path)\n'
+    '\n'
+    'class Widget:\n'
+    '    """A widget."""\n'
+    '    def render(self):\n'
+    '        return os.sep\n'
+)
+
+
+@pytest.fixture
+def manager():
+    """Create a ScriptManager"""
+    return ScriptManager()
+
+
+@pytest.fixture
+def script(tmp_path):
+    """Create a sample script"""
+    path = tmp_path / 'sample.py'
+    path.write_text(SAMPLE_SCRIPT, encoding='utf-8')
+    return path
+
+
+@pytest.fixture
+def ollama():
+    """Serve a minimal keep-alive /api/generate endpoint on localhost"""
+    import json
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    connections = []
+    received = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def setup(self):
+            super().setup()
+            connections.append(self.client_address)
+
+        def do_POST(self):
+            request = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+            received.append(request)
+            reply = f"Reply to {request['model']}"
+            if request['stream']:
+                # One JSON object per line, as /api/generate streams
+                first, _, rest = reply.partition(' ')
+                chunks = [{'response': first + ' ', 'done': False}, {'response': rest, 'done': True}]
+                body = b''.join(json.dumps(c).encode() + b'\n' for c in chunks)
+            else:
+                body = json.dumps({'response': reply, 'done': True}).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    server.connections = connections
+    server.received = received
+    server.host = f'http://127.0.0.1:{server.server_address[1]}'
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def tracked_reads(monkeypatch):
+    """Record the name of every file read through Path.read_text"""
+    read = []
+    original_read_text = Path.read_text
+
+    def tracking_read_text(self, *args, **kwargs):
+        read.append(self.name)
+        return original_read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, 'read_text', tracking_read_text)
+    return read
+
+
+# ========== Parse Cache Tests ==========
+
+class TestParseCache:
+    """Test that helpers share one parse per file version"""
+
+    def test_add_comments_parses_once(self, manager, script, tracked_reads, monkeypatch):
+        """Test that commenting N functions reads the file once"""
+        monkeypatch.setattr(manager, '_generate_function_comment',
+                            lambda func, context: f"Docs for {func['name']}.")
+
+        # Undecorated call: no interactive confirmation in tests
+        response = ScriptManager.add_comments.__wrapped__(manager, str(script), show_progress=False)
+
+        assert response.success is True
+        assert response.data['functions_commented'] == 3
+        assert tracked_reads == ['sample.py']
+        assert response.data['comments'][0]['function'] == 'first'
+
+    def test_edited_file_is_reparsed(self, manager, script):
+        """Test that the cache key follows the file's mtime and size"""
+        before = manager._analyze_functions(script)
+        script.write_text(SAMPLE_SCRIPT + '\ndef third():\n    pass\n', encoding='utf-8')
+        after = manager._analyze_functions(script)
+
+        sources = {f['name']: f['source'] for f in after}
+
+        assert len(before) == 3
+        assert sources['third'] == 'def third():\n    pass'
+
+
+# ========== Commenting Tests ==========
+
+class TestAddComments:
+    """Test docstring generation for a script's functions"""
+
+    def test_comments_are_generated_concurrently(self, manager, script, monkeypatch):
+        """Test that LLM calls overlap and results keep the source order"""
+        import threading
+        barrier = threading.Barrier(3, timeout=10)
+
+        def waiting_comment(func, context):
+            # Fails with BrokenBarrierError unless all three calls overlap
+            barrier.wait()
+            return f"Docs for {func['name']}."
+
+        monkeypatch.setattr(manager, '_generate_function_comment', waiting_comment)
+        monkeypatch.setattr(manager.settings.model, 'concurrency', 4)
+
+        response = ScriptManager.add_comments.__wrapped__(manager, str(script), show_progress=False)
+
+        assert response.success is True
+        assert [c['function'] for c in response.data['comments']] == ['first', 'second', 'render']
+        assert response.data['comments'][1]['comment'] == 'Docs for second.'
+
+    def test_llm_calls_share_one_connection(self, manager, ollama, monkeypatch):
+        """Test that sequential LLM calls reuse the keep-alive session"""
+        monkeypatch.setattr(manager.settings.model, 'host', ollama.host)
+        func = {'name': 'f', 'args': [], 'returns': '', 'source': 'def f(): pass',
+                'existing_docstring': ''}
+
+        replies = [manager._generate_function_comment(func, 'context') for _ in range(3)]
+
+        assert replies == [f'Reply to {manager.settings.model.name}'] * 3
+        assert len(ollama.connections) == 1
+
+    def test_documentation_is_streamed(self, manager, script, ollama, monkeypatch):
+        """Test that streamed documentation chunks are joined in order"""
+        monkeypatch.setattr(manager.settings.model, 'host', ollama.host)
+        analysis = manager._analyze_ast(script)
+
+        doc = manager._generate_documentation_content(script, SAMPLE_SCRIPT, analysis, {})
+
+        prompt = ollama.received[0]['prompt']
+        assert doc == f'Reply to {manager.settings.model.name}'
+        assert 'Functions:\n- first(a, b): First function.\n- second(path): \n- render(self): \n' in prompt
+        assert 'Classes:\n- Widget: A widget.\n' in prompt
+
+    def test_fallback_documentation(self, manager, script):
+        """Test the documentation written when no LLM is available"""
+        analysis = manager._analyze_ast(script)
+
+        doc = manager._generate_fallback_documentation(script, analysis, {'domain': 'demo'})
+
+        assert doc.startswith('# sample.py\n\n## Overview\n\nSample module.\n\n')
+        assert '## Metadata\n\n- **Domain**: demo\n\n' in doc
+        assert '### `first(a, b)`\n\nFirst function.\n\n**Line**: 5\n\n' in doc
+        assert '**Methods**: render\n\n' in doc
+        assert doc.endswith('- `os`\n- `pathlib.Path`\n\n---\n*Auto-generated documentation by Pulsus MCP*\n')
+
+
+# ========== Structure Tests ==========
+
+class TestStructure:
+    """Test the single-pass structure extraction"""
+
+    def test_nested_functions_are_not_reported(self, manager, tmp_path):
+        """Test that helpers nested in functions are skipped but their imports kept"""
+        path = tmp_path / 'nested.py'
+        path.write_text(
+            'import os\n'
+            'def outer():\n'
+            '    import json\n'
+            '    def inner():\n'
+            '        pass\n'
+            '    return inner\n'
+            'class Service:\n'
+            '    async def fetch(self):\n'
+            '        pass\n'
+            'if os.name == "nt":\n'
+            '    from ntpath import join\n',
+            encoding='utf-8'
+        )
+
+        analysis = manager._analyze_ast(path)
+
+        assert [f['name'] for f in analysis['functions']] == ['outer', 'fetch']
+        assert analysis['classes'][0]['methods'] == ['fetch']
+        assert analysis['imports'] == ['os', 'json', 'ntpath.join']
+
+    def test_metadata_is_read_without_executing(self, manager, tmp_path):
+        """Test that __domain__/__action__ come from the AST, not an import"""
+        marker = tmp_path / 'executed'
+        path = tmp_path / 'tool.py'
+        path.write_text(
+            '"""Tool docs."""\n'
+            f'open({str(marker)!r}, "w").close()\n'
+            '__domain__ = "analysis"\n'
+            '__action__ = "scan"\n'
+            'class Inner:\n'
+            '    __domain__ = "ignored"\n',
+            encoding='utf-8'
+        )
+
+        metadata = manager._load_module_metadata(path)
+
+        assert metadata == {'domain': 'analysis', 'action': 'scan', 'doc': 'Tool docs.'}
+        assert not marker.exists()
+
+    def test_scan_structure_walks_once(self, manager, tmp_path, monkeypatch):
+        """Test that the tree and dependency map come from a single walk"""
+        root = tmp_path / 'project'
+        for rel in ('b.py', 'a.py', 'pkg/mod.py', 'pkg/notes.txt', '.venv/lib/site.py'):
+            path = root / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text('import os\n', encoding='utf-8')
+
+        def fail_rglob(self, pattern):
+            raise AssertionError('second walk')
+
+        monkeypatch.setattr(Path, 'rglob', fail_rglob)
+        response = manager.scan_structure(str(root))
+
+        structure = response.data['structure']
+        assert response.success is True
+        assert [child['name'] for child in structure['children']] == ['a.py', 'b.py', 'pkg']
+        assert [child['name'] for child in structure['children'][2]['children']] == ['mod.py']
+        assert sorted(response.data['dependency_map']) == ['a.py', 'b.py', str(Path('pkg/mod.py'))]
+
+    def test_exclude_patterns_match_entry_names(self, manager, tmp_path):
+        """Test that exclusions match names, not substrings of the full path"""
+        root = tmp_path / 'venv' / 'project'
+        for rel in ('main.py', 'venv_tools/util.py', 'build/gen.py', 'test_main.py'):
+            path = root / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text('x = 1\n', encoding='utf-8')
+
+        response = manager.scan_structure(str(root), exclude_patterns=['venv', 'build', 'test_*'])
+
+        assert sorted(response.data['dependency_map']) == [
+            'main.py', str(Path('venv_tools/util.py'))
+        ]
+
+    def test_parallel_dependency_map_matches_sequential(self, manager, tmp_path, monkeypatch):
+        """Test that the process pool builds the same dependency map"""
+        root = tmp_path / 'project'
+        root.mkdir()
+        files = [root / f'mod{i}.py' for i in range(6)]
+        for i, path in enumerate(files):
+            path.write_text(f'import os\nfrom pkg{i} import name as alias\n', encoding='utf-8')
+        (root / 'broken.py').write_text('def broken(:\n', encoding='utf-8')
+        files.append(root / 'broken.py')
+
+        sequential = manager._build_dependency_map(files, root)
+        monkeypatch.setattr(script_manager, '_PARALLEL_DEPENDENCY_MIN_FILES', 1)
+        parallel = manager._build_dependency_map(files, root)
+
+        assert parallel == sequential
+        assert list(parallel) == [path.name for path in files]
+        assert 'broken.py' in parallel['broken.py']['error']
+        assert parallel['mod3.py']['imports'][1] == {
+            'type': 'from_import', 'module': 'pkg3', 'name': 'name', 'alias': 'alias'
+        }
+    def test_header_only_dependency_map(self, manager, tmp_path):
+        """Test that header-only mapping stops at the first top-level definition"""
+        root = tmp_path / 'project'
+        root.mkdir()
+        (root / 'mod.py').write_text(
+            '"""Module.\n\ndef not_code():\n"""\n'
+            'import os\n'
+            'try:\n'
+            '    from lxml import etree\n'
+            'except ImportError:\n'
+            '    etree = None\n'
+            'def load():\n'
+            '    import json\n'
+            'import late\n',
+            encoding='utf-8'
+        )
+        (root / 'plain.py').write_text('import sys\nx = 1\n', encoding='utf-8')
+        files = [str(root / 'mod.py'), str(root / 'plain.py')]
+
+        header = manager._build_dependency_map(files, root, header_only=True)
+        full = manager._build_dependency_map(files, root)
+
+        assert [i['module'] for i in header['mod.py']['imports']] == ['os', 'lxml']
+        assert [i['module'] for i in full['mod.py']['imports']] == ['os', 'lxml', 'json', 'late']
+        assert header['mod.py']['lines'] == full['mod.py']['lines'] == 12
+        assert header['plain.py'] == full['plain.py']
+
+    @pytest.mark.parametrize('annotation', [
+        'int', 'os.PathLike', 'Dict[str, List[int]]', "Literal['a', 1, None]",
+        'Callable[[int], str]', 'int | None', 'a | (b | c)', '(a | b)[x]',
+        "Literal['it\\'s']", 'tuple[()]', 'Callable[..., int]',
+    ])
+    def test_annotations_render_like_unparse(self, annotation):
+        """Test that the annotation renderer matches ast.unparse"""
+        import ast
+        node = ast.parse(annotation, mode='eval').body
+
+        assert _fmt_ann(node) == ast.unparse(node)
+
+
+# ========== Cache Tests ==========
+
+class TestCache:
+    """Test the cached read results"""
+
+    def test_edited_script_is_not_served_from_cache(self, manager, script):
+        """Test that read_script results are keyed on the file version"""
+        manager.read_script(str(script))
+        again = manager.read_script(str(script))
+        script.write_text(SAMPLE_SCRIPT + 'x = 1\n', encoding='utf-8')
+        edited = manager.read_script(str(script))
+
+        assert again.context['cached'] is True
+        assert edited.context['cached'] is False
+        assert edited.data['content'].endswith('x = 1\n')
+
+    def test_clear_cache(self, manager, script):
+        """Test that clear_cache drops cached reads"""
+        manager.read_script(str(script))
+
+        cleared = manager.clear_cache()
+
+        assert cleared.success is True
+        assert manager.read_script(str(script)).context['cached'] is False